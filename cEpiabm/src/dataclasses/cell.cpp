@@ -172,6 +172,17 @@ namespace epiabm
         return true;
     }
 
+    /**
+     * @brief Number of people in the cell's queue
+     *
+     * @return size_t
+     */
+    size_t Cell::queueSize()
+    {
+        std::lock_guard<std::mutex> l(m_queueMutex);
+        return m_personQueue.size();
+    }
+
     /**
      * @brief Reference to cell's people vector
      * 
@@ -451,6 +462,16 @@ namespace epiabm
         return m_compartmentCounter(status);
     }
 
+    /**
+     * @brief Get the cell's compartment counter
+     * 
+     * @return const CompartmentCounter& Reference to the cell's compartment counter
+     */
+    const CompartmentCounter& Cell::compartmentCounter() const
+    {
+        return m_compartmentCounter;
+    }
+
     /**
      * @brief Set the cell's location
      * 
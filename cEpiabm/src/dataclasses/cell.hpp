@@ -81,6 +81,7 @@ namespace epiabm
          */
         void processQueue(std::function<void(size_t)> callback);
         bool enqueuePerson(size_t personIndex);
+        size_t queueSize();
 
         std::vector<Person>& people();
         std::vector<Microcell>& microcells();
@@ -107,6 +108,7 @@ namespace epiabm
         void initialize();
 
         unsigned int compartmentCount(InfectionStatus status);
+        const CompartmentCounter& compartmentCounter() const;
         void setLocation(std::pair<double, double> loc);
         std::pair<double, double> location() const;
 
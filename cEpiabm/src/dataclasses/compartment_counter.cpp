@@ -14,7 +14,9 @@ namespace epiabm
      */
     CompartmentCounter::CompartmentCounter() :
         m_counts()
-    {}
+    {
+        clear();
+    }
 
     /**
      * @brief Destroy the Compartment Counter:: Compartment Counter object
@@ -29,7 +31,7 @@ namespace epiabm
      */
     void CompartmentCounter::clear()
     {
-        m_counts.clear();
+        m_counts.fill(0);
     }
 
     /**
@@ -40,8 +42,19 @@ namespace epiabm
      */
     unsigned int CompartmentCounter::operator()(InfectionStatus status) const
     {
-        if (m_counts.find(status) != m_counts.end()) return m_counts.at(status);
-        else return 0;
+        return m_counts[static_cast<size_t>(status)];
+    }
+
+    /**
+     * @brief Retrieve the counts of all compartments
+     * 
+     * Entries are indexed by the integer value of InfectionStatus
+     * 
+     * @return const std::array<unsigned int, N_INFECTION_STATES>& Reference to the counts
+     */
+    const std::array<unsigned int, N_INFECTION_STATES>& CompartmentCounter::counts() const
+    {
+        return m_counts;
     }
 
     /**
@@ -52,8 +65,8 @@ namespace epiabm
      */
     void CompartmentCounter::notify(InfectionStatus old_status, InfectionStatus new_status)
     {
-        m_counts[old_status]--;
-        m_counts[new_status]++;
+        m_counts[static_cast<size_t>(old_status)]--;
+        m_counts[static_cast<size_t>(new_status)]++;
     }
 
     /**
@@ -68,7 +81,7 @@ namespace epiabm
     {
         clear();
         for (const auto pi : people)
-            m_counts[cell->getPerson(pi).status()]++;
+            m_counts[static_cast<size_t>(cell->getPerson(pi).status())]++;
     }
 
     /**
@@ -80,7 +93,7 @@ namespace epiabm
     {
         clear();
         for (const auto& p : people)
-            m_counts[p.status()]++;
+            m_counts[static_cast<size_t>(p.status())]++;
     }
 
 }
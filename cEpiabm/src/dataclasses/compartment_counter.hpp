@@ -4,8 +4,7 @@
 #include "infection_status.hpp"
 #include "person.hpp"
 
-#include <map>
-#include <unordered_map>
+#include <array>
 #include <vector>
 
 namespace epiabm
@@ -20,7 +19,8 @@ namespace epiabm
     {
     private:
 
-        std::unordered_map<InfectionStatus, unsigned int> m_counts;
+        // Counts indexed by InfectionStatus, stored contiguously so they can be exposed as arrays
+        std::array<unsigned int, N_INFECTION_STATES> m_counts;
         
     public:
         CompartmentCounter();
@@ -30,6 +30,8 @@ namespace epiabm
 
         unsigned int operator()(InfectionStatus status) const;
 
+        const std::array<unsigned int, N_INFECTION_STATES>& counts() const;
+
         void notify(InfectionStatus oldStatus, InfectionStatus newStatus);
 
         void initialize(Cell* cell, const std::vector<size_t>& people);
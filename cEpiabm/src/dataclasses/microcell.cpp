@@ -123,6 +123,16 @@ namespace epiabm
         return m_compartmentCounter(status);
     }
 
+    /**
+     * @brief Get the microcell's compartment counter
+     * 
+     * @return const CompartmentCounter& Reference to the microcell's compartment counter
+     */
+    const CompartmentCounter& Microcell::compartmentCounter() const
+    {
+        return m_compartmentCounter;
+    }
+
     /**
      * @brief Change a person's status
      * 
@@ -49,6 +49,7 @@ namespace epiabm
         void initialize(Cell* cell);
 
         unsigned int compartmentCount(InfectionStatus status);
+        const CompartmentCounter& compartmentCounter() const;
 
         void personStatusChange(Person* person, InfectionStatus newStatus, unsigned short timestep);
 
@@ -38,9 +38,9 @@ namespace epiabm
     /**
      * @brief Get person's infection status
      * 
-     * @return InfectionStatus Person's infection status
+     * @return const InfectionStatus& Reference to person's infection status
      */
-    InfectionStatus Person::status() const { return m_status; }
+    const InfectionStatus& Person::status() const { return m_status; }
     /**
      * @brief Get person's parameters
      * 
@@ -56,7 +56,7 @@ namespace epiabm
         //Person(const Person&) = default;
         //Person(Person&&) = default;
 
-        InfectionStatus status() const;
+        const InfectionStatus& status() const;
         PersonParams& params();
 
         // Force set status (For configuring population) - Population has to be re-initialized if this is called
@@ -1,6 +1,8 @@
 
 #include "population_factory.hpp"
 
+#include <stdexcept>
+
 namespace epiabm
 {
 
@@ -34,6 +36,99 @@ namespace epiabm
         return population;
     }
 
+    PopulationPtr PopulationFactory::makePopulation(const PopulationArrays& arrays)
+    {
+        PopulationPtr population = makePopulation();
+        population->cells().reserve(arrays.n_cells);
+        addCells(population, arrays.n_cells);
+
+        size_t mcell_i = 0;
+        size_t person_i = 0;
+        size_t household_i = 0;
+        for (size_t c = 0; c < arrays.n_cells; c++)
+        {
+            Cell* cell = population->cells()[c].get();
+            cell->setLocation({arrays.cell_locations[2 * c], arrays.cell_locations[2 * c + 1]});
+
+            const size_t n_mcells = static_cast<size_t>(arrays.microcells_per_cell[c]);
+            if (mcell_i + n_mcells > arrays.n_microcells)
+                throw std::runtime_error("More microcells referenced than provided");
+            size_t n_cell_people = 0;
+            for (size_t m = mcell_i; m < mcell_i + n_mcells; m++)
+                n_cell_people += static_cast<size_t>(arrays.people_per_microcell[m]);
+            cell->people().reserve(n_cell_people);
+            cell->microcells().reserve(n_mcells);
+            addMicrocells(cell, n_mcells);
+
+            for (size_t m = 0; m < n_mcells; m++, mcell_i++)
+            {
+                Microcell& mcell = cell->getMicrocell(m);
+                const size_t n_people = static_cast<size_t>(arrays.people_per_microcell[mcell_i]);
+                const size_t n_households = static_cast<size_t>(arrays.households_per_microcell[mcell_i]);
+                if (person_i + n_people > arrays.n_people)
+                    throw std::runtime_error("More people referenced than provided");
+                if (household_i + n_households > arrays.n_households)
+                    throw std::runtime_error("More households referenced than provided");
+
+                mcell.people().reserve(n_people);
+                addPeople(cell, m, n_people);
+                mcell.households().reserve(n_households);
+                addHouseholds(&mcell, n_households);
+
+                for (size_t h = 0; h < n_households; h++, household_i++)
+                {
+                    HouseholdParams& params = mcell.getHousehold(h)->params();
+                    params.susceptibility = arrays.household_susceptibility[household_i];
+                    params.infectiousness = arrays.household_infectiousness[household_i];
+                    params.location = {arrays.household_locations[2 * household_i],
+                        arrays.household_locations[2 * household_i + 1]};
+                }
+
+                for (size_t p = 0; p < n_people; p++, person_i++)
+                {
+                    if (arrays.status[person_i] >= N_INFECTION_STATES ||
+                        arrays.next_status[person_i] >= N_INFECTION_STATES)
+                        throw std::runtime_error("Invalid infection status");
+                    Person& person = mcell.getPerson(*cell, p);
+                    person.setStatus(static_cast<InfectionStatus>(arrays.status[person_i]));
+
+                    PersonParams& params = person.params();
+                    params.age_group = arrays.age_group[person_i];
+                    params.susceptibility = arrays.susceptibility[person_i];
+                    params.infectiousness = arrays.infectiousness[person_i];
+                    params.initial_infectiousness = arrays.initial_infectiousness[person_i];
+                    params.next_status = static_cast<InfectionStatus>(arrays.next_status[person_i]);
+                    params.next_status_time = arrays.next_status_time[person_i];
+
+                    const int64_t hh = arrays.household[person_i];
+                    if (hh < 0) continue;
+                    if (static_cast<uint64_t>(hh) >= n_households)
+                        throw std::runtime_error("Household index out of range");
+                    person.setHousehold(static_cast<size_t>(hh));
+                    mcell.getHousehold(static_cast<size_t>(hh))->addMember(person.microcellPos());
+                }
+            }
+        }
+
+        population->places().reserve(arrays.n_places);
+        addPlaces(population, arrays.n_places);
+        for (size_t i = 0; i < arrays.n_memberships; i++)
+        {
+            const size_t place = static_cast<size_t>(arrays.membership_place[i]);
+            const size_t c = static_cast<size_t>(arrays.membership_cell[i]);
+            const size_t p = static_cast<size_t>(arrays.membership_person[i]);
+            if (place >= arrays.n_places || c >= arrays.n_cells ||
+                p >= population->cells()[c]->people().size())
+                throw std::runtime_error("Place membership out of range");
+            Cell* cell = population->cells()[c].get();
+            cell->getPerson(p).addPlace(*population, cell, place,
+                static_cast<size_t>(arrays.membership_group[i]));
+        }
+
+        population->initialize();
+        return population;
+    }
+
     void PopulationFactory::addCell(PopulationPtr population)
     {
         population->cells().push_back(
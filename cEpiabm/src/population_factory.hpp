@@ -7,9 +7,51 @@
 #include "dataclasses/place.hpp"
 #include "dataclasses/person.hpp"
 
+#include <cstdint>
+
 namespace epiabm
 {
 
+    /**
+     * @brief Non-owning views over a flattened population
+     * Describes a whole population as flat arrays so that it can be built in a single call.
+     * Microcells are ordered by cell, people and households are ordered by microcell, so the
+     * position of a person within its cell is the running count of people in that cell.
+     * All arrays must remain valid for the duration of PopulationFactory::makePopulation.
+     */
+    struct PopulationArrays
+    {
+        size_t n_cells = 0;
+        const double* cell_locations = nullptr; // n_cells x 2 row-major (x, y)
+        const uint64_t* microcells_per_cell = nullptr; // n_cells
+
+        size_t n_microcells = 0;
+        const uint64_t* people_per_microcell = nullptr; // n_microcells
+        const uint64_t* households_per_microcell = nullptr; // n_microcells
+
+        size_t n_people = 0;
+        const uint8_t* status = nullptr; // n_people, InfectionStatus values
+        const uint8_t* age_group = nullptr; // n_people
+        const float* susceptibility = nullptr; // n_people
+        const float* infectiousness = nullptr; // n_people
+        const float* initial_infectiousness = nullptr; // n_people
+        const uint8_t* next_status = nullptr; // n_people, InfectionStatus values
+        const uint16_t* next_status_time = nullptr; // n_people
+        const int64_t* household = nullptr; // n_people, household index within microcell or -1
+
+        size_t n_households = 0;
+        const double* household_susceptibility = nullptr; // n_households
+        const double* household_infectiousness = nullptr; // n_households
+        const double* household_locations = nullptr; // n_households x 2 row-major (x, y)
+
+        size_t n_places = 0;
+        size_t n_memberships = 0;
+        const uint64_t* membership_place = nullptr; // n_memberships, place index in population
+        const uint64_t* membership_cell = nullptr; // n_memberships, cell index of member
+        const uint64_t* membership_person = nullptr; // n_memberships, position of member in cell
+        const uint64_t* membership_group = nullptr; // n_memberships, group within place
+    };
+
     class PopulationFactory
     {
     private:
@@ -30,6 +72,17 @@ namespace epiabm
             size_t n_cells, // n cells in population
             size_t n_microcells, // n microcels per cell
             size_t n_people); // n people per microcell
+
+        /**
+         * @brief Create a Population from Flat Arrays
+         * 
+         * Build the full population structure, person parameters, households and place memberships in one call.
+         * The returned population is already initialized.
+         * 
+         * @param arrays Views over the flattened population
+         * @return PopulationPtr 
+         */
+        PopulationPtr makePopulation(const PopulationArrays& arrays);
     
         void addCell(PopulationPtr population);
         void addMicrocell(Cell* cell);
@@ -1,5 +1,6 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
+#include <pybind11/numpy.h>
 
 #include "dataclasses/infection_status.hpp"
 #include "dataclasses/compartment_counter.hpp"
@@ -9,10 +10,39 @@
 
 namespace py = pybind11;
 
+template <typename T>
+using c_array = py::array_t<T, py::array::c_style | py::array::forcecast>;
+
+template <typename T>
+const T* checked_data(const c_array<T>& array, size_t n, const char* name)
+{
+    if (static_cast<size_t>(array.size()) != n)
+        throw std::invalid_argument(std::string("Unexpected length for array ") + name);
+    return array.data();
+}
+
+/**
+ * @brief Strided NumPy view over one field of each person in a cell
+ * The view aliases the cell's people vector and keeps the cell alive, but is invalidated
+ * if people are added to the cell afterwards.
+ */
+template <typename T>
+py::array person_field_view(epiabm::CellPtr cell, const T* first, bool writable)
+{
+    py::array view(py::dtype::of<T>(),
+        {cell->people().size()}, {sizeof(epiabm::Person)},
+        first, py::cast(cell));
+    if (!writable) view.attr("flags").attr("writeable") = false;
+    return view;
+}
+
 void bind_dataclasses(py::module &m)
 {
     using namespace epiabm;
 
+    PYBIND11_NUMPY_DTYPE(PersonParams, age_group, susceptibility, infectiousness,
+        next_status_time, next_status, initial_infectiousness, infection_start_timestep);
+
     py::enum_<InfectionStatus>(m, "InfectionStatus")
         .value("Susceptible", InfectionStatus::Susceptible)
         .value("Exposed", InfectionStatus::Exposed)
@@ -85,7 +115,34 @@ void bind_dataclasses(py::module &m)
         .def("mark_exposed", &Cell::markExposed)
         .def("mark_recovered", &Cell::markRecovered)
         .def("mark_dead", &Cell::markDead)
-        .def("index", &Cell::index);
+        .def("index", &Cell::index)
+        .def("status_array",
+            [](CellPtr cell)
+            {
+                const InfectionStatus* first = cell->people().empty() ?
+                    nullptr : &cell->people()[0].status();
+                return person_field_view(cell, first, false);
+            },
+            "Read-only view of the infection status of each person in the cell")
+        .def("params_array",
+            [](CellPtr cell, bool writable)
+            {
+                const PersonParams* first = cell->people().empty() ?
+                    nullptr : &cell->people()[0].params();
+                return person_field_view(cell, first, writable);
+            },
+            "Structured view of the parameters of each person in the cell",
+            py::arg("writable") = false)
+        .def("compartment_array",
+            [](CellPtr cell)
+            {
+                const auto& counts = cell->compartmentCounter().counts();
+                py::array_t<unsigned int> view({counts.size()}, {sizeof(unsigned int)},
+                    counts.data(), py::cast(cell));
+                view.attr("flags").attr("writeable") = false;
+                return view;
+            },
+            "Read-only view of the cell's compartment counts, indexed by InfectionStatus");
 
     py::class_<Population, PopulationPtr>(m, "Population")
         .def("cells", &Population::cells,
@@ -96,7 +153,21 @@ void bind_dataclasses(py::module &m)
             { return population->places()[i]; })
         .def("get_cell", [](PopulationPtr population, size_t i)
             { return population->cells()[i]; })
-        .def("initialize", &Population::initialize);
+        .def("initialize", &Population::initialize)
+        .def("compartment_counts",
+            [](PopulationPtr population)
+            {
+                py::array_t<unsigned int> counts({population->cells().size(), N_INFECTION_STATES});
+                auto data = counts.mutable_unchecked<2>();
+                for (size_t i = 0; i < population->cells().size(); i++)
+                {
+                    const auto& cellCounts = population->cells()[i]->compartmentCounter().counts();
+                    for (size_t j = 0; j < N_INFECTION_STATES; j++)
+                        data(i, j) = cellCounts[j];
+                }
+                return counts;
+            },
+            "Compartment counts of every cell as an (n_cells, n_statuses) array");
 
     py::class_<HouseholdParams>(m, "HouseholdParams")
         .def_readwrite("susceptibility", &HouseholdParams::susceptibility)
@@ -151,7 +222,71 @@ void bind_dataclasses(py::module &m)
             [](PopulationFactory f, Microcell& mCell, size_t n)
             { f.addHouseholds(&mCell, n); })
         .def("add_place", &PopulationFactory::addPlace)
-        .def("add_places", &PopulationFactory::addPlaces);
+        .def("add_places", &PopulationFactory::addPlaces)
+        .def("make_population_from_arrays",
+            [](PopulationFactory& f,
+                c_array<double> cell_locations, c_array<uint64_t> microcells_per_cell,
+                c_array<uint64_t> people_per_microcell, c_array<uint64_t> households_per_microcell,
+                c_array<uint8_t> status, c_array<uint8_t> age_group,
+                c_array<float> susceptibility, c_array<float> infectiousness,
+                c_array<float> initial_infectiousness, c_array<uint8_t> next_status,
+                c_array<uint16_t> next_status_time, c_array<int64_t> household,
+                c_array<double> household_susceptibility, c_array<double> household_infectiousness,
+                c_array<double> household_locations, size_t n_places,
+                c_array<uint64_t> membership_place, c_array<uint64_t> membership_cell,
+                c_array<uint64_t> membership_person, c_array<uint64_t> membership_group)
+            {
+                PopulationArrays arrays;
+                arrays.n_cells = static_cast<size_t>(microcells_per_cell.size());
+                arrays.cell_locations = checked_data(cell_locations, 2 * arrays.n_cells, "cell_locations");
+                arrays.microcells_per_cell = microcells_per_cell.data();
+
+                arrays.n_microcells = static_cast<size_t>(people_per_microcell.size());
+                arrays.people_per_microcell = people_per_microcell.data();
+                arrays.households_per_microcell = checked_data(households_per_microcell,
+                    arrays.n_microcells, "households_per_microcell");
+
+                arrays.n_people = static_cast<size_t>(status.size());
+                arrays.status = status.data();
+                arrays.age_group = checked_data(age_group, arrays.n_people, "age_group");
+                arrays.susceptibility = checked_data(susceptibility, arrays.n_people, "susceptibility");
+                arrays.infectiousness = checked_data(infectiousness, arrays.n_people, "infectiousness");
+                arrays.initial_infectiousness = checked_data(initial_infectiousness,
+                    arrays.n_people, "initial_infectiousness");
+                arrays.next_status = checked_data(next_status, arrays.n_people, "next_status");
+                arrays.next_status_time = checked_data(next_status_time, arrays.n_people, "next_status_time");
+                arrays.household = checked_data(household, arrays.n_people, "household");
+
+                arrays.n_households = static_cast<size_t>(household_susceptibility.size());
+                arrays.household_susceptibility = household_susceptibility.data();
+                arrays.household_infectiousness = checked_data(household_infectiousness,
+                    arrays.n_households, "household_infectiousness");
+                arrays.household_locations = checked_data(household_locations,
+                    2 * arrays.n_households, "household_locations");
+
+                arrays.n_places = n_places;
+                arrays.n_memberships = static_cast<size_t>(membership_place.size());
+                arrays.membership_place = membership_place.data();
+                arrays.membership_cell = checked_data(membership_cell, arrays.n_memberships, "membership_cell");
+                arrays.membership_person = checked_data(membership_person,
+                    arrays.n_memberships, "membership_person");
+                arrays.membership_group = checked_data(membership_group, arrays.n_memberships, "membership_group");
+
+                py::gil_scoped_release release;
+                return f.makePopulation(arrays);
+            },
+            "Build a Population in one call from NumPy arrays",
+            py::arg("cell_locations"), py::arg("microcells_per_cell"),
+            py::arg("people_per_microcell"), py::arg("households_per_microcell"),
+            py::arg("status"), py::arg("age_group"),
+            py::arg("susceptibility"), py::arg("infectiousness"),
+            py::arg("initial_infectiousness"), py::arg("next_status"),
+            py::arg("next_status_time"), py::arg("household"),
+            py::arg("household_susceptibility"), py::arg("household_infectiousness"),
+            py::arg("household_locations"), py::arg("n_places"),
+            py::arg("membership_place"), py::arg("membership_cell"),
+            py::arg("membership_person"), py::arg("membership_group"),
+            py::return_value_policy::take_ownership);
 
     py::class_<ToyPopulationFactory>(m, "ToyPopulationFactory")
         .def(py::init<>())
@@ -8,6 +8,7 @@
 #include "reporters/new_cases_reporter.hpp"
 #include "reporters/age_stratified_new_cases_reporter.hpp"
 #include "reporters/age_stratified_population_reporter.hpp"
+#include "reporters/async_cell_compartment_reporter.hpp"
 
 
 namespace py = pybind11;
@@ -27,7 +28,8 @@ void bind_reporters(py::module &m)
     
     py::class_<PerCellCompartmentReporter, PerCellCompartmentReporterPtr>(m, "PerCellCompartmentReporter",
         py::base<TimestepReporterInterface>())
-        .def(py::init<const std::string>())
+        .def(py::init<const std::string, unsigned short>(),
+            py::arg("folder"), py::arg("keyframe_interval") = 0)
         .def("compartments", &PerCellCompartmentReporter::compartments,
             py::return_value_policy::reference);
 
@@ -47,6 +49,14 @@ void bind_reporters(py::module &m)
 
     py::class_<AgeStratifiedPopulationReporter, AgeStratifiedPopulationReporterPtr>(m, "AgeStratifiedPopulationReporter",
         py::base<TimestepReporterInterface>())
-        .def(py::init<const std::string>());
+        .def(py::init<const std::string, unsigned short>(),
+            py::arg("file"), py::arg("keyframe_interval") = 0);
+
+    py::class_<AsyncCellCompartmentReporter, AsyncCellCompartmentReporterPtr>(m, "AsyncCellCompartmentReporter",
+        py::base<TimestepReporterInterface>())
+        .def(py::init<const std::string, size_t>(),
+            py::arg("file"), py::arg("buffer_size") = 8)
+        .def("compartments", &AsyncCellCompartmentReporter::compartments,
+            py::return_value_policy::reference);
 }
 
@@ -1,7 +1,9 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
+#include <pybind11/functional.h>
 
 #include "simulations/basic_simulation.hpp"
+#include "simulations/simulation_instrumentation.hpp"
 #include "simulations/threaded_simulation.hpp"
 
 
@@ -11,16 +13,36 @@ void bind_simulation(py::module &m)
 {
     using namespace epiabm;
 
+    py::class_<SweepRecord>(m, "SweepRecord")
+        .def_readonly("sweep", &SweepRecord::sweep)
+        .def_readonly("seconds", &SweepRecord::seconds)
+        .def_readonly("infection_attempts", &SweepRecord::infectionAttempts)
+        .def_readonly("infections", &SweepRecord::infections)
+        .def_readonly("queue_length", &SweepRecord::queueLength);
+
+    py::class_<TimestepRecord>(m, "TimestepRecord")
+        .def_readonly("timestep", &TimestepRecord::timestep)
+        .def_readonly("sweeps", &TimestepRecord::sweeps)
+        .def_readonly("max_rss_kb", &TimestepRecord::maxRssKb);
+
+    py::class_<SimulationInstrumentation, SimulationInstrumentationPtr>(m, "SimulationInstrumentation")
+        .def(py::init<bool>(), py::arg("keep_records") = true)
+        .def(py::init<const std::string, bool>(), py::arg("file"), py::arg("keep_records") = true)
+        .def("set_callback", &SimulationInstrumentation::setCallback)
+        .def("records", &SimulationInstrumentation::records);
+
     py::class_<BasicSimulation, BasicSimulationPtr>(m, "BasicSimulation")
         .def(py::init<PopulationPtr>())
         .def("add_sweep", &BasicSimulation::addSweep)
         .def("add_timestep_reporter", &BasicSimulation::addTimestepReporter)
+        .def("set_instrumentation", &BasicSimulation::setInstrumentation)
         .def("simulate", &BasicSimulation::simulate);
 
     py::class_<ThreadedSimulation, ThreadedSimulationPtr>(m, "ThreadedSimulation")
         .def(py::init<PopulationPtr, std::optional<size_t>>())
         .def("add_sweep", &ThreadedSimulation::addSweep)
         .def("add_timestep_reporter", &ThreadedSimulation::addTimestepReporter)
+        .def("set_instrumentation", &ThreadedSimulation::setInstrumentation)
         .def("simulate", &ThreadedSimulation::simulate);
 }
 
@@ -19,7 +19,9 @@ void bind_sweeps(py::module &m)
 
     py::class_<SweepInterface, SweepInterfacePtr>(m, "SweepInterface")
         .def("bind_population", &SweepInterface::bind_population)
-        .def("__call__", &SweepInterface::operator());
+        .def("__call__", &SweepInterface::operator())
+        .def("infection_attempts", &SweepInterface::infectionAttempts)
+        .def("infections", &SweepInterface::infections);
 
     py::class_<HouseholdSweep, HouseholdSweepPtr>(m, "HouseholdSweep",
         py::base<SweepInterface>())
@@ -10,8 +10,9 @@ namespace epiabm
      * @brief Construct a new Population Compartment Reporter object
      * If the file already exists, it will be overwritten
      * @param file File to write to
+     * @param keyframeInterval Interval between timesteps at which all age groups are written. 0 writes all age groups every timestep
      */
-    AgeStratifiedPopulationReporter::AgeStratifiedPopulationReporter(const std::string file) :
+    AgeStratifiedPopulationReporter::AgeStratifiedPopulationReporter(const std::string file, unsigned short keyframeInterval) :
         TimestepReporterInterface(std::filesystem::path(file).parent_path(), false),
         m_compartments(
             {
@@ -25,7 +26,9 @@ namespace epiabm
             InfectionStatus::InfectICURecov,
             InfectionStatus::Dead,
             InfectionStatus::Recovered
-            })
+            }),
+        m_keyframeInterval(keyframeInterval),
+        m_lastCounts()
     {
         m_os = m_folder.OpenOutputFile(std::filesystem::path(file).filename());
     }
@@ -44,6 +47,7 @@ namespace epiabm
      */
     void AgeStratifiedPopulationReporter::setup(PopulationPtr /*population*/)
     {
+        m_lastCounts.clear();
         *m_os << "timestep,age_group";
         for (const InfectionStatus status : m_compartments)
         {
@@ -78,13 +82,29 @@ namespace epiabm
                     return true;
                 });
 
-            for (const auto& age : statusCount)
+            for (auto& age : statusCount)
             {
+                std::vector<unsigned int> counts;
+                counts.reserve(m_compartments.size());
+                for (const auto& c : m_compartments)
+                {
+                    counts.push_back(age.second[c]);
+                }
+                if (m_keyframeInterval > 0)
+                {
+                    auto it = m_lastCounts.find(age.first);
+                    if (timestep % m_keyframeInterval != 0 &&
+                        it != m_lastCounts.end() && it->second == counts)
+                    {
+                        continue;
+                    }
+                    m_lastCounts[age.first] = counts;
+                }
                 *m_os << timestep << ","
                     << static_cast<unsigned int>(age.first);
-                for (const auto& c : m_compartments)
+                for (const unsigned int count : counts)
                 {
-                    *m_os << "," << statusCount[age.first][c];
+                    *m_os << "," << count;
                 }
                 *m_os << std::endl;
             }
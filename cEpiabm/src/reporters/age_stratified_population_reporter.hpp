@@ -3,21 +3,29 @@
 
 #include "timestep_reporter_interface.hpp"
 
+#include <map>
+#include <vector>
+
 namespace epiabm
 {
 
     /**
      * @brief Report total compartment counts each iteration for the entire population
      * Outputs a single file which contains the compartment counts over time
+     * If a keyframe interval is given, an age group's row is only written when its
+     * counts changed since its last written row, or on timesteps which are a multiple
+     * of the interval
      */
     class AgeStratifiedPopulationReporter : public TimestepReporterInterface
     {
     private:
         std::set<InfectionStatus> m_compartments;
         ofstreamPtr m_os;
+        unsigned short m_keyframeInterval;
+        std::map<unsigned char, std::vector<unsigned int>> m_lastCounts;
 
     public:
-        AgeStratifiedPopulationReporter(const std::string file);
+        AgeStratifiedPopulationReporter(const std::string file, unsigned short keyframeInterval = 0);
         ~AgeStratifiedPopulationReporter();
 
         void setup(const PopulationPtr population) override;
@@ -0,0 +1,195 @@
+
+#include "async_cell_compartment_reporter.hpp"
+#include "../logfile.hpp"
+
+#include <algorithm>
+
+
+namespace epiabm
+{
+
+    /**
+     * @brief Construct a new Async Cell Compartment Reporter object
+     * If the file already exists, it will be overwritten
+     * @param file File to write to
+     * @param bufferSize Number of timesteps which can be buffered before report blocks
+     */
+    AsyncCellCompartmentReporter::AsyncCellCompartmentReporter(const std::string file, size_t bufferSize) :
+        TimestepReporterInterface(std::filesystem::path(file).parent_path(), false),
+        m_compartments(
+            {
+            InfectionStatus::Susceptible,
+            InfectionStatus::Exposed,
+            InfectionStatus::InfectASympt,
+            InfectionStatus::InfectMild,
+            InfectionStatus::InfectGP,
+            InfectionStatus::InfectHosp,
+            InfectionStatus::InfectICU,
+            InfectionStatus::InfectICURecov,
+            InfectionStatus::Dead,
+            InfectionStatus::Recovered
+            }),
+        m_buffer(std::max(bufferSize, static_cast<size_t>(1))),
+        m_head(0),
+        m_pending(0),
+        m_nCells(0),
+        m_stop(false)
+    {
+        m_os = m_folder.OpenOutputFile(std::filesystem::path(file).filename());
+    }
+
+    /**
+     * @brief Destroy the Async Cell Compartment Reporter object
+     * Waits for all buffered timesteps to be written
+     */
+    AsyncCellCompartmentReporter::~AsyncCellCompartmentReporter()
+    {
+        teardown();
+    }
+
+    /**
+     * @brief Setup method which is called immediately before iterations begin
+     * Writes the header and starts the writer thread
+     * @param pop Initialized population before the iterations start
+     */
+    void AsyncCellCompartmentReporter::setup(const PopulationPtr population)
+    {
+        teardown(); // Stop writer thread if already running
+        m_nCells = population->cells().size();
+        for (auto& snapshot : m_buffer)
+            snapshot.counts.assign(m_nCells * N_INFECTION_STATES, 0);
+        m_head = 0;
+        m_pending = 0;
+        m_stop = false;
+
+        *m_os << "timestep,cell";
+        for (const InfectionStatus status : m_compartments)
+        {
+            *m_os << "," << status_string(status);
+        }
+        *m_os << "\n";
+
+        m_writer = std::thread(&AsyncCellCompartmentReporter::writeLoop, this);
+    }
+
+    /**
+     * @brief Report the population state at a timestep
+     * Copies the compartment counters into the ring buffer, to be written by the writer thread
+     * @param pop Population to report
+     * @param timestep Timestep of report
+     */
+    void AsyncCellCompartmentReporter::report(
+        const PopulationPtr population,
+        const unsigned short timestep)
+    {
+        if (!m_writer.joinable() || population->cells().size() != m_nCells)
+        {
+            LOG << LOG_LEVEL_ERROR << "Async Cell Compartment Reporter must be setup with this population before reporting";
+            throw std::runtime_error("AsyncCellCompartmentReporter not setup for this population");
+        }
+
+        size_t slot;
+        {
+            std::unique_lock<std::mutex> l(m_mutex);
+            m_cv.wait(l, [this]() { return m_pending < m_buffer.size(); });
+            slot = m_head;
+        }
+
+        // The writer thread never reads the head slot, so it can be filled without holding the lock
+        Snapshot& snapshot = m_buffer[slot];
+        snapshot.timestep = timestep;
+        for (size_t i = 0; i < m_nCells; i++)
+        {
+            const auto& counts = population->cells()[i]->compartmentCounter().counts();
+            std::copy(counts.begin(), counts.end(),
+                snapshot.counts.begin() + static_cast<std::ptrdiff_t>(i * N_INFECTION_STATES));
+        }
+
+        {
+            std::lock_guard<std::mutex> l(m_mutex);
+            m_head = (m_head + 1) % m_buffer.size();
+            m_pending++;
+        }
+        m_cv.notify_all();
+    }
+
+    /**
+     * @brief Clean up method
+     * Waits for the writer thread to write all buffered timesteps, then flushes the output file
+     */
+    void AsyncCellCompartmentReporter::teardown()
+    {
+        if (!m_writer.joinable()) return;
+        {
+            std::lock_guard<std::mutex> l(m_mutex);
+            m_stop = true;
+        }
+        m_cv.notify_all();
+        m_writer.join();
+        m_os->flush();
+    }
+
+    /**
+     * @brief Getter for set which contains the compartment types to return
+     * This set can be configured before setup to specify which compartments to output
+     * @return std::set<InfectionStatus>&
+     */
+    std::set<InfectionStatus>& AsyncCellCompartmentReporter::compartments()
+    {
+        return m_compartments;
+    }
+
+    /**
+     * @brief Writer thread loop
+     * Writes buffered snapshots in order until stopped and the buffer is empty
+     */
+    void AsyncCellCompartmentReporter::writeLoop()
+    {
+        while (true)
+        {
+            size_t slot;
+            {
+                std::unique_lock<std::mutex> l(m_mutex);
+                m_cv.wait(l, [this]() { return m_pending > 0 || m_stop; });
+                if (m_pending == 0) return;
+                slot = (m_head + m_buffer.size() - m_pending) % m_buffer.size();
+            }
+
+            try
+            {
+                writeSnapshot(m_buffer[slot]);
+            }
+            // LCOV_EXCL_START
+            catch (std::exception& e)
+            {
+                LOG << LOG_LEVEL_ERROR << "Async Cell Compartment Reporter Error writing to file: " << e.what();
+            }
+            // LCOV_EXCL_STOP
+
+            {
+                std::lock_guard<std::mutex> l(m_mutex);
+                m_pending--;
+            }
+            m_cv.notify_all();
+        }
+    }
+
+    /**
+     * @brief Write one snapshot to the output file
+     * 
+     * @param snapshot Snapshot to write
+     */
+    void AsyncCellCompartmentReporter::writeSnapshot(const Snapshot& snapshot)
+    {
+        for (size_t i = 0; i < m_nCells; i++)
+        {
+            *m_os << snapshot.timestep << "," << i;
+            for (const InfectionStatus status : m_compartments)
+            {
+                *m_os << "," << snapshot.counts[i * N_INFECTION_STATES + static_cast<size_t>(status)];
+            }
+            *m_os << "\n";
+        }
+    }
+
+} // namespace epiabm
@@ -0,0 +1,63 @@
+#ifndef EPIABM_REPORTERS_ASYNC_CELL_COMPARTMENT_REPORTER_HPP
+#define EPIABM_REPORTERS_ASYNC_CELL_COMPARTMENT_REPORTER_HPP
+
+#include "timestep_reporter_interface.hpp"
+
+#include <condition_variable>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+namespace epiabm
+{
+
+    /**
+     * @brief Report compartment counts of each cell each iteration on a background thread
+     * Snapshots each cell's compartment counters into a ring buffer, which a writer thread drains into a
+     * single long-format file with one row per cell per timestep.
+     * Writing overlaps with the following timesteps, report only blocks if the buffer is full.
+     */
+    class AsyncCellCompartmentReporter : public TimestepReporterInterface
+    {
+    private:
+        struct Snapshot
+        {
+            unsigned short timestep = 0;
+            std::vector<unsigned int> counts; // n_cells x N_INFECTION_STATES row-major
+        };
+
+        std::set<InfectionStatus> m_compartments;
+        ofstreamPtr m_os;
+
+        std::vector<Snapshot> m_buffer; // Ring buffer of snapshots
+        size_t m_head; // Next slot to be filled by report
+        size_t m_pending; // Number of filled slots waiting to be written
+        size_t m_nCells;
+        bool m_stop;
+
+        std::mutex m_mutex;
+        std::condition_variable m_cv;
+        std::thread m_writer;
+
+    public:
+        AsyncCellCompartmentReporter(const std::string file, size_t bufferSize = 8);
+        ~AsyncCellCompartmentReporter();
+
+        void setup(const PopulationPtr population) override;
+
+        void report(const PopulationPtr population, const unsigned short timestep) override;
+
+        void teardown() override;
+
+        std::set<InfectionStatus> &compartments();
+
+    private:
+        void writeLoop();
+        void writeSnapshot(const Snapshot& snapshot);
+    };
+
+    typedef std::shared_ptr<AsyncCellCompartmentReporter> AsyncCellCompartmentReporterPtr;
+
+} // namespace epiabm
+
+#endif // EPIABM_REPORTERS_ASYNC_CELL_COMPARTMENT_REPORTER_HPP
@@ -10,8 +10,9 @@ namespace epiabm
      * @brief Construct a new Per Cell Compartment Reporter object
      * 
      * @param folder Folder to output to
+     * @param keyframeInterval Interval between timesteps at which all cells are written. 0 writes all cells every timestep
      */
-    PerCellCompartmentReporter::PerCellCompartmentReporter(const std::string folder) :
+    PerCellCompartmentReporter::PerCellCompartmentReporter(const std::string folder, unsigned short keyframeInterval) :
         TimestepReporterInterface(folder, true),
         m_compartments(
             {
@@ -26,7 +27,9 @@ namespace epiabm
             InfectionStatus::Dead,
             InfectionStatus::Recovered
             }),
-        m_cellFileMap()
+        m_cellFileMap(),
+        m_keyframeInterval(keyframeInterval),
+        m_lastCounts()
     {}
 
     /**
@@ -73,12 +76,28 @@ namespace epiabm
             population->forEachCell(
                 [this, timestep](Cell* cell)
                 {
-                    *m_cellFileMap[cell->index()] << timestep;
+                    std::vector<unsigned int> counts;
+                    counts.reserve(m_compartments.size());
                     for (const InfectionStatus status : m_compartments)
                     {
-                        *m_cellFileMap[cell->index()] << "," << cell->compartmentCount(status);
+                        counts.push_back(cell->compartmentCount(status));
+                    }
+                    if (m_keyframeInterval > 0)
+                    {
+                        auto it = m_lastCounts.find(cell->index());
+                        if (timestep % m_keyframeInterval != 0 &&
+                            it != m_lastCounts.end() && it->second == counts)
+                        {
+                            return true;
+                        }
+                        m_lastCounts[cell->index()] = counts;
+                    }
+                    *m_cellFileMap[cell->index()] << timestep;
+                    for (const unsigned int count : counts)
+                    {
+                        *m_cellFileMap[cell->index()] << "," << count;
                     }
-                    *m_cellFileMap[cell->index()] << std::endl;
+                    *m_cellFileMap[cell->index()] << "\n";
                     return true;
                 });
         }
@@ -102,6 +121,7 @@ namespace epiabm
             p.second->close();
         }
         m_cellFileMap.clear();
+        m_lastCounts.clear();
     }
 
     /**
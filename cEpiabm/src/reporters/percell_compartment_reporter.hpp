@@ -4,6 +4,7 @@
 #include "timestep_reporter_interface.hpp"
 
 #include <map>
+#include <vector>
 
 namespace epiabm
 {
@@ -11,15 +12,20 @@ namespace epiabm
     /**
      * @brief Report Compartment Counts each Iteration for Each Cell
      * Outputs to a folder with one file per cell with compartment counts over time
+     * If a keyframe interval is given, a cell's row is only written when its counts
+     * changed since its last written row, or on timesteps which are a multiple of the
+     * interval
      */
     class PerCellCompartmentReporter : public TimestepReporterInterface
     {
     private:
         std::set<InfectionStatus> m_compartments;
         std::map<size_t, ofstreamPtr> m_cellFileMap;
+        unsigned short m_keyframeInterval;
+        std::map<size_t, std::vector<unsigned int>> m_lastCounts;
 
     public:
-        PerCellCompartmentReporter(const std::string folder);
+        PerCellCompartmentReporter(const std::string folder, unsigned short keyframeInterval = 0);
         ~PerCellCompartmentReporter();
 
         void setup(const PopulationPtr pop) override;
@@ -16,7 +16,8 @@ namespace epiabm
     BasicSimulation::BasicSimulation(PopulationPtr population) :
         m_population(population),
         m_sweeps(),
-        m_timestepReporters()
+        m_timestepReporters(),
+        m_instrumentation()
     {
     }
 
@@ -46,6 +47,15 @@ namespace epiabm
         m_timestepReporters.push_back(timestepReporter);
     }
 
+    /**
+     * @brief Record timings and counters of the sweeps each timestep
+     * @param instrumentation Instrumentation to record with, or nullptr to stop recording
+     */
+    void BasicSimulation::setInstrumentation(SimulationInstrumentationPtr instrumentation)
+    {
+        m_instrumentation = instrumentation;
+    }
+
     /**
      * @brief Perform Simulation
      * Run the configured simulation
@@ -67,7 +77,21 @@ namespace epiabm
             for (unsigned short timestep = 1; timestep <= timesteps; timestep++)
             {
                 // Run Sweeps
-                for (const auto& sweep : m_sweeps) (*sweep)(timestep);
+                if (m_instrumentation)
+                {
+                    m_instrumentation->beginTimestep(timestep);
+                    for (size_t i = 0; i < m_sweeps.size(); i++)
+                    {
+                        const SweepInterfacePtr& sweep = m_sweeps[i];
+                        m_instrumentation->runSweeps(i, {sweep}, m_population,
+                            [&sweep, timestep]() { (*sweep)(timestep); });
+                    }
+                    m_instrumentation->endTimestep();
+                }
+                else
+                {
+                    for (const auto& sweep : m_sweeps) (*sweep)(timestep);
+                }
 
                 // Report
                 for (const auto& reporter : m_timestepReporters)
@@ -4,6 +4,7 @@
 
 #include "../sweeps/sweep_interface.hpp"
 #include "../reporters/timestep_reporter_interface.hpp"
+#include "simulation_instrumentation.hpp"
 
 #include "../dataclasses/population.hpp"
 
@@ -24,6 +25,7 @@ namespace epiabm
         PopulationPtr m_population;
         std::vector<SweepInterfacePtr> m_sweeps;
         std::vector<TimestepReporterInterfacePtr> m_timestepReporters;
+        SimulationInstrumentationPtr m_instrumentation;
         
 
     public:
@@ -34,6 +36,8 @@ namespace epiabm
 
         void addTimestepReporter(TimestepReporterInterfacePtr reporter);
 
+        void setInstrumentation(SimulationInstrumentationPtr instrumentation);
+
         void simulate(unsigned short timesteps);
 
     private:
@@ -0,0 +1,161 @@
+#include "simulation_instrumentation.hpp"
+
+#include <chrono>
+#include <filesystem>
+
+#if defined(__unix__) || defined(__APPLE__)
+#include <sys/resource.h>
+#endif
+
+namespace epiabm
+{
+
+    /**
+     * @brief Construct a new Simulation Instrumentation object which does not write to file
+     * @param keepRecords Whether to keep all records in memory
+     */
+    SimulationInstrumentation::SimulationInstrumentation(bool keepRecords) :
+        m_records(),
+        m_callback(),
+        m_os(),
+        m_keepRecords(keepRecords),
+        m_current()
+    {
+    }
+
+    /**
+     * @brief Construct a new Simulation Instrumentation object which writes records to a csv file
+     * If the file already exists, it will be overwritten
+     * @param file File to write to
+     * @param keepRecords Whether to keep all records in memory
+     */
+    SimulationInstrumentation::SimulationInstrumentation(const std::string file, bool keepRecords) :
+        SimulationInstrumentation(keepRecords)
+    {
+        OutputFolderHandler folder(std::filesystem::path(file).parent_path(), false);
+        m_os = folder.OpenOutputFile(std::filesystem::path(file).filename().string());
+        *m_os << "timestep,sweep,seconds,infection_attempts,infections,queue_length,max_rss_kb" << std::endl;
+    }
+
+    /**
+     * @brief Set function called with each timestep's record
+     * @param callback Callback
+     */
+    void SimulationInstrumentation::setCallback(std::function<void(const TimestepRecord&)> callback)
+    {
+        m_callback = callback;
+    }
+
+    /**
+     * @brief Start the record of a timestep
+     * @param timestep Current timestep
+     */
+    void SimulationInstrumentation::beginTimestep(unsigned short timestep)
+    {
+        m_current = TimestepRecord();
+        m_current.timestep = timestep;
+    }
+
+    /**
+     * @brief Run and record a sweep or group of sweeps
+     * @param index Index of the sweep or sweep group
+     * @param sweeps Sweeps whose infection counters are recorded
+     * @param population Population the sweeps act on
+     * @param run Function running the sweeps
+     */
+    void SimulationInstrumentation::runSweeps(size_t index,
+        const std::vector<SweepInterfacePtr>& sweeps,
+        const PopulationPtr population, std::function<void()> run)
+    {
+        unsigned long long attempts = 0, infections = 0;
+        for (const auto& sweep : sweeps)
+        {
+            attempts += sweep->infectionAttempts();
+            infections += sweep->infections();
+        }
+
+        auto t0 = std::chrono::steady_clock::now();
+        run();
+        double seconds = std::chrono::duration<double>(
+            std::chrono::steady_clock::now() - t0).count();
+
+        SweepRecord record = SweepRecord();
+        record.sweep = index;
+        record.seconds = seconds;
+        for (const auto& sweep : sweeps)
+        {
+            record.infectionAttempts += sweep->infectionAttempts();
+            record.infections += sweep->infections();
+        }
+        record.infectionAttempts -= attempts;
+        record.infections -= infections;
+        record.queueLength = queueLength(population);
+        m_current.sweeps.push_back(record);
+    }
+
+    /**
+     * @brief Finish the record of a timestep
+     * Stores the record, passes it to the callback and writes it to file
+     */
+    void SimulationInstrumentation::endTimestep()
+    {
+        m_current.maxRssKb = maxRssKb();
+        if (m_os)
+        {
+            for (const SweepRecord& record : m_current.sweeps)
+            {
+                *m_os << m_current.timestep << "," << record.sweep << "," << record.seconds
+                    << "," << record.infectionAttempts << "," << record.infections
+                    << "," << record.queueLength << "," << m_current.maxRssKb << std::endl;
+            }
+        }
+        if (m_callback) m_callback(m_current);
+        if (m_keepRecords) m_records.push_back(m_current);
+    }
+
+    /**
+     * @brief Records kept so far
+     * @return const std::vector<TimestepRecord>&
+     */
+    const std::vector<TimestepRecord>& SimulationInstrumentation::records() const
+    {
+        return m_records;
+    }
+
+    /**
+     * @brief Peak resident memory of the process so far
+     * @return long Memory high-water mark in kilobytes, or -1 if unavailable
+     */
+    long SimulationInstrumentation::maxRssKb()
+    {
+#if defined(__unix__) || defined(__APPLE__)
+        struct rusage usage;
+        if (getrusage(RUSAGE_SELF, &usage) != 0) return -1; // LCOV_EXCL_LINE
+#if defined(__APPLE__)
+        return usage.ru_maxrss / 1024; // Reported in bytes on macOS
+#else
+        return usage.ru_maxrss;
+#endif
+#else
+        return -1;
+#endif
+    }
+
+    /**
+     * @brief Number of people queued in a population
+     * @param population Population to count queued people in
+     * @return size_t
+     */
+    size_t SimulationInstrumentation::queueLength(const PopulationPtr population)
+    {
+        size_t length = 0;
+        population->forEachCell(
+            [&length](Cell* cell)
+            {
+                length += cell->queueSize();
+                return true;
+            });
+        return length;
+    }
+
+} // namespace epiabm
@@ -0,0 +1,76 @@
+#ifndef EPIABM_SIMULATIONS_SIMULATION_INSTRUMENTATION_HPP
+#define EPIABM_SIMULATIONS_SIMULATION_INSTRUMENTATION_HPP
+
+#include "../sweeps/sweep_interface.hpp"
+#include "../output_folder_handler.hpp"
+#include "../dataclasses/population.hpp"
+
+#include <functional>
+#include <memory>
+#include <string>
+#include <vector>
+
+
+namespace epiabm
+{
+    /**
+     * @brief Timings and counters of a sweep (or group of sweeps) in one timestep
+     */
+    struct SweepRecord
+    {
+        size_t sweep;
+        double seconds;
+        unsigned long long infectionAttempts;
+        unsigned long long infections;
+        size_t queueLength;
+    };
+
+    /**
+     * @brief Record of the sweeps run in one timestep
+     */
+    struct TimestepRecord
+    {
+        unsigned short timestep;
+        std::vector<SweepRecord> sweeps;
+        long maxRssKb;
+    };
+
+    /**
+     * @brief Record where time goes in a simulation
+     * Each timestep gives a record with the wall time, infection attempts and infections of each
+     * sweep, the number of people queued after each sweep and the memory high-water mark of the process.
+     * Records are kept, passed to an optional callback, and optionally written to a csv file with one
+     * row per sweep per timestep.
+     */
+    class SimulationInstrumentation
+    {
+    private:
+        std::vector<TimestepRecord> m_records;
+        std::function<void(const TimestepRecord&)> m_callback;
+        ofstreamPtr m_os;
+        bool m_keepRecords;
+        TimestepRecord m_current;
+
+    public:
+        SimulationInstrumentation(bool keepRecords = true);
+        SimulationInstrumentation(const std::string file, bool keepRecords = true);
+        ~SimulationInstrumentation() = default;
+
+        void setCallback(std::function<void(const TimestepRecord&)> callback);
+
+        void beginTimestep(unsigned short timestep);
+        void runSweeps(size_t index, const std::vector<SweepInterfacePtr>& sweeps,
+            const PopulationPtr population, std::function<void()> run);
+        void endTimestep();
+
+        const std::vector<TimestepRecord>& records() const;
+
+        static long maxRssKb();
+        static size_t queueLength(const PopulationPtr population);
+    };
+
+    typedef std::shared_ptr<SimulationInstrumentation> SimulationInstrumentationPtr;
+
+} // namespace epiabm
+
+#endif // EPIABM_SIMULATIONS_SIMULATION_INSTRUMENTATION_HPP
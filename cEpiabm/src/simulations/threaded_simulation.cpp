@@ -18,6 +18,7 @@ namespace epiabm
         m_population(population),
         m_sweeps(),
         m_timestepReporters(),
+        m_instrumentation(),
         m_pool(nThreads.value_or(std::thread::hardware_concurrency()))
     {
     }
@@ -51,6 +52,15 @@ namespace epiabm
         m_timestepReporters.push_back(timestepReporter);
     }
 
+    /**
+     * @brief Record timings and counters of the sweeps each timestep
+     * @param instrumentation Instrumentation to record with, or nullptr to stop recording
+     */
+    void ThreadedSimulation::setInstrumentation(SimulationInstrumentationPtr instrumentation)
+    {
+        m_instrumentation = instrumentation;
+    }
+
     /**
      * @brief Perform Simulation
      * Run the configured simulation
@@ -71,24 +81,21 @@ namespace epiabm
             for (unsigned short timestep = 1; timestep <= timesteps; timestep++)
             {
                 // Run Sweeps
+                if (m_instrumentation) m_instrumentation->beginTimestep(timestep);
                 for (const auto& sweepGroup : m_sweeps)
                 {
                     LOG << LOG_LEVEL_DEBUG << "Performing Sweep Group " << sweepGroup.first << " at timestep " << timestep;
-                    m_population->forEachCell(
-                        [this,timestep,&sweepGroup](Cell* cell)
-                        {
-                            m_pool.push_task(
-                            [cell,timestep,&sweepGroup]()
-                            {
-                                for (const auto& sweep : sweepGroup.second)
-                                    sweep->cellCallback(timestep, cell);
-                                }
-                            );
-                            return true;
-                        });
-                    LOG << LOG_LEVEL_DEBUG << m_pool.get_tasks_total() << " unfinished tasks";
-                    m_pool.wait_for_tasks();
+                    if (m_instrumentation)
+                    {
+                        m_instrumentation->runSweeps(sweepGroup.first, sweepGroup.second, m_population,
+                            [this, timestep, &sweepGroup]() { runSweepGroup(timestep, sweepGroup.second); });
+                    }
+                    else
+                    {
+                        runSweepGroup(timestep, sweepGroup.second);
+                    }
                 }
+                if (m_instrumentation) m_instrumentation->endTimestep();
 
                 // Report
                 for (const auto& reporter : m_timestepReporters)
@@ -113,6 +120,30 @@ namespace epiabm
             << seconds / 60 << "m " << seconds % 60 << "s";
     }
 
+    /**
+     * @brief Run a group of sweeps on each cell across threads
+     * @param timestep Current timestep
+     * @param sweeps Sweep group to run
+     */
+    void ThreadedSimulation::runSweepGroup(const unsigned short timestep,
+        const std::vector<SweepInterfacePtr>& sweeps)
+    {
+        m_population->forEachCell(
+            [this,timestep,&sweeps](Cell* cell)
+            {
+                m_pool.push_task(
+                [cell,timestep,&sweeps]()
+                {
+                    for (const auto& sweep : sweeps)
+                        sweep->cellCallback(timestep, cell);
+                    }
+                );
+                return true;
+            });
+        LOG << LOG_LEVEL_DEBUG << m_pool.get_tasks_total() << " unfinished tasks";
+        m_pool.wait_for_tasks();
+    }
+
     void ThreadedSimulation::setup()
     {
         LOG << LOG_LEVEL_NORMAL << "Threaded Simulation with " << m_pool.get_thread_count() << " threads.";
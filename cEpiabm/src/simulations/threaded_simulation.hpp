@@ -4,6 +4,7 @@
 
 #include "../sweeps/sweep_interface.hpp"
 #include "../reporters/timestep_reporter_interface.hpp"
+#include "simulation_instrumentation.hpp"
 
 #include "../dataclasses/population.hpp"
 #include "../utilities/thread_pool.hpp"
@@ -25,6 +26,7 @@ namespace epiabm
         PopulationPtr m_population;
         std::map<size_t, std::vector<SweepInterfacePtr>> m_sweeps;
         std::vector<TimestepReporterInterfacePtr> m_timestepReporters;
+        SimulationInstrumentationPtr m_instrumentation;
         
         thread_pool m_pool;
 
@@ -36,9 +38,13 @@ namespace epiabm
 
         void addTimestepReporter(TimestepReporterInterfacePtr reporter);
 
+        void setInstrumentation(SimulationInstrumentationPtr instrumentation);
+
         void simulate(unsigned short timesteps);
 
     private:
+        void runSweepGroup(const unsigned short timestep,
+            const std::vector<SweepInterfacePtr>& sweeps);
         void setup();
         void teardown();
     };
@@ -98,8 +98,7 @@ namespace epiabm
     InfectionStatus HostProgressionSweep::chooseNextStatus(Person* person, InfectionStatus current)
     {
         size_t index = static_cast<size_t>(current);
-        std::discrete_distribution<size_t> d(m_transitionMatrix[person->params().age_group][index].begin(), m_transitionMatrix[person->params().age_group][index].end());
-        return static_cast<InfectionStatus>(d(
+        return static_cast<InfectionStatus>(m_transitionAliases[person->params().age_group][index](
             m_cfg->randomManager->g().generator()));
     }
 
@@ -147,6 +146,9 @@ namespace epiabm
     void HostProgressionSweep::loadTransitionMatrix()
     {
         LOG << LOG_LEVEL_NORMAL << "Host Progression Sweep: Loading Transition State Matrix";
+        for (auto& ageMatrix : m_transitionMatrix)
+            for (auto& row : ageMatrix)
+                row.fill(0);
         const auto set = [&](InfectionStatus from, InfectionStatus to, double value)
         {
             for (size_t i = 0; i < N_AGE_GROUPS; i++)
@@ -192,6 +194,12 @@ namespace epiabm
         set(InfectionStatus::InfectICURecov, InfectionStatus::Recovered, 1);
         set(InfectionStatus::Recovered, InfectionStatus::Recovered, 1);
         set(InfectionStatus::Dead, InfectionStatus::Dead, 1);
+
+        // Precompute alias tables so transitions are sampled in constant time
+        for (size_t age = 0; age < N_AGE_GROUPS; age++)
+            for (size_t from = 0; from < N_INFECTION_STATES; from++)
+                m_transitionAliases[age][from] = AliasTable(
+                    m_transitionMatrix[age][from].begin(), m_transitionMatrix[age][from].end());
         LOG << LOG_LEVEL_NORMAL << "Host Progression Sweep: Finished Loading Transition State Matrix";
     }
 
@@ -3,6 +3,7 @@
 
 #include "sweep_interface.hpp"
 #include "../utilities/inverse_cdf.hpp"
+#include "../utilities/alias_table.hpp"
 
 #include <memory>
 #include <vector>
@@ -16,6 +17,7 @@ namespace epiabm
     {
     private:
         std::array<std::array<std::array<double, N_INFECTION_STATES>, N_INFECTION_STATES>, N_AGE_GROUPS> m_transitionMatrix;
+        std::array<std::array<AliasTable, N_INFECTION_STATES>, N_AGE_GROUPS> m_transitionAliases;
         std::array<std::array<InverseCDF*, N_INFECTION_STATES>, N_INFECTION_STATES> m_transitionTimeMatrix;
         std::vector<double> m_infectiousnessProfile;
 
@@ -88,6 +88,7 @@ namespace epiabm
         double susceptibility = calcHouseSusc(infector, infectee, timestep);
         double foi = infectiousness * susceptibility;
 
+        m_infectionAttempts.fetch_add(1, std::memory_order_relaxed);
         if (m_cfg->randomManager->g().randf<double>() < foi)
         {
             {
@@ -99,6 +100,7 @@ namespace epiabm
             // Infection attempt is successful
             cell->enqueuePerson(infectee->cellPos());
             m_counter++;
+            m_infections.fetch_add(1, std::memory_order_relaxed);
         }
         return true;
     }
@@ -86,10 +86,13 @@ namespace epiabm
             LOG << LOG_LEVEL_DEBUG << "Place " << place->populationPos() << " has infectiousness "
                 << infectiousness << ". All susceptibel members will be infected";
             place->forEachMemberInGroup(*m_population, group,
-                std::bind(&PlaceSweep::doInfect, this,
-                    timestep, infectorCell, infector, 
-                    std::placeholders::_1, std::placeholders::_2,
-                    place, group));
+                [&](Cell* infecteeCell, Person* infectee)
+                {
+                    if (infectee->status() != InfectionStatus::Susceptible) return true;
+                    m_infectionAttempts.fetch_add(1, std::memory_order_relaxed);
+                    return doInfect(timestep, infectorCell, infector,
+                        infecteeCell, infectee, place, group);
+                });
             // LCOV_EXCL_END
         }
         else
@@ -106,6 +109,7 @@ namespace epiabm
                     if (infectee->status() != InfectionStatus::Susceptible) return true;
 
                     double foi = calcPlaceFoi(place, infector, infectee, timestep, group);
+                    m_infectionAttempts.fetch_add(1, std::memory_order_relaxed);
                     if (m_cfg->randomManager->g().randf<double>() < foi)
                     {
                         doInfect(timestep, infectorCell, infector,
@@ -135,6 +139,7 @@ namespace epiabm
         }
         infecteeCell->enqueuePerson(infectee->cellPos());
         m_counter++;
+        m_infections.fetch_add(1, std::memory_order_relaxed);
         return true;
     }
 
@@ -142,6 +142,7 @@ namespace epiabm
             double susceptibility = calcSpaceSusc(cell, infectee, timestep);
             double foi = infectiousness * susceptibility;
 
+            m_infectionAttempts.fetch_add(1, std::memory_order_relaxed);
             if (m_cfg->randomManager->g().randf<double>() < foi)
             {
                 // Infection attempt is successful
@@ -153,6 +154,7 @@ namespace epiabm
                     LOG << LOG_LEVEL_DEBUG << ss.str();
                 }
                 m_counter++;
+                m_infections.fetch_add(1, std::memory_order_relaxed);
                 inf_cell_addr->enqueuePerson(infectee->cellPos());
             }
         }
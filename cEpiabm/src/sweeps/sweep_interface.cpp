@@ -3,9 +3,14 @@
 
 namespace epiabm
 {
-    SweepInterface::SweepInterface() {}
+    SweepInterface::SweepInterface() :
+        m_infectionAttempts(0),
+        m_infections(0)
+    {}
     SweepInterface::SweepInterface(SimulationConfigPtr cfg) :
-        m_cfg(cfg)
+        m_cfg(cfg),
+        m_infectionAttempts(0),
+        m_infections(0)
     {}
 
     void SweepInterface::bind_population(PopulationPtr population)
@@ -13,4 +18,14 @@ namespace epiabm
         m_population = population;
     }
 
+    unsigned long long SweepInterface::infectionAttempts() const
+    {
+        return m_infectionAttempts.load(std::memory_order_relaxed);
+    }
+
+    unsigned long long SweepInterface::infections() const
+    {
+        return m_infections.load(std::memory_order_relaxed);
+    }
+
 } // namespace epiabm
@@ -4,6 +4,7 @@
 #include "../dataclasses/population.hpp"
 #include "../configuration/simulation_config.hpp"
 
+#include <atomic>
 #include <memory>
 #include <optional>
 
@@ -19,6 +20,9 @@ namespace epiabm
     protected:
         PopulationPtr m_population;
         SimulationConfigPtr m_cfg;
+        // Number of infection events tested and successful since construction
+        std::atomic<unsigned long long> m_infectionAttempts;
+        std::atomic<unsigned long long> m_infections;
 
     public:
         SweepInterface();
@@ -31,6 +35,18 @@ namespace epiabm
          * @param population 
          */
         void bind_population(PopulationPtr population);
+
+        /**
+         * @brief Number of infection events tested by this sweep
+         * @return unsigned long long
+         */
+        unsigned long long infectionAttempts() const;
+
+        /**
+         * @brief Number of successful infection events of this sweep
+         * @return unsigned long long
+         */
+        unsigned long long infections() const;
         
         /**
          * @brief Apply sweep
@@ -0,0 +1,90 @@
+#include "alias_table.hpp"
+
+#include <numeric>
+#include <stdexcept>
+
+namespace epiabm
+{
+
+    /**
+     * @brief Construct an empty Alias Table
+     * Always samples index 0
+     */
+    AliasTable::AliasTable() :
+        m_probability({1.0}),
+        m_alias({0})
+    {}
+
+    /**
+     * @brief Construct an Alias Table from a list of weights
+     * Weights do not need to be normalised. If all weights are zero, every index is equally likely
+     * @param weights Relative weight of each index
+     */
+    AliasTable::AliasTable(const std::vector<double>& weights) :
+        m_probability(weights.size(), 1.0),
+        m_alias(weights.size(), 0)
+    {
+        if (weights.empty())
+        {
+            *this = AliasTable();
+            return;
+        }
+        const double total = std::accumulate(weights.begin(), weights.end(), 0.0);
+        const size_t n = weights.size();
+        for (size_t i = 0; i < n; i++)
+        {
+            if (weights[i] < 0) throw std::invalid_argument("AliasTable weights must be non-negative");
+            m_alias[i] = i;
+        }
+        if (total <= 0) return;
+
+        // Vose's method: pair each under-full column with an over-full one
+        std::vector<double> scaled(n);
+        std::vector<size_t> small, large;
+        for (size_t i = 0; i < n; i++)
+        {
+            scaled[i] = weights[i] * static_cast<double>(n) / total;
+            (scaled[i] < 1.0 ? small : large).push_back(i);
+        }
+        while (!small.empty() && !large.empty())
+        {
+            size_t s = small.back();
+            small.pop_back();
+            size_t l = large.back();
+            m_probability[s] = scaled[s];
+            m_alias[s] = l;
+            scaled[l] -= 1.0 - scaled[s];
+            if (scaled[l] < 1.0)
+            {
+                large.pop_back();
+                small.push_back(l);
+            }
+        }
+        // Remaining columns are full, up to rounding error
+        for (size_t i : small) m_probability[i] = 1.0;
+        for (size_t i : large) m_probability[i] = 1.0;
+    }
+
+    /**
+     * @brief Sample an index
+     * @param generator Random number generator
+     * @return size_t Sampled index
+     */
+    size_t AliasTable::operator()(std::mt19937_64& generator) const
+    {
+        const double x = std::generate_canonical<double, 53>(generator) * static_cast<double>(m_probability.size());
+        size_t i = static_cast<size_t>(x);
+        if (i >= m_probability.size()) i = m_probability.size() - 1;
+        return (x - static_cast<double>(i) < m_probability[i]) ? i : m_alias[i];
+    }
+
+    /**
+     * @brief Number of indices in the table
+     * @return size_t
+     */
+    size_t AliasTable::size() const
+    {
+        return m_probability.size();
+    }
+
+} // namespace epiabm
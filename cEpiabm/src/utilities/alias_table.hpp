@@ -0,0 +1,34 @@
+#ifndef EPIABM_UTILITIES_ALIAS_TABLE_HPP
+#define EPIABM_UTILITIES_ALIAS_TABLE_HPP
+
+#include <random>
+#include <vector>
+
+namespace epiabm
+{
+    /**
+     * @brief Walker alias table for sampling a discrete distribution in constant time
+     * Built once from a list of weights, after which sampling requires no allocation
+     */
+    class AliasTable
+    {
+    private:
+        std::vector<double> m_probability;
+        std::vector<size_t> m_alias;
+
+    public:
+        AliasTable();
+        template <class InputIt>
+        AliasTable(InputIt first, InputIt last) :
+            AliasTable(std::vector<double>(first, last))
+        {}
+        AliasTable(const std::vector<double>& weights);
+
+        size_t operator()(std::mt19937_64& generator) const;
+
+        size_t size() const;
+    };
+
+} // namespace epiabm
+
+#endif // EPIABM_UTILITIES_ALIAS_TABLE_HPP
@@ -380,6 +380,8 @@ TEST_CASE("dataclasses/cell: test compartment counter", "[Cell]")
     REQUIRE(subject->microcells()[0].compartmentCount(InfectionStatus::Susceptible) == 100);
     REQUIRE(subject->compartmentCount(InfectionStatus::Exposed) == 0);
     REQUIRE(subject->microcells()[0].compartmentCount(InfectionStatus::Exposed) == 0);
+    REQUIRE(subject->compartmentCounter().counts()[0] == 1000);
+    REQUIRE(subject->microcells()[0].compartmentCounter().counts()[0] == 100);
 }
 
 TEST_CASE("dataclasses/cell: test set and get location", "[Cell]")
@@ -55,3 +55,18 @@ TEST_CASE("dataclasses/compartment_counter: test initialize cell", "[Compartment
     REQUIRE(subject(InfectionStatus::Susceptible) == 5);
     REQUIRE(subject(InfectionStatus::Exposed) == 0);
 }
+
+TEST_CASE("dataclasses/compartment_counter: test counts", "[CompartmentCounter]")
+{
+    CompartmentCounter subject = makeSubject(100);
+    subject.notify(InfectionStatus::Susceptible, InfectionStatus::Recovered);
+
+    const auto& counts = subject.counts();
+    REQUIRE(counts.size() == N_INFECTION_STATES);
+    REQUIRE(counts[static_cast<size_t>(InfectionStatus::Susceptible)] == 99);
+    REQUIRE(counts[static_cast<size_t>(InfectionStatus::Recovered)] == 1);
+    REQUIRE(counts[static_cast<size_t>(InfectionStatus::Exposed)] == 0);
+
+    subject.clear();
+    REQUIRE(subject(InfectionStatus::Susceptible) == 0);
+}
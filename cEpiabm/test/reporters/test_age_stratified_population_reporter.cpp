@@ -5,7 +5,10 @@
 
 #include "../catch/catch.hpp"
 
+#include <fstream>
 #include <random>
+#include <string>
+#include <vector>
 
 using namespace epiabm;
 
@@ -33,3 +36,35 @@ TEST_CASE("reporters/age_stratified_population_reporter: test destructor", "[Age
         subject = nullptr;
     }
 }
+
+TEST_CASE("reporters/age_stratified_population_reporter: test sparse output", "[AgeStratifiedPopulationReporter]")
+{
+    PopulationPtr population = PopulationFactory().makePopulation(1, 1, 4);
+    Cell* cell = population->cells()[0].get();
+    for (size_t i = 0; i < 4; i++)
+    {
+        cell->getPerson(i).params().age_group = static_cast<unsigned char>(i % 2);
+    }
+    population->initialize();
+
+    {
+        AgeStratifiedPopulationReporter subject = AgeStratifiedPopulationReporter("test_output/test_sparse_age_reporter.csv", 3);
+        subject.setup(population);
+        for (unsigned short t = 0; t < 4; t++)
+        {
+            if (t == 1) cell->getPerson(1).updateStatus(cell, InfectionStatus::Exposed, t);
+            subject.report(population, t);
+        }
+        subject.teardown();
+    }
+
+    std::ifstream f("test_output/test_sparse_age_reporter.csv");
+    std::string line;
+    std::vector<std::string> rows;
+    getline(f, line);
+    while (getline(f, line))
+    {
+        rows.push_back(line.substr(0, line.find(',', line.find(',') + 1)));
+    }
+    REQUIRE(rows == std::vector<std::string>({"0,0", "0,1", "1,1", "3,0", "3,1"}));
+}
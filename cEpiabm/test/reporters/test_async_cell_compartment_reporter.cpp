@@ -0,0 +1,77 @@
+
+#include "population_factory.hpp"
+#include "household_linker.hpp"
+#include "reporters/async_cell_compartment_reporter.hpp"
+
+#include "../catch/catch.hpp"
+
+#include <fstream>
+#include <string>
+
+using namespace epiabm;
+
+TEST_CASE("reporters/async_cell_compartment_reporter: test initialize", "[AsyncCellCompartmentReporter]")
+{
+    PopulationPtr population = PopulationFactory().makePopulation(10, 10, 1000);
+    HouseholdLinker().linkHouseholds(population, 1, 100, std::optional<size_t>());
+    population->initialize();
+
+    AsyncCellCompartmentReporter subject = AsyncCellCompartmentReporter("test_output/test_async_cell_compartment_reporter.csv");
+    REQUIRE_NOTHROW(subject.setup(population));
+    REQUIRE_NOTHROW(subject.compartments());
+    REQUIRE_NOTHROW(subject.report(population, 0));
+    REQUIRE_NOTHROW(subject.teardown());
+}
+
+TEST_CASE("reporters/async_cell_compartment_reporter: test output", "[AsyncCellCompartmentReporter]")
+{
+    PopulationPtr population = PopulationFactory().makePopulation(5, 2, 10);
+    population->initialize();
+    Cell* cell = population->cells()[3].get();
+
+    {
+        // Buffer of one timestep forces report to wait on the writer thread
+        AsyncCellCompartmentReporter subject = AsyncCellCompartmentReporter("test_output/test_async_output.csv", 1);
+        subject.setup(population);
+        for (unsigned short t = 0; t < 20; t++)
+        {
+            cell->getPerson(t).updateStatus(cell, InfectionStatus::Exposed, t);
+            subject.report(population, t);
+        }
+        subject.teardown();
+    }
+
+    std::ifstream f("test_output/test_async_output.csv");
+    std::string line;
+    getline(f, line);
+    REQUIRE(line == "timestep,cell,Susceptible,Exposed,InfectASympt,InfectMild,InfectGP,"
+        "InfectHosp,InfectICU,InfectICURecov,Recovered,Dead");
+    size_t numLines = 0;
+    std::string last;
+    while (getline(f, line))
+    {
+        numLines++;
+        if (line.rfind("19,3,", 0) == 0) last = line;
+    }
+    REQUIRE(numLines == 100);
+    REQUIRE(last == "19,3,0,20,0,0,0,0,0,0,0,0");
+}
+
+TEST_CASE("reporters/async_cell_compartment_reporter: test report before setup", "[AsyncCellCompartmentReporter]")
+{
+    PopulationPtr population = PopulationFactory().makePopulation(2, 2, 10);
+    population->initialize();
+    AsyncCellCompartmentReporter subject = AsyncCellCompartmentReporter("test_output/test_async_no_setup.csv");
+    REQUIRE_THROWS(subject.report(population, 0));
+}
+
+TEST_CASE("reporters/async_cell_compartment_reporter: test destructor", "[AsyncCellCompartmentReporter]")
+{
+    {
+        TimestepReporterInterface* i = new AsyncCellCompartmentReporter("test_output/test_destructor.csv");
+        [[maybe_unused]] AsyncCellCompartmentReporter* subject = dynamic_cast<AsyncCellCompartmentReporter*>(i);
+        delete i;
+        i = nullptr;
+        subject = nullptr;
+    }
+}
@@ -5,7 +5,9 @@
 
 #include "../catch/catch.hpp"
 
+#include <fstream>
 #include <random>
+#include <string>
 
 using namespace epiabm;
 
@@ -32,3 +34,37 @@ TEST_CASE("reporters/percell_compartment_reporter: test destructor", "[PerCellCo
         subject = nullptr;
     }
 }
+
+TEST_CASE("reporters/percell_compartment_reporter: test sparse output", "[PerCellCompartmentReporter]")
+{
+    PopulationPtr population = PopulationFactory().makePopulation(2, 1, 10);
+    population->initialize();
+    Cell* cell = population->cells()[1].get();
+
+    {
+        PerCellCompartmentReporter subject = PerCellCompartmentReporter("test_output/sparse", 4);
+        subject.setup(population);
+        for (unsigned short t = 0; t < 6; t++)
+        {
+            if (t == 2) cell->getPerson(0).updateStatus(cell, InfectionStatus::Exposed, t);
+            subject.report(population, t);
+        }
+        subject.teardown();
+    }
+
+    std::vector<std::string> timesteps;
+    for (size_t c = 0; c < 2; c++)
+    {
+        std::ifstream f("test_output/sparse/results_cell_" + std::to_string(c));
+        std::string line, steps;
+        getline(f, line);
+        while (getline(f, line))
+        {
+            steps += line.substr(0, line.find(','));
+        }
+        timesteps.push_back(steps);
+    }
+    // Initial row and keyframe, and for cell 1 the change at timestep 2
+    REQUIRE(timesteps[0] == "04");
+    REQUIRE(timesteps[1] == "024");
+}
@@ -1,5 +1,6 @@
 
 #include "simulations/basic_simulation.hpp"
+#include "simulations/simulation_instrumentation.hpp"
 #include "logfile.hpp"
 #include "sweeps/random_seed_sweep.hpp"
 #include "reporters/population_compartment_reporter.hpp"
@@ -49,3 +50,31 @@ TEST_CASE("simulations/basic_simulation: test addReporter", "[BasicSimulation]")
         std::make_shared<PopulationCompartmentReporter>("output/basic_simulation/population_output.csv")));
     REQUIRE_NOTHROW(subject.simulate(10));
 }
+
+TEST_CASE("simulations/basic_simulation: test setInstrumentation", "[BasicSimulation]")
+{
+    LogFile::Instance()->configure(2, std::filesystem::path("output/basic_simulation/instrumentation.log"));
+    PopulationFactory f = PopulationFactory();
+    PopulationPtr population = f.makePopulation(10, 10, 100);
+    population->initialize();
+    BasicSimulation subject = BasicSimulation(population);
+    subject.addSweep(std::make_shared<RandomSeedSweep>(
+        JsonFactory().loadConfig(std::filesystem::path("../testdata/test_config.json")), 50));
+
+    SimulationInstrumentationPtr instrumentation = std::make_shared<SimulationInstrumentation>(
+        std::string("output/basic_simulation/instrumentation.csv"));
+    size_t calls = 0;
+    instrumentation->setCallback([&calls](const TimestepRecord& record)
+        {
+            calls++;
+            REQUIRE(record.sweeps.size() == 1);
+            REQUIRE(record.sweeps[0].seconds >= 0);
+            REQUIRE(record.sweeps[0].infectionAttempts == 0);
+        });
+    REQUIRE_NOTHROW(subject.setInstrumentation(instrumentation));
+    REQUIRE_NOTHROW(subject.simulate(10));
+    REQUIRE(calls == 10);
+    REQUIRE(instrumentation->records().size() == 10);
+    REQUIRE(instrumentation->records()[3].timestep == 4);
+    REQUIRE(std::filesystem::exists("output/basic_simulation/instrumentation.csv"));
+}
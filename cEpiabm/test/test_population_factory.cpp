@@ -280,3 +280,91 @@ TEST_CASE("dataclasses/population_factory: test add places", "[PopulationFactory
     f.addPlaces(p, 10);
     REQUIRE(p->places().size() == 11);
 }
+
+TEST_CASE("dataclasses/population_factory: test make population from arrays", "[PopulationFactory]")
+{
+    // Two cells: first with microcells of 2 and 1 people, second with one microcell of 2 people
+    std::vector<double> cellLocations = {0.5, 1.5, 2.5, 3.5};
+    std::vector<uint64_t> microcellsPerCell = {2, 1};
+    std::vector<uint64_t> peoplePerMicrocell = {2, 1, 2};
+    std::vector<uint64_t> householdsPerMicrocell = {1, 0, 2};
+    std::vector<uint8_t> status = {0, 2, 1, 8, 0};
+    std::vector<uint8_t> ageGroup = {0, 1, 2, 3, 4};
+    std::vector<float> susceptibility = {1, 1, 1, 1, 1};
+    std::vector<float> infectiousness = {0, 0.5f, 0, 0, 0};
+    std::vector<float> initialInfectiousness = {0, 0.25f, 0, 0, 0};
+    std::vector<uint8_t> nextStatus = {0, 8, 3, 0, 0};
+    std::vector<uint16_t> nextStatusTime = {0, 5, 3, 0, 0};
+    std::vector<int64_t> household = {0, 0, -1, 1, 0};
+    std::vector<double> householdSusceptibility = {0.1, 0.2, 0.3};
+    std::vector<double> householdInfectiousness = {1.1, 1.2, 1.3};
+    std::vector<double> householdLocations = {0, 0, 2, 3, 2.5, 3.5};
+    std::vector<uint64_t> membershipPlace = {0, 0, 1};
+    std::vector<uint64_t> membershipCell = {0, 0, 1};
+    std::vector<uint64_t> membershipPerson = {0, 2, 1};
+    std::vector<uint64_t> membershipGroup = {0, 1, 0};
+
+    PopulationArrays arrays;
+    arrays.n_cells = 2;
+    arrays.cell_locations = cellLocations.data();
+    arrays.microcells_per_cell = microcellsPerCell.data();
+    arrays.n_microcells = 3;
+    arrays.people_per_microcell = peoplePerMicrocell.data();
+    arrays.households_per_microcell = householdsPerMicrocell.data();
+    arrays.n_people = 5;
+    arrays.status = status.data();
+    arrays.age_group = ageGroup.data();
+    arrays.susceptibility = susceptibility.data();
+    arrays.infectiousness = infectiousness.data();
+    arrays.initial_infectiousness = initialInfectiousness.data();
+    arrays.next_status = nextStatus.data();
+    arrays.next_status_time = nextStatusTime.data();
+    arrays.household = household.data();
+    arrays.n_households = 3;
+    arrays.household_susceptibility = householdSusceptibility.data();
+    arrays.household_infectiousness = householdInfectiousness.data();
+    arrays.household_locations = householdLocations.data();
+    arrays.n_places = 2;
+    arrays.n_memberships = 3;
+    arrays.membership_place = membershipPlace.data();
+    arrays.membership_cell = membershipCell.data();
+    arrays.membership_person = membershipPerson.data();
+    arrays.membership_group = membershipGroup.data();
+
+    PopulationFactory f = PopulationFactory();
+    PopulationPtr p = f.makePopulation(arrays);
+
+    REQUIRE(p->cells().size() == 2);
+    REQUIRE(p->cells()[1]->location() == std::make_pair(2.5, 3.5));
+    REQUIRE(p->cells()[0]->microcells().size() == 2);
+    REQUIRE(p->cells()[0]->people().size() == 3);
+    REQUIRE(p->cells()[1]->people().size() == 2);
+    REQUIRE(p->cells()[0]->getMicrocell(1).people().size() == 1);
+
+    Person& infectious = p->cells()[0]->getPerson(1);
+    REQUIRE(infectious.status() == InfectionStatus::InfectASympt);
+    REQUIRE(infectious.params().age_group == 1);
+    REQUIRE(infectious.params().infectiousness == Approx(0.5));
+    REQUIRE(infectious.params().initial_infectiousness == Approx(0.25));
+    REQUIRE(infectious.params().next_status == InfectionStatus::Recovered);
+    REQUIRE(infectious.params().next_status_time == 5);
+    REQUIRE(p->cells()[0]->numInfectious() == 1);
+    REQUIRE(p->cells()[0]->numExposed() == 1);
+    REQUIRE(p->cells()[1]->compartmentCount(InfectionStatus::Recovered) == 1);
+
+    REQUIRE(infectious.household() == std::optional<size_t>(0));
+    REQUIRE_FALSE(p->cells()[0]->getPerson(2).household().has_value());
+    REQUIRE(p->cells()[0]->getMicrocell(0).getHousehold(0)->members().size() == 2);
+    REQUIRE(p->cells()[1]->getMicrocell(0).getHousehold(1)->isMember(0));
+    REQUIRE(p->cells()[1]->getMicrocell(0).getHousehold(1)->params().location == std::make_pair(2.5, 3.5));
+    REQUIRE(p->cells()[1]->getMicrocell(0).getHousehold(0)->params().infectiousness == Approx(1.2));
+
+    REQUIRE(p->places().size() == 2);
+    REQUIRE(p->places()[0].isMember(0, 0));
+    REQUIRE(p->places()[0].isMember(0, 2));
+    REQUIRE(p->places()[0].membersInGroup(1).size() == 1);
+    REQUIRE(p->places()[1].isMember(1, 1));
+
+    membershipPerson[2] = 7;
+    REQUIRE_THROWS(f.makePopulation(arrays));
+}
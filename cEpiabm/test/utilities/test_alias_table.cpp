@@ -0,0 +1,62 @@
+
+#include "utilities/alias_table.hpp"
+
+#include "../catch/catch.hpp"
+
+#include <array>
+#include <random>
+#include <stdexcept>
+
+using namespace epiabm;
+
+TEST_CASE("utilities/alias_table: test initialize", "[AliasTable]")
+{
+    std::mt19937_64 generator(0);
+    AliasTable subject = AliasTable();
+    REQUIRE(subject.size() == 1);
+    REQUIRE(subject(generator) == 0);
+
+    std::array<double, 3> weights = {0.0, 2.0, 0.0};
+    AliasTable subject2 = AliasTable(weights.begin(), weights.end());
+    REQUIRE(subject2.size() == 3);
+    for (int i = 0; i < 100; i++)
+    {
+        REQUIRE(subject2(generator) == 1);
+    }
+
+    REQUIRE_THROWS_AS(AliasTable(std::vector<double>({1.0, -1.0})), std::invalid_argument);
+}
+
+TEST_CASE("utilities/alias_table: test sample distribution", "[AliasTable]")
+{
+    std::mt19937_64 generator(0);
+    std::vector<double> weights = {0.1, 0.0, 0.5, 0.25, 0.15};
+    AliasTable subject = AliasTable(weights);
+
+    const int n = 100000;
+    std::array<int, 5> counts = {0, 0, 0, 0, 0};
+    for (int i = 0; i < n; i++)
+    {
+        size_t s = subject(generator);
+        REQUIRE(s < 5);
+        counts[s]++;
+    }
+    REQUIRE(counts[1] == 0);
+    for (size_t i = 0; i < weights.size(); i++)
+    {
+        REQUIRE(static_cast<double>(counts[i]) / n == Approx(weights[i]).margin(0.01));
+    }
+}
+
+TEST_CASE("utilities/alias_table: test zero weights", "[AliasTable]")
+{
+    std::mt19937_64 generator(0);
+    AliasTable subject = AliasTable(std::vector<double>({0.0, 0.0}));
+    std::array<int, 2> counts = {0, 0};
+    for (int i = 0; i < 1000; i++)
+    {
+        counts[subject(generator)]++;
+    }
+    REQUIRE(counts[0] > 0);
+    REQUIRE(counts[1] > 0);
+}
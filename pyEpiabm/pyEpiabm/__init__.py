@@ -20,6 +20,9 @@ from . import utility
 # Expose modules in core within pyEpiabm namespace
 
 from .core._compartment_counter import _CompartmentCounter
+from .core._new_case_counter import _NewCaseCounter
+from .core._person_queue import _PersonQueue
+from .core._vaccine_rollout import _VaccineRollout
 from .core.cell import Cell
 from .core.household import Household
 from .core.microcell import Microcell
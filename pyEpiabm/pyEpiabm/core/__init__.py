@@ -14,3 +14,6 @@ from .microcell import Microcell
 from .place import Place
 from .population import Population
 from ._compartment_counter import _CompartmentCounter
+from ._new_case_counter import _NewCaseCounter
+from ._person_queue import _PersonQueue
+from ._vaccine_rollout import _VaccineRollout
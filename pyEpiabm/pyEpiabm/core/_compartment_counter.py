@@ -34,11 +34,35 @@ class _CompartmentCounter:
         else:
             self.nb_age_groups = 1
 
-        # Internal datastore, returns array with age group for each status
-        # infection
-        self._compartments = {status: np.zeros(self.nb_age_groups, dtype=int)
+        # Internal datastore, with a row of counts by age group for each
+        # infection status in order of their values
+        self._counts = np.zeros((len(InfectionStatus), self.nb_age_groups),
+                                dtype=int)
+        self._make_compartments()
+
+    def _make_compartments(self):
+        """Map each infection status to its row of the counts, so the
+        dictionary of compartments shares memory with the array.
+
+        """
+        self._compartments = {status: self._counts[status.value - 1]
                               for status in InfectionStatus}
 
+    def __getstate__(self):
+        """Copy the counts without the dictionary of views into them.
+
+        """
+        state = self.__dict__.copy()
+        del state["_compartments"]
+        return state
+
+    def __setstate__(self, state):
+        """Restore the counts and the dictionary of views into them.
+
+        """
+        self.__dict__.update(state)
+        self._make_compartments()
+
     @property
     def identifier(self):
         """Get identifier.
@@ -107,9 +131,20 @@ class _CompartmentCounter:
         """
         return self._compartments
 
+    def totals(self) -> np.ndarray:
+        """Get the number of people in each compartment, summed over age
+        groups.
+
+        Returns
+        -------
+        np.ndarray
+            Count of each infection status, in order of their values
+
+        """
+        return self._counts.sum(axis=1)
+
     def clear_counter(self):
         """ Method to clear and reset compartment counter to zero.
         """
 
-        self._compartments = {status: np.zeros(self.nb_age_groups, dtype=int)
-                              for status in InfectionStatus}
+        self._counts[:] = 0
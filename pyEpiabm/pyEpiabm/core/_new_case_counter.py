@@ -0,0 +1,88 @@
+#
+# Maintains a count of new cases over time
+#
+
+import bisect
+import numpy as np
+
+import pyEpiabm.core
+
+
+class _NewCaseCounter:
+    """Class Component which maintains the number of new infections at each
+    time, according to their age group. This allows incidence over any time
+    window to be retrieved without looping through the population.
+
+    """
+
+    def __init__(self, identifier: str):
+        """Constructor Method.
+
+        Parameters
+        ----------
+        identifier : str
+            Identifier for this counter
+
+        """
+        self._identifier = identifier
+        if pyEpiabm.core.Parameters.instance().use_ages:
+            self.nb_age_groups =\
+                len(pyEpiabm.core.Parameters.instance().age_proportions)
+        else:
+            self.nb_age_groups = 1
+
+        # Sorted times at which new cases occurred, and the matching count of
+        # new cases in each age group
+        self._times = []
+        self._counts = []
+
+    @property
+    def identifier(self):
+        """Get identifier.
+
+        """
+        return self._identifier
+
+    def report(self, time: float, age_group=0) -> None:
+        """Report a new case.
+
+        Parameters
+        ----------
+        time : float
+            Time of infection
+        age_group : Age group index
+            Person's associated age group, defaults to 0 if age not implemented
+
+        """
+        if not self._times or self._times[-1] != time:
+            # Cases are usually reported in time order, so this appends
+            index = bisect.bisect_left(self._times, time)
+            if index == len(self._times) or self._times[index] != time:
+                self._times.insert(index, time)
+                self._counts.insert(index,
+                                    np.zeros(self.nb_age_groups, dtype=int))
+        else:
+            index = len(self._times) - 1
+        self._counts[index][age_group] += 1
+
+    def retrieve(self, start: float, end: float) -> np.ndarray:
+        """Get number of new cases in each age group with infection times in
+        the interval (start, end].
+
+        Parameters
+        ----------
+        start : float
+            Start of time window (exclusive)
+        end : float
+            End of time window (inclusive)
+
+        Returns
+        -------
+        np.ndarray
+            Number of new cases in each age group
+
+        """
+        lower = bisect.bisect_right(self._times, start)
+        upper = bisect.bisect_right(self._times, end)
+        return sum(self._counts[lower:upper],
+                   np.zeros(self.nb_age_groups, dtype=int))
@@ -0,0 +1,97 @@
+#
+# Lightweight queues of people for single-threaded sweeps
+#
+
+import typing
+from collections import deque
+
+
+class _PersonQueue:
+    """Class Component which stores people in first-in first-out order.
+    Unlike :class:`queue.Queue` no locks are taken, as pyEpiabm runs in a
+    single thread. If unique is True, a person already in the queue is not
+    added again (mirroring `m_peopleInQueue` in cEpiabm).
+
+    """
+
+    def __init__(self, unique: bool = False):
+        """Constructor Method.
+
+        Parameters
+        ----------
+        unique : bool
+            Whether to ignore people who are already in the queue
+
+        """
+        self._queue = deque()
+        self._members = set() if unique else None
+
+    def put(self, person):
+        """Add person to the back of the queue.
+
+        Parameters
+        ----------
+        person : Person
+            Person to enqueue
+
+        """
+        if self._members is not None:
+            if person in self._members:
+                return
+            self._members.add(person)
+        self._queue.append(person)
+
+    def get(self):
+        """Remove and return the person at the front of the queue.
+
+        Returns
+        -------
+        Person
+            Person at the front of the queue
+
+        """
+        person = self._queue.popleft()
+        if self._members is not None:
+            self._members.discard(person)
+        return person
+
+    def drain(self, n: int = None) -> typing.List:
+        """Remove and return up to n people from the front of the queue, or
+        all people if n is None.
+
+        Parameters
+        ----------
+        n : int
+            Maximum number of people to remove
+
+        Returns
+        -------
+        list
+            People removed, in queue order
+
+        """
+        if n is None or n >= len(self._queue):
+            people = list(self._queue)
+            self._queue.clear()
+            if self._members is not None:
+                self._members.clear()
+        else:
+            people = [self._queue.popleft() for _ in range(max(n, 0))]
+            if self._members is not None:
+                self._members.difference_update(people)
+        return people
+
+    def empty(self) -> bool:
+        """Query if the queue is empty.
+
+        """
+        return not self._queue
+
+    def qsize(self) -> int:
+        """Get the number of people in the queue.
+
+        """
+        return len(self._queue)
+
+    def __len__(self):
+        return len(self._queue)
@@ -0,0 +1,151 @@
+#
+# Array based plan of people to vaccinate in priority order
+#
+
+import typing
+import numpy as np
+
+
+class _VaccineRollout:
+    """Class Component which stores the people due to be vaccinated as an
+    array sorted by priority, with a cursor marking the next person to
+    vaccinate. Each day's doses are taken as a single slice of this array,
+    so no heap operations are needed per person.
+    Entries are ordered by priority level and then by counter, matching the
+    `(priority, counter, person)` entries of a priority queue.
+
+    """
+
+    def __init__(self):
+        """Constructor Method.
+
+        """
+        self._people = np.empty(0, dtype=object)
+        self._priorities = np.empty(0, dtype=int)
+        self._counters = np.empty(0, dtype=int)
+        self._cursor = 0
+        # Entries added one at a time, merged into the plan when next used
+        self._pending = []
+
+    def put(self, item: typing.Tuple):
+        """Add a single `(priority, counter, person)` entry to the plan.
+
+        Parameters
+        ----------
+        item : tuple
+            Priority level, counter within priority level and person
+
+        """
+        self._pending.append(item)
+
+    def set_plan(self, people, priorities, counters=None):
+        """Replace the plan with the given people, which are vaccinated in
+        order of priority and then counter.
+
+        Parameters
+        ----------
+        people : list or np.ndarray
+            People to vaccinate
+        priorities : list or np.ndarray
+            Priority level of each person, lower levels are vaccinated first
+        counters : list or np.ndarray
+            Order within each priority level, defaults to the order given
+
+        """
+        people_array = np.empty(len(people), dtype=object)
+        people_array[:] = people
+        priorities = np.asarray(priorities, dtype=int)
+        if counters is None:
+            counters = np.arange(len(people))
+        counters = np.asarray(counters, dtype=int)
+        order = np.lexsort((counters, priorities))
+        self._people = people_array[order]
+        self._priorities = priorities[order]
+        self._counters = counters[order]
+        self._cursor = 0
+        self._pending = []
+
+    def _merge_pending(self):
+        """Merge entries added with `put` into the remaining plan.
+
+        """
+        if not self._pending:
+            return
+        priorities, counters, people = zip(*self._pending)
+        c = self._cursor
+        self.set_plan(
+            list(self._people[c:]) + list(people),
+            np.concatenate([self._priorities[c:], priorities]),
+            np.concatenate([self._counters[c:], counters]))
+
+    def next_doses(self, n: int) -> np.ndarray:
+        """Remove and return the next n people in the plan (or all remaining
+        people if there are fewer).
+
+        Parameters
+        ----------
+        n : int
+            Number of doses available
+
+        Returns
+        -------
+        np.ndarray
+            People to vaccinate, in priority order
+
+        """
+        self._merge_pending()
+        people = self._people[self._cursor:self._cursor + max(int(n), 0)]
+        self._cursor += len(people)
+        return people
+
+    def vaccinate_next(self, n: int, time: float,
+                       time_to_efficacy: float = 0) -> np.ndarray:
+        """Vaccinate the next n people in the plan. The delay until each
+        vaccine is effective is drawn for the whole slice at once, from a
+        Poisson distribution with mean time_to_efficacy.
+
+        Parameters
+        ----------
+        n : int
+            Number of doses available
+        time : float
+            Current simulation time
+        time_to_efficacy : float
+            Mean number of days until the vaccine is effective
+
+        Returns
+        -------
+        np.ndarray
+            People vaccinated
+
+        """
+        people = self.next_doses(n)
+        delays = np.random.poisson(time_to_efficacy, len(people))
+        for person, delay in zip(people, delays):
+            person.vaccinate(time, delay)
+        return people
+
+    @property
+    def queue(self) -> typing.List[typing.Tuple]:
+        """Get the remaining `(priority, counter, person)` entries in order.
+
+        """
+        self._merge_pending()
+        c = self._cursor
+        return list(zip(self._priorities[c:].tolist(),
+                        self._counters[c:].tolist(), self._people[c:]))
+
+    def empty(self) -> bool:
+        """Query if there is nobody left to vaccinate.
+
+        """
+        return self.qsize() == 0
+
+    def qsize(self) -> int:
+        """Get the number of people left to vaccinate.
+
+        """
+        return len(self._people) - self._cursor + len(self._pending)
+
+    def __len__(self):
+        return self.qsize()
@@ -2,9 +2,10 @@
 # Cell Class
 #
 
+import heapq
+import itertools
 import typing
 import numpy as np
-from queue import Queue
 from numbers import Number
 
 from pyEpiabm.core import Parameters
@@ -14,6 +15,14 @@ from pyEpiabm.utility import DistanceFunctions
 from .microcell import Microcell
 from .person import Person
 from ._compartment_counter import _CompartmentCounter
+from ._new_case_counter import _NewCaseCounter
+from ._person_queue import _PersonQueue
+
+
+# Statuses of people who may still infect others
+_ACTIVE_STATUSES = [status for status in InfectionStatus
+                    if status == InfectionStatus.Exposed
+                    or status.name.startswith("Infect")]
 
 
 class Cell:
@@ -21,6 +30,13 @@ class Cell:
     Collection of :class:`Microcell` s and :class:`Person` s.
 
     """
+    # _index is set by the py2c converter
+    __slots__ = ("location", "id", "microcells", "persons", "places",
+                 "households", "person_queue", "PCR_queue", "LFT_queue",
+                 "compartment_counter", "new_case_counter",
+                 "isolation_candidates", "isolation_events", "_event_counter",
+                 "pending_exposures", "nearby_cell_distances", "_index")
+
     def __init__(self, loc: typing.Tuple[float, float] = (0, 0)):
         """Constructor Method.
 
@@ -36,10 +52,17 @@ class Cell:
         self.persons = []
         self.places = []
         self.households = []
-        self.person_queue = Queue()
-        self.PCR_queue = Queue()
-        self.LFT_queue = Queue()
+        self.person_queue = _PersonQueue(unique=True)
+        # Number of people taken from the person queue whose change of
+        # status is still to be applied
+        self.pending_exposures = 0
+        self.PCR_queue = _PersonQueue(unique=True)
+        self.LFT_queue = _PersonQueue(unique=True)
         self.compartment_counter = _CompartmentCounter(f"Cell {id(self)}")
+        self.new_case_counter = _NewCaseCounter(f"Cell {id(self)}")
+        self.isolation_candidates = set()
+        self.isolation_events = []
+        self._event_counter = itertools.count()
         self.nearby_cell_distances = dict()
 
         if not (len(loc) == 2 and isinstance(loc[0], Number) and
@@ -122,6 +145,49 @@ class Cell:
         """
         self.LFT_queue.put(person)
 
+    def add_isolation_candidate(self, person: Person):
+        """Record a person who has become symptomatic or has tested
+        positive, so that case isolation only needs to consider these people
+        rather than the whole cell.
+
+        Parameters
+        ----------
+        person : Person
+            Person who may need to isolate
+
+        """
+        self.isolation_candidates.add(person)
+
+    def schedule_isolation(self, person: Person):
+        """Record that a person will start isolating at their
+        `isolation_start_time`, for use by household quarantine. Events are
+        kept in a heap ordered by isolation start time.
+
+        Parameters
+        ----------
+        person : Person
+            Person starting isolation
+
+        """
+        heapq.heappush(self.isolation_events,
+                       (person.isolation_start_time,
+                        next(self._event_counter), person))
+
+    def expire_isolation_events(self, time: float):
+        """Drop the isolation events which started before the given time,
+        which household quarantine no longer acts on. This bounds the heap
+        when case isolation runs without household quarantine.
+
+        Parameters
+        ----------
+        time : float
+            Current simulation time
+
+        """
+        events = self.isolation_events
+        while events and events[0][0] < time:
+            heapq.heappop(events)
+
     def notify_person_status_change(
             self,
             old_status: InfectionStatus,
@@ -140,6 +206,36 @@ class Cell:
         """
         self.compartment_counter.report(old_status, new_status, age_group)
 
+    def notify_new_case(self, time: float, age_group) -> None:
+        """Notify Cell that a person in it has become infected.
+
+        Parameters
+        ----------
+        time : float
+            Time of infection
+        age_group : Age group index
+            Person's associated age group
+        """
+        self.new_case_counter.report(time, age_group)
+
+    def is_active(self):
+        """Query if anyone in the cell is exposed, infectious, queued to
+        be exposed or waiting for their exposure to be applied. An inactive
+        cell is fully susceptible or past the epidemic, so it is described
+        by its compartment counter alone and sweeps in aggregate mode do not
+        visit its people.
+
+        Returns
+        -------
+        bool
+            Whether the cell is active
+
+        """
+        if self.pending_exposures > 0 or not self.person_queue.empty():
+            return True
+        counts = self.compartment_counter.retrieve()
+        return any(np.any(counts[status]) for status in _ACTIVE_STATUSES)
+
     def number_infectious(self):
         """Returns the total number of infectious people in each
         cell, all ages combined.
@@ -189,9 +285,10 @@ class Cell:
         '''
         cutoff = Parameters.instance().infection_radius
 
-        for cell2 in other_cells:
-            distance = DistanceFunctions.dist(self.location, cell2.location)
-            if distance < cutoff:
-                self.nearby_cell_distances[cell2.id] = distance
-                # Dict of near neighbours, cells which are closer than the
-                # cutoff for cross-cell infection
+        distances = DistanceFunctions.dist_many(
+            self.location, [cell2.location for cell2 in other_cells])
+        for i in np.nonzero(distances < cutoff)[0]:
+            # Dict of near neighbours, cells which are closer than the
+            # cutoff for cross-cell infection
+            self.nearby_cell_distances[other_cells[i].id] = \
+                float(distances[i])
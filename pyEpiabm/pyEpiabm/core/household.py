@@ -15,6 +15,11 @@ class Household:
     have a combined susceptibility and infectiousness
     different to that of the individuals.
     """
+    # _microcell_index is set by the py2c converter
+    __slots__ = ("persons", "susceptible_persons", "location",
+                 "susceptibility", "infectiousness", "cell", "microcell",
+                 "isolation_location", "_microcell_index")
+
     def __init__(self, microcell, loc: typing.Tuple[float, float],
                  susceptibility=0, infectiousness=0):
         """Constructor Method.
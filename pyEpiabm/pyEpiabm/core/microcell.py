@@ -14,6 +14,11 @@ from .household import Household
 from ._compartment_counter import _CompartmentCounter
 
 
+_INFECTIOUS_STATUSES = frozenset(
+    status for status in InfectionStatus
+    if str(status).startswith('InfectionStatus.Infect'))
+
+
 class Microcell:
     """Class representing a Microcell (Group of people and places).
     Collection of :class:`Person` s.
@@ -23,7 +28,20 @@ class Microcell:
     cell : Cell
         An instance of :class:`Cell`
 
+    Attributes
+    ----------
+    closure_start_time : float or None
+        Time at which place closure starts, or None if not closed
+    distancing_start_time : float or None
+        Time at which social distancing starts, or None if not distancing
+
     """
+    # _index and _n_households are set by the py2c converter
+    __slots__ = ("id", "persons", "places", "households", "cell", "location",
+                 "compartment_counter", "_counts", "_threshold_callbacks",
+                 "_count_listeners", "closure_start_time",
+                 "distancing_start_time", "_index", "_n_households")
+
     def __init__(self, cell):
         """Constructor Method.
 
@@ -41,6 +59,11 @@ class Microcell:
         self.location = cell.location
         self.compartment_counter = _CompartmentCounter(
             f"Microcell {id(self)}")
+        self._counts = {"infectious": 0, "icu": 0}
+        self._threshold_callbacks = {"infectious": [], "icu": []}
+        self._count_listeners = {"infectious": [], "icu": []}
+        self.closure_start_time = None
+        self.distancing_start_time = None
 
     def __repr__(self):
         """Returns a string representation of Microcell.
@@ -79,10 +102,14 @@ class Microcell:
         status = person.infection_status
         age_group = person.age_group
         self.compartment_counter._increment_compartment(1, status, age_group)
+        self._update_counts(status, 1)
         self.cell.compartment_counter._increment_compartment(1, status,
                                                              age_group)
+        person.cell_index = len(self.cell.persons)
         self.cell.persons.append(person)
         self.persons.append(person)
+        if person.is_symptomatic():
+            self.cell.add_isolation_candidate(person)
 
     def add_people(self, n, status=InfectionStatus.Susceptible,
                    age_group=None):
@@ -100,6 +127,7 @@ class Microcell:
         """
         for _ in range(n):
             p = Person(self, age_group)
+            p.cell_index = len(self.cell.persons)
             self.cell.persons.append(p)
             self.persons.append(p)
             p.infection_status = status
@@ -107,6 +135,9 @@ class Microcell:
                 1, p.infection_status, p.age_group)
             self.cell.compartment_counter._increment_compartment(
                 1, p.infection_status, p.age_group)
+            self._update_counts(p.infection_status, 1)
+            if p.is_symptomatic():
+                self.cell.add_isolation_candidate(p)
 
     def add_place(self, n: int, loc: typing.Tuple[float, float],
                   place_type):
@@ -160,6 +191,138 @@ class Microcell:
         self.compartment_counter.report(old_status, new_status, age_group)
         self.cell.notify_person_status_change(old_status, new_status,
                                               age_group)
+        self._update_counts(new_status, 1, old_status)
+
+    def add_threshold_callback(self, threshold: int, callback,
+                               count: str = "infectious"):
+        """Register a callback for when the number of infectious (or ICU)
+        people in this microcell crosses a threshold. The callback is called
+        as `callback(microcell, above)` whenever the count rises to the
+        threshold (`above` is True) or falls back below it (`above` is
+        False), and immediately if the count already meets the threshold.
+
+        Parameters
+        ----------
+        threshold : int
+            Number of people at which the callback is triggered
+        callback : callable
+            Function to call with this microcell and whether the count is
+            at or above the threshold
+        count : str
+            Which count to watch, either "infectious" or "icu"
+
+        """
+        if count not in self._threshold_callbacks:
+            raise ValueError(f"Unknown count '{count}', must be one of "
+                             f"{list(self._threshold_callbacks)}")
+        self._threshold_callbacks[count].append((threshold, callback))
+        if self._counts[count] >= threshold:
+            callback(self, True)
+
+    def remove_threshold_callback(self, callback, count: str = "infectious"):
+        """Remove a callback registered with
+        :meth:`add_threshold_callback`, at all of its thresholds.
+
+        Parameters
+        ----------
+        callback : callable
+            Function which was registered
+        count : str
+            Which count the callback watches, either "infectious" or "icu"
+
+        """
+        if count not in self._threshold_callbacks:
+            raise ValueError(f"Unknown count '{count}', must be one of "
+                             f"{list(self._threshold_callbacks)}")
+        self._threshold_callbacks[count] = [
+            (threshold, registered) for threshold, registered
+            in self._threshold_callbacks[count] if registered != callback]
+
+    def add_count_listener(self, listener, count: str = "infectious"):
+        """Register a listener for every change in the number of infectious
+        (or ICU) people in this microcell. The listener is called as
+        `listener(microcell, n)` with the change n in the count.
+
+        Parameters
+        ----------
+        listener : callable
+            Function to call with this microcell and the change in the count
+        count : str
+            Which count to watch, either "infectious" or "icu"
+
+        """
+        if count not in self._count_listeners:
+            raise ValueError(f"Unknown count '{count}', must be one of "
+                             f"{list(self._count_listeners)}")
+        self._count_listeners[count].append(listener)
+
+    def remove_count_listener(self, listener, count: str = "infectious"):
+        """Remove a listener registered with :meth:`add_count_listener`.
+
+        Parameters
+        ----------
+        listener : callable
+            Function which was registered
+        count : str
+            Which count the listener watches, either "infectious" or "icu"
+
+        """
+        if count not in self._count_listeners:
+            raise ValueError(f"Unknown count '{count}', must be one of "
+                             f"{list(self._count_listeners)}")
+        self._count_listeners[count] = [
+            registered for registered in self._count_listeners[count]
+            if registered != listener]
+
+    def _update_counts(self, status: InfectionStatus, n: int,
+                       old_status: InfectionStatus = None):
+        """Update the infectious and ICU counts when n people of the given
+        status are added (or removed if n is negative), calling any
+        threshold callbacks whose threshold is crossed. If old_status is
+        given, the people are moved from old_status instead.
+
+        Parameters
+        ----------
+        status : InfectionStatus
+            Status of people added or removed
+        n : int
+            Number of people added
+        old_status : InfectionStatus
+            Previous status of people changing status
+
+        """
+        infectious = n * (status in _INFECTIOUS_STATUSES)
+        icu = n * (status == InfectionStatus.InfectICU)
+        if old_status is not None:
+            infectious -= n * (old_status in _INFECTIOUS_STATUSES)
+            icu -= n * (old_status == InfectionStatus.InfectICU)
+        if infectious:
+            self._change_count("infectious", infectious)
+        if icu:
+            self._change_count("icu", icu)
+
+    def _change_count(self, count: str, n: int):
+        """Change one of the maintained counts and call its listeners and
+        threshold callbacks.
+
+        Parameters
+        ----------
+        count : str
+            Count to change, either "infectious" or "icu"
+        n : int
+            Change in the count
+
+        """
+        old = self._counts[count]
+        new = old + n
+        self._counts[count] = new
+        for listener in self._count_listeners[count]:
+            listener(self, n)
+        for threshold, callback in self._threshold_callbacks[count]:
+            if old < threshold <= new:
+                callback(self, True)
+            elif new < threshold <= old:
+                callback(self, False)
 
     def set_location(self, loc: typing.Tuple[float, float]):
         """Method to set or change the location of a microcell.
@@ -176,9 +339,23 @@ class Microcell:
         self.location = loc
 
     def count_icu(self):
-        return sum(map(lambda person: person.infection_status ==
-                   InfectionStatus.InfectICU, self.persons))
+        """Get the number of people in ICU in this microcell.
+
+        Returns
+        -------
+        int
+            Number of people with status InfectICU
+
+        """
+        return self._counts["icu"]
 
     def count_infectious(self):
-        return sum(map(lambda person: person.is_infectious() is
-                   True, self.persons))
+        """Get the number of infectious people in this microcell.
+
+        Returns
+        -------
+        int
+            Number of infectious people
+
+        """
+        return self._counts["infectious"]
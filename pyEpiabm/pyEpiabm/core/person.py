@@ -2,13 +2,22 @@
 # Person Class
 #
 
+import functools
 import random
 
-from pyEpiabm.property import InfectionStatus
+from pyEpiabm.property import InfectionStatus, PlaceType
 
 from .parameters import Parameters
 
 
+@functools.lru_cache(maxsize=16)
+def _closure_mask(closure_place_type: tuple) -> int:
+    """Compile the place types closed by place closure into a bitmask.
+
+    """
+    return PlaceType.mask(closure_place_type)
+
+
 class Person:
     """Class to represent each person in a population.
 
@@ -25,8 +34,46 @@ class Person:
         Person's next infection status after current one
     time_of_status_change: int
         Time when person's infection status is updated
+    infectiousness : float
+        Infectiousness set by the last host progression sweep. This is not
+        updated for people whose infectiousness is evaluated lazily, so
+        should be read through :meth:`infectiousness_at`
+    infectiousness_progression : np.ndarray or None
+        Infectiousness scaling by time step since infection, used to
+        evaluate the infectiousness lazily if set
+    cell_index : int
+        Position at which the person was added to their cell
+    isolation_start_time : float or None
+        Time at which case isolation starts, or None if not isolating
+    quarantine_start_time : float or None
+        Time at which household quarantine starts, or None if not
+        quarantining
+    travel_isolation_start_time : float or None
+        Time at which travel isolation starts, or None if not isolating
+    travel_isolated : bool
+        Whether the person has been asked to isolate on arrival
+    travel_end_time : float or None
+        Time at which a traveller leaves, or None if not a traveller
+    distancing_enhanced : bool or None
+        Whether the person follows enhanced social distancing
+    date_vaccinated : float or None
+        Time of vaccination
 
     """
+    # Fields are declared up front, with interventions writing to their
+    # own declared fields, to save the memory of a per-person __dict__.
+    # _index is set by the py2c converter.
+    __slots__ = ("initial_infectiousness", "infectiousness", "microcell",
+                 "infection_status", "household", "places", "place_types",
+                 "_place_type_mask", "next_infection_status",
+                 "time_of_status_change", "infection_start_time",
+                 "infectiousness_progression", "infectiousness_time_step",
+                 "care_home_resident", "key_worker", "date_positive",
+                 "is_vaccinated", "date_vaccinated", "date_vaccine_efficacy",
+                 "cell_index", "age", "age_group", "isolation_start_time",
+                 "quarantine_start_time", "travel_isolation_start_time",
+                 "travel_isolated", "travel_end_time", "distancing_enhanced",
+                 "_index")
 
     def __init__(self, microcell, age_group=None):
         """Constructor Method.
@@ -47,13 +94,25 @@ class Person:
         self.household = None
         self.places = []
         self.place_types = []
+        self._place_type_mask = 0
         self.next_infection_status = None
         self.time_of_status_change = None
         self.infection_start_time = None
+        self.infectiousness_progression = None
+        self.infectiousness_time_step = 1
         self.care_home_resident = False
         self.key_worker = False
         self.date_positive = None
         self.is_vaccinated = False
+        self.date_vaccinated = None
+        self.date_vaccine_efficacy = None
+        self.cell_index = 0
+        self.isolation_start_time = None
+        self.quarantine_start_time = None
+        self.travel_isolation_start_time = None
+        self.travel_isolated = False
+        self.travel_end_time = None
+        self.distancing_enhanced = None
 
         self.set_random_age(age_group)
 
@@ -101,6 +160,37 @@ class Person:
         """
         return str(self.infection_status).startswith('InfectionStatus.Infect')
 
+    def infectiousness_at(self, time: float):
+        """Get the infectiousness of the person at the given time. If the
+        person has an infectiousness progression (lazy infectiousness
+        evaluation), this is computed from their initial infectiousness and
+        the time since their infection started. Otherwise the
+        `infectiousness` attribute is returned.
+
+        Parameters
+        ----------
+        time : float
+            Current simulation time
+
+        Returns
+        -------
+        float
+            Infectiousness of the person
+
+        """
+        if (self.infectiousness_progression is None
+                or self.infection_start_time is None):
+            return self.infectiousness
+        if not self.is_infectious():
+            return 0
+        # Matches eager evaluation, where the infectiousness seen at a time
+        # step was set by the host progression sweep of the step before
+        time_since_infection = max(0, int(
+            (time - self.infectiousness_time_step - self.infection_start_time)
+            / self.infectiousness_time_step))
+        return (self.initial_infectiousness
+                * self.infectiousness_progression[time_since_infection])
+
     def is_susceptible(self):
         """Query if the person is currently susceptible.
 
@@ -138,6 +228,12 @@ class Person:
             self.infection_status, new_status, self.age_group)
         self.infection_status = new_status
 
+        if self.is_symptomatic():
+            self.microcell.cell.add_isolation_candidate(self)
+        elif self.infection_status in [InfectionStatus.Recovered,
+                                       InfectionStatus.Dead]:
+            self.microcell.cell.isolation_candidates.discard(self)
+
         if self.infection_status == InfectionStatus.Susceptible and \
                 self.household is not None:
             self.household.add_susceptible_person(self)
@@ -164,6 +260,7 @@ class Person:
                                  cell")
         self.places.append((place, person_group))
         self.place_types.append(place.place_type)
+        self._place_type_mask |= PlaceType.mask([place.place_type])
 
     def remove_place(self, place):
         """Method to remove person for each associated place, to be
@@ -182,8 +279,18 @@ class Person:
             ind = place_list.index(place)
             self.places.pop(ind)
             self.place_types.pop(ind)
+            # The person may still be in another place of the same type
+            self._place_type_mask = PlaceType.mask(self.place_types)
+
+    @property
+    def place_type_mask(self) -> int:
+        """Bitmask of the types of the places the person is associated
+        with, kept up to date by :meth:`add_place` and :meth:`remove_place`.
+
+        """
+        return self._place_type_mask
 
-    def is_place_closed(self, closure_place_type):
+    def is_place_closed(self, closure_place_type, time=None):
         """Method to check if any of the place in the person's place list
         will be closed based on the place type, to be
         used when place closure intervention is active.
@@ -192,22 +299,37 @@ class Person:
         ----------
         closure_place_type: a list of PlaceType
             PlaceType should be closed if in place closure intervention
+        time : float
+            Current simulation time. If given, places are only closed once
+            the closure of the person's microcell has started
 
         """
-        if (hasattr(self.microcell, 'closure_start_time')) and (
-                self.microcell.closure_start_time is not None):
-            for place_type in self.place_types:
-                if place_type.value in closure_place_type:
-                    return True
-        return False
-
-    def vaccinate(self, time):
+        closure_start_time = self.microcell.closure_start_time
+        if closure_start_time is None or (
+                time is not None and closure_start_time > time):
+            return False
+        return bool(self.place_type_mask &
+                    _closure_mask(tuple(closure_place_type)))
+
+    def vaccinate(self, time, efficacy_delay=None):
         """Used to set a persons vaccination status to vaccinated
         if they are drawn from the vaccine queue.
 
+        Parameters
+        ----------
+        time : float
+            Time of vaccination
+        efficacy_delay : float
+            Time after vaccination at which the vaccine becomes effective.
+            If None, this is drawn when the person is first exposed
+
         """
         self.is_vaccinated = True
         self.date_vaccinated = time
+        if efficacy_delay is None:
+            self.date_vaccine_efficacy = None
+        else:
+            self.date_vaccine_efficacy = time + efficacy_delay
 
     def remove_person(self):
         """Method to remove Person object from population.
@@ -220,6 +342,7 @@ class Person:
         self.microcell.compartment_counter.\
             _increment_compartment(-1, self.infection_status,
                                    self.age_group)
+        self.microcell._update_counts(self.infection_status, -1)
         self.microcell.cell.persons.remove(self)
         self.microcell.persons.remove(self)
         self.household.persons.remove(self)
@@ -18,6 +18,11 @@ class Place:
     which may interact differently (ie workers and visitors).
 
     """
+    # _index is set by the py2c converter
+    __slots__ = ("_location", "persons", "person_groups", "num_person_groups",
+                 "place_type", "susceptibility", "infectiousness",
+                 "initialised", "cell", "microcell", "_index")
+
     def __init__(self, loc: typing.Tuple[float, float],
                  place_type: PlaceType, cell, microcell):
         """Constructor method.
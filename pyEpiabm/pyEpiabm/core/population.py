@@ -1,10 +1,9 @@
 #
 # Population Class
 #
-from queue import PriorityQueue
-
 from .cell import Cell
 from .person import Person
+from ._vaccine_rollout import _VaccineRollout
 
 
 class Population:
@@ -19,7 +18,7 @@ class Population:
 
         """
         self.cells = []
-        self.vaccine_queue = PriorityQueue()
+        self.vaccine_queue = _VaccineRollout()
         self.travellers = []
 
     def __repr__(self):
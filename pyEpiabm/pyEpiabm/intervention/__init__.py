@@ -6,3 +6,4 @@ from .household_quarantine import HouseholdQuarantine
 from .social_distancing import SocialDistancing
 from .vaccination import Vaccination
 from .travel_isolation import TravelIsolation
+from .intervention_scheduler import InterventionScheduler
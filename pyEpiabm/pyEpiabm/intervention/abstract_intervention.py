@@ -68,3 +68,10 @@ class AbstractIntervention:
 
         """
         raise NotImplementedError
+
+    def detach(self):
+        """Remove anything the intervention registered on the population,
+        once the intervention is no longer used.
+
+        """
+        pass
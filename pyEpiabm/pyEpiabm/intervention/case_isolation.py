@@ -2,6 +2,8 @@
 # Case isolation Class
 #
 
+import heapq
+import itertools
 import random
 
 from pyEpiabm.intervention import AbstractIntervention
@@ -12,6 +14,9 @@ class CaseIsolation(AbstractIntervention):
     Isolate symptomatic individual based on the isolation_probability
     and stop isolating isolated individuals after their isolation period
     or after the end of the policy.
+    Only people who have become symptomatic or tested positive (recorded in
+    each cell's `isolation_candidates`) are considered, and isolations are
+    expired from a heap ordered by their end time.
     Detailed description of the implementation can be found in github wiki:
     https://github.com/SABS-R3-Epidemiology/epiabm/wiki/Interventions.
 
@@ -30,6 +35,11 @@ class CaseIsolation(AbstractIntervention):
         self.isolation_delay = isolation_delay
         self.isolation_probability = isolation_probability
         self.use_testing = use_testing
+        # Heap of (isolation end time, counter, person), and the set of
+        # (person, isolation end time) pairs in it
+        self._isolation_ends = []
+        self._queued_ends = set()
+        self._counter = itertools.count()
 
         super(CaseIsolation, self).__init__(population=population, **kwargs)
 
@@ -42,28 +52,63 @@ class CaseIsolation(AbstractIntervention):
             Current simulation time
 
         """
+        # Stop isolating people after their isolation period
+        expired = set()
+        while self._isolation_ends and self._isolation_ends[0][0] < time:
+            end, _, person = heapq.heappop(self._isolation_ends)
+            self._queued_ends.discard((person, end))
+            if person.isolation_start_time is None:
+                continue
+            if person.isolation_start_time + self.isolation_duration == end:
+                person.isolation_start_time = None
+                expired.add(person)
+            else:
+                # Isolation was restarted, so queue its new end time
+                self._push_isolation_end(person)
+
         for cell in self._population.cells:
-            for person in cell.persons:
-                if (hasattr(person, 'isolation_start_time')) and (
-                        person.isolation_start_time is not None):
-                    if time > person.isolation_start_time + self.\
-                              isolation_duration:
-                        # Stop isolating people after their isolation period
-                        person.isolation_start_time = None
-                else:
-                    if self.person_selection_method(person):
-                        r = random.random()
-                        # Require symptomatic individuals to self-isolate
-                        # with given probability
-                        if r < self.isolation_probability:
-                            person.isolation_start_time = time + self.\
-                                                          isolation_delay
-                            if person.date_positive is not None:
-                                self._population.test_isolate_count = [0, 0]
-                                if person.is_symptomatic():
-                                    self._population.test_isolate_count[0] += 1
-                                else:
-                                    self._population.test_isolate_count[1] += 1
+            cell.expire_isolation_events(time)
+            # Consider candidates in cell order so runs are reproducible
+            for person in sorted(cell.isolation_candidates,
+                                 key=lambda p: p.cell_index):
+                if not self.person_selection_method(person):
+                    cell.isolation_candidates.discard(person)
+                    continue
+                if person in expired or (
+                        person.isolation_start_time
+                        is not None):
+                    continue
+                r = random.random()
+                # Require symptomatic individuals to self-isolate
+                # with given probability
+                if r < self.isolation_probability:
+                    person.isolation_start_time = time + self.\
+                                                  isolation_delay
+                    self._push_isolation_end(person)
+                    cell.schedule_isolation(person)
+                    if person.date_positive is not None:
+                        self._population.test_isolate_count = [0, 0]
+                        if person.is_symptomatic():
+                            self._population.test_isolate_count[0] += 1
+                        else:
+                            self._population.test_isolate_count[1] += 1
+
+    def _push_isolation_end(self, person):
+        """Add the end of a person's isolation to the heap of isolation
+        end times, unless it is already queued.
+
+        Parameters
+        ----------
+        person : Person
+            Isolating person
+
+        """
+        end = person.isolation_start_time + self.isolation_duration
+        if (person, end) in self._queued_ends:
+            return
+        self._queued_ends.add((person, end))
+        heapq.heappush(self._isolation_ends,
+                       (end, next(self._counter), person))
 
     def person_selection_method(self, person):
         """ Method to determine whether a person is eligible for isolation
@@ -92,8 +137,7 @@ class CaseIsolation(AbstractIntervention):
         """Turn off intervention after intervention stops being active.
 
         """
-        for cell in self._population.cells:
-            for person in cell.persons:
-                if (hasattr(person, 'isolation_start_time')) and (
-                        person.isolation_start_time is not None):
-                    person.isolation_start_time = None
+        while self._isolation_ends:
+            _, _, person = heapq.heappop(self._isolation_ends)
+            person.isolation_start_time = None
+        self._queued_ends.clear()
@@ -2,7 +2,7 @@
 # Gives people a positive or negatie test status
 #
 
-import random
+import numpy as np
 
 from pyEpiabm.intervention import AbstractIntervention
 
@@ -10,6 +10,8 @@ from pyEpiabm.intervention import AbstractIntervention
 class DiseaseTesting(AbstractIntervention):
     """ Class to move through testing queue and assign
     positive test results depending on true/false positive rates.
+    Tests are taken from the queues up to the testing capacity, either in
+    each cell or pooled nationally, and all results are drawn at once.
     Detailed description of the implementation can be found in github wiki:
     https://github.com/SABS-R3-Epidemiology/epiabm/wiki/Interventions#testing
 
@@ -20,11 +22,38 @@ class DiseaseTesting(AbstractIntervention):
                  false_positive,
                  false_negative,
                  population,
+                 capacity_scope="cell",
+                 prioritise_symptomatic=False,
                  **kwargs
                  ):
+        """Set the parameters of disease testing.
+
+        Parameters
+        ----------
+        testing_capacity : list
+            Number of PCR and LFT tests available per time step
+        false_positive : list
+            False positive rate of PCR tests and LFTs
+        false_negative : list
+            False negative rate of PCR tests and LFTs
+        population : Population
+            Population: :class:`Population` to bind
+        capacity_scope : str
+            Whether the testing capacity applies to each "cell" or is pooled
+            across the "national" population
+        prioritise_symptomatic : bool
+            Whether symptomatic people are tested first when capacity is
+            pooled nationally
+
+        """
+        if capacity_scope not in ("cell", "national"):
+            raise ValueError(f"Unknown capacity_scope '{capacity_scope}', "
+                             "must be 'cell' or 'national'")
         self.testing_capacity = testing_capacity
         self.false_positive = false_positive
         self.false_negative = false_negative
+        self.capacity_scope = capacity_scope
+        self.prioritise_symptomatic = prioritise_symptomatic
 
         population.test_count = [0, 0]
 
@@ -39,19 +68,98 @@ class DiseaseTesting(AbstractIntervention):
             Current simulation time
 
         """
-        for cell in self._population.cells:
-            num_pcr = 0
-            num_lft = 0
-            while (num_pcr < self.testing_capacity[0] and not
-                   cell.PCR_queue.empty()):
-                person = cell.PCR_queue.get()
-                num_pcr += 1
-                self.do_testing(time, person, 0)
-            while (num_lft < self.testing_capacity[1] and not
-                   cell.LFT_queue.empty()):
-                person = cell.LFT_queue.get()
-                num_lft += 1
-                self.do_testing(time, person, 1)
+        people = []
+        test_types = []
+        if self.capacity_scope == "cell":
+            for cell in self._population.cells:
+                for index, queue in enumerate([cell.PCR_queue,
+                                               cell.LFT_queue]):
+                    tested = queue.drain(self.testing_capacity[index])
+                    people.extend(tested)
+                    test_types.extend([index] * len(tested))
+        else:
+            for index, name in enumerate(["PCR_queue", "LFT_queue"]):
+                tested = self._select_national(name,
+                                               self.testing_capacity[index])
+                people.extend(tested)
+                test_types.extend([index] * len(tested))
+        self.do_batch_testing(time, people, test_types)
+
+    def _select_national(self, queue_name, capacity):
+        """Take people from one type of testing queue across all cells, up
+        to the national capacity. Cells are visited in order, unless
+        symptomatic people are prioritised, in which case everyone waiting
+        is considered and those not tested are returned to their queue.
+
+        Parameters
+        ----------
+        queue_name : str
+            Name of the cell attribute holding the queue
+        capacity : int
+            Number of tests available
+
+        Returns
+        -------
+        list
+            People to test
+
+        """
+        queues = [getattr(cell, queue_name) for cell in self._population.cells]
+        if not self.prioritise_symptomatic:
+            tested = []
+            for queue in queues:
+                if len(tested) >= capacity:
+                    break
+                tested.extend(queue.drain(capacity - len(tested)))
+            return tested
+
+        waiting = [(queue, person) for queue in queues
+                   for person in queue.drain()]
+        # Stable sort, so order within each group is kept
+        order = sorted(range(len(waiting)),
+                       key=lambda i: not waiting[i][1].is_symptomatic())
+        selected = set(order[:capacity])
+        for i, (queue, person) in enumerate(waiting):
+            if i not in selected:
+                queue.put(person)
+        return [waiting[i][1] for i in order[:capacity]]
+
+    def do_batch_testing(self, time, people, test_types):
+        """ Method to determine which of a group of people test positive
+        depending on the false positive and false negative rates for
+        PCR tests (type 0) or LFTs (type 1). All results are drawn in a
+        single call.
+
+        Parameters
+        ----------
+        time : float
+            Current simulation time
+        people : list
+            People to test
+        test_types : list
+            Type of test for each person, 0 for PCR and 1 for LFT
+
+        """
+        n = len(people)
+        if n == 0:
+            return
+        test_types = np.asarray(test_types, dtype=int)
+        infectious = np.fromiter((person.is_infectious() for person in people),
+                                 dtype=bool, count=n)
+        r = np.random.random(n)
+        positive = np.where(
+            infectious,
+            r > np.asarray(self.false_negative)[test_types],
+            r < np.asarray(self.false_positive)[test_types])
+
+        true_positive = int(np.sum(positive & infectious))
+        self._population.test_count[0] += true_positive
+        self._population.test_count[1] += int(np.sum(positive)) - \
+            true_positive
+        for i in np.flatnonzero(positive):
+            person = people[i]
+            person.date_positive = time
+            person.microcell.cell.add_isolation_candidate(person)
 
     def do_testing(self, time, person, index):
         """ Method to detemine whether an individual tests positive
@@ -68,15 +176,7 @@ class DiseaseTesting(AbstractIntervention):
             To indicate whether test is PCR or LFT
 
         """
-        r = random.random()
-        if person.is_infectious():
-            if r > self.false_negative[index]:
-                person.date_positive = time
-                self._population.test_count[0] += 1
-        else:
-            if r < self.false_positive[index]:
-                person.date_positive = time
-                self._population.test_count[1] += 1
+        self.do_batch_testing(time, [person], [index])
 
     def turn_off(self):
         """Turn off intervention after intervention stops being active.
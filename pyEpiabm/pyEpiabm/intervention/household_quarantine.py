@@ -2,6 +2,8 @@
 # Household quarantine Class
 #
 
+import heapq
+import itertools
 import random
 
 from pyEpiabm.intervention import AbstractIntervention
@@ -13,6 +15,9 @@ class HouseholdQuarantine(AbstractIntervention):
     stay home based on the household and individual compliance, if
     intervention is active. Quarantine stops after the quarantine period
     or after the end of the policy.
+    Households are only considered when one of their members starts
+    isolating (from each cell's `isolation_events`), and quarantines are
+    expired from a heap ordered by their end time.
     Detailed description of the implementation can be found in github wiki:
     https://github.com/SABS-R3-Epidemiology/epiabm/wiki/Interventions.
     """
@@ -30,6 +35,11 @@ class HouseholdQuarantine(AbstractIntervention):
         self.quarantine_delay = quarantine_delay
         self.quarantine_house_compliant = quarantine_house_compliant
         self.quarantine_individual_compliant = quarantine_individual_compliant
+        # Heap of (quarantine end time, counter, person), and the set of
+        # (person, quarantine end time) pairs in it
+        self._quarantine_ends = []
+        self._queued_ends = set()
+        self._counter = itertools.count()
 
         # start_time, policy_duration, threshold, population
         super(HouseholdQuarantine, self).__init__(population=population,
@@ -44,39 +54,77 @@ class HouseholdQuarantine(AbstractIntervention):
             Current simulation time
 
         """
+        while self._quarantine_ends and self._quarantine_ends[0][0] < time:
+            end, _, person = heapq.heappop(self._quarantine_ends)
+            self._queued_ends.discard((person, end))
+            if person.quarantine_start_time is None:
+                continue
+            if person.quarantine_start_time + self.quarantine_duration == end:
+                # Stop quarantine after quarantine period
+                person.quarantine_start_time = None
+            else:
+                # Quarantine was restarted, so queue its new end time
+                self._push_quarantine_end(person)
+
         for cell in self._population.cells:
-            for person in cell.persons:
-                if (hasattr(person, 'quarantine_start_time')) and (
-                        person.quarantine_start_time is not None):
-                    if time > person.quarantine_start_time + self.\
-                              quarantine_duration:
-                        # Stop quarantine after quarantine period
-                        person.quarantine_start_time = None
-
-                if (hasattr(person, 'isolation_start_time')) and (
-                        person.isolation_start_time == time):
-                    # Require household of symptomatic/isolating individuals to
-                    # quarantine with given household compliance and individual
-                    # compliance. Only check when infector starts its isolation
-                    # in order to prevent resetting. Start time is reset when
-                    # new person in household becomes an infector.
-                    r_house = random.random()
-                    if r_house < self.quarantine_house_compliant:
-                        for household_person in person.household.persons:
-                            if household_person != person:
-                                r_indiv = random.random()
-                                if r_indiv < \
-                                        self.quarantine_individual_compliant:
-                                    household_person.\
-                                        quarantine_start_time = \
-                                        time + self.quarantine_delay
+            events = cell.isolation_events
+            while events and events[0][0] <= time:
+                start, _, person = heapq.heappop(events)
+                if (start != time or
+                        person.isolation_start_time
+                        != time):
+                    continue
+                # Require household of symptomatic/isolating individuals to
+                # quarantine with given household compliance and individual
+                # compliance. Only check when infector starts its isolation
+                # in order to prevent resetting. Start time is reset when
+                # new person in household becomes an infector.
+                r_house = random.random()
+                if r_house < self.quarantine_house_compliant:
+                    for household_person in person.household.persons:
+                        if household_person != person:
+                            r_indiv = random.random()
+                            if r_indiv < \
+                                    self.quarantine_individual_compliant:
+                                self._start_quarantine(household_person,
+                                                       time)
+
+    def _start_quarantine(self, person, time):
+        """Start quarantine of a person after the quarantine delay.
+
+        Parameters
+        ----------
+        person : Person
+            Person to quarantine
+        time : float
+            Current simulation time
+
+        """
+        person.quarantine_start_time = time + self.quarantine_delay
+        self._push_quarantine_end(person)
+
+    def _push_quarantine_end(self, person):
+        """Add the end of a person's quarantine to the heap of quarantine
+        end times, unless it is already queued.
+
+        Parameters
+        ----------
+        person : Person
+            Quarantining person
+
+        """
+        end = person.quarantine_start_time + self.quarantine_duration
+        if (person, end) in self._queued_ends:
+            return
+        self._queued_ends.add((person, end))
+        heapq.heappush(self._quarantine_ends,
+                       (end, next(self._counter), person))
 
     def turn_off(self):
         """Turn off intervention after intervention stops being active.
 
         """
-        for cell in self._population.cells:
-            for person in cell.persons:
-                if (hasattr(person, 'quarantine_start_time')) and (
-                        person.quarantine_start_time is not None):
-                    person.quarantine_start_time = None
+        while self._quarantine_ends:
+            _, _, person = heapq.heappop(self._quarantine_ends)
+            person.quarantine_start_time = None
+        self._queued_ends.clear()
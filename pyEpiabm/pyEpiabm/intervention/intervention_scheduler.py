@@ -0,0 +1,96 @@
+#
+# Schedules interventions according to their activation windows
+#
+
+import heapq
+
+
+class InterventionScheduler:
+    """Class to decide which interventions run at each time step.
+    Interventions are indexed by their start times, so those whose policy
+    has not started are not visited, and each one is dropped from the
+    schedule (turned off if needed, and detached) once its policy duration
+    has passed.
+    The number of cases used for the case thresholds is computed once per
+    time step and shared between interventions.
+
+    """
+
+    def __init__(self, population):
+        """Constructor Method.
+
+        Parameters
+        ----------
+        population : Population
+            Population: :class:`Population` the interventions act on
+
+        """
+        self._population = population
+        # Registered interventions and their activity status
+        self.active_status = {}
+        # Heap of (start time, registration index, intervention) for
+        # interventions whose policy has not started yet
+        self._pending = []
+        # Interventions within their policy window, by registration index
+        self._open = {}
+
+    def add_intervention(self, intervention):
+        """Register an intervention. The start time and policy duration of
+        the intervention are read when its policy starts.
+
+        Parameters
+        ----------
+        intervention : AbstractIntervention
+            Intervention to schedule
+
+        """
+        heapq.heappush(self._pending, (intervention.start_time,
+                                       len(self.active_status), intervention))
+        self.active_status[intervention] = False
+
+    def number_of_cases(self):
+        """Get the number of infectious people in the population.
+
+        Returns
+        -------
+        int
+            Total number of infectious people
+
+        """
+        return sum(cell.number_infectious() for cell in self._population.cells)
+
+    def __call__(self, time: float):
+        """Run the interventions which are active at this time, and turn
+        off interventions which are no longer active. Interventions run in
+        the order they were registered.
+
+        Parameters
+        ----------
+        time : float
+            Simulation time
+
+        """
+        while self._pending and self._pending[0][0] <= time:
+            _, index, intervention = heapq.heappop(self._pending)
+            self._open[index] = intervention
+        if not self._open:
+            return
+
+        num_cases = self.number_of_cases()
+        for index in sorted(self._open):
+            intervention = self._open[index]
+            if intervention.start_time + intervention.policy_duration < time:
+                # Policy has ended, so this intervention is never active again
+                del self._open[index]
+                active = False
+            else:
+                active = intervention.is_active(time, num_cases)
+
+            if active:
+                intervention(time)
+                self.active_status[intervention] = True
+            elif self.active_status[intervention]:
+                self.active_status[intervention] = False
+                intervention.turn_off()
+            if index not in self._open:
+                intervention.detach()
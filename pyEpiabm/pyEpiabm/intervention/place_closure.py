@@ -2,6 +2,8 @@
 # Place closure Class
 #
 
+import functools
+
 from pyEpiabm.intervention import AbstractIntervention
 
 
@@ -10,6 +12,9 @@ class PlaceClosure(AbstractIntervention):
     Close specific types of places based on the number of infectious persons
     in their microcells and reopen places after their closure period or
     after the end of the policy.
+    Microcells report when their number of infectious persons crosses the
+    threshold, so only microcells above the threshold or with closed
+    places are visited each time step.
     Detailed description of the implementation can be found in github wiki:
     https://github.com/SABS-R3-Epidemiology/epiabm/wiki/Interventions.
     """
@@ -25,9 +30,24 @@ class PlaceClosure(AbstractIntervention):
         self.closure_duration = closure_duration
         self.closure_delay = closure_delay
         self.case_microcell_threshold = case_microcell_threshold
+        # Microcells above the threshold and microcells with closed places,
+        # keyed by their position in the population
+        self._above_threshold = {}
+        self._closed = {}
         super(PlaceClosure, self).__init__(population=population,
                                            **kwargs)
 
+        # Callbacks registered on each microcell, removed by detach
+        self._callbacks = []
+        index = 0
+        for cell in self._population.cells:
+            for microcell in cell.microcells:
+                callback = functools.partial(self._threshold_crossed, index)
+                microcell.add_threshold_callback(
+                    self.case_microcell_threshold, callback)
+                self._callbacks.append((microcell, callback))
+                index += 1
+
     def __call__(self, time):
         """Run place closure intervention.
 
@@ -37,19 +57,44 @@ class PlaceClosure(AbstractIntervention):
             Current simulation time
 
         """
-        for cell in self._population.cells:
-            for microcell in cell.microcells:
-                if (hasattr(microcell, 'closure_start_time')) and (
-                        microcell.closure_start_time is not None):
-                    if time > microcell.closure_start_time + self.\
-                              closure_duration:
-                        # Reopen places after their closure period
-                        microcell.closure_start_time = None
-                else:
-                    if (microcell.count_infectious() >= self.
-                            case_microcell_threshold):
-                        microcell.closure_start_time = time + self.\
-                                                        closure_delay
+        reopened = set()
+        for index, microcell in list(self._closed.items()):
+            if microcell.closure_start_time is None:
+                del self._closed[index]
+            elif time > microcell.closure_start_time + self.\
+                    closure_duration:
+                # Reopen places after their closure period
+                microcell.closure_start_time = None
+                del self._closed[index]
+                reopened.add(index)
+
+        for index in sorted(self._above_threshold):
+            microcell = self._above_threshold[index]
+            if index in reopened or (
+                    microcell.closure_start_time
+                    is not None):
+                continue
+            microcell.closure_start_time = time + self.closure_delay
+            self._closed[index] = microcell
+
+    def _threshold_crossed(self, index, microcell, above):
+        """Record whether a microcell has at least the threshold number of
+        infectious persons.
+
+        Parameters
+        ----------
+        index : int
+            Position of the microcell in the population
+        microcell : Microcell
+            Microcell whose infectious count crossed the threshold
+        above : bool
+            Whether the count is now at or above the threshold
+
+        """
+        if above:
+            self._above_threshold[index] = microcell
+        else:
+            self._above_threshold.pop(index, None)
 
     def turn_off(self):
         """Turn off intervention after intervention stops being active.
@@ -57,6 +102,15 @@ class PlaceClosure(AbstractIntervention):
         """
         for cell in self._population.cells:
             for microcell in cell.microcells:
-                if (hasattr(microcell, 'closure_start_time')) and (
-                        microcell.closure_start_time is not None):
+                if microcell.closure_start_time is not None:
                     microcell.closure_start_time = None
+        self._closed.clear()
+
+    def detach(self):
+        """Remove the threshold callbacks from the microcells.
+
+        """
+        for microcell, callback in self._callbacks:
+            microcell.remove_threshold_callback(callback)
+        self._callbacks.clear()
+        self._above_threshold.clear()
@@ -2,6 +2,7 @@
 # Social Distancing Intervention
 #
 
+import functools
 import random
 
 from pyEpiabm.core import Parameters
@@ -16,6 +17,9 @@ class SocialDistancing(AbstractIntervention):
     by the age group (with probability to take enhanced social distancing).
     Social distancing is stopped after the distancing period or
     after the end of the policy.
+    Microcells report when their number of infectious persons crosses the
+    threshold, so only microcells above the threshold or distancing are
+    visited each time step.
     Detailed description of the implementation can be found in github wiki:
     https://github.com/SABS-R3-Epidemiology/epiabm/wiki/Interventions.
     """
@@ -33,9 +37,24 @@ class SocialDistancing(AbstractIntervention):
         self.distancing_delay = distancing_delay
         self.case_microcell_threshold = case_microcell_threshold
         self.distancing_enhanced_prob = distancing_enhanced_prob
+        # Microcells above the threshold and microcells distancing, keyed by
+        # their position in the population
+        self._above_threshold = {}
+        self._distancing = {}
         super(SocialDistancing, self).__init__(population=population,
                                                **kwargs)
 
+        # Callbacks registered on each microcell, removed by detach
+        self._callbacks = []
+        index = 0
+        for cell in self._population.cells:
+            for microcell in cell.microcells:
+                callback = functools.partial(self._threshold_crossed, index)
+                microcell.add_threshold_callback(
+                    self.case_microcell_threshold, callback)
+                self._callbacks.append((microcell, callback))
+                index += 1
+
     def __call__(self, time):
         """Run social distancing intervention.
 
@@ -45,29 +64,54 @@ class SocialDistancing(AbstractIntervention):
             Current simulation time
 
         """
-        for cell in self._population.cells:
-            for microcell in cell.microcells:
-                if (hasattr(microcell, 'distancing_start_time')) and (
-                        microcell.distancing_start_time is not None):
-                    if time > microcell.distancing_start_time + self.\
-                              distancing_duration:
-                        # Stop social distancing after their distancing period
-                        microcell.distancing_start_time = None
+        stopped = set()
+        for index, microcell in list(self._distancing.items()):
+            if microcell.distancing_start_time is None:
+                del self._distancing[index]
+            elif time > microcell.distancing_start_time + self.\
+                    distancing_duration:
+                # Stop social distancing after their distancing period
+                microcell.distancing_start_time = None
+                del self._distancing[index]
+                stopped.add(index)
+
+        for index in sorted(self._above_threshold):
+            microcell = self._above_threshold[index]
+            if index in stopped or (
+                    microcell.distancing_start_time
+                    is not None):
+                continue
+            microcell.distancing_start_time = time + self.distancing_delay
+            self._distancing[index] = microcell
+            for person in microcell.persons:
+                if Parameters.instance().use_ages:
+                    r_age = random.random()
+                    if r_age < self.distancing_enhanced_prob[
+                                person.age_group]:
+                        person.distancing_enhanced = True
+                    else:
+                        person.distancing_enhanced = False
                 else:
-                    if microcell.count_infectious() >= self.\
-                                case_microcell_threshold:
-                        microcell.distancing_start_time = time + self.\
-                                                        distancing_delay
-                        for person in microcell.persons:
-                            if Parameters.instance().use_ages:
-                                r_age = random.random()
-                                if r_age < self.distancing_enhanced_prob[
-                                            person.age_group]:
-                                    person.distancing_enhanced = True
-                                else:
-                                    person.distancing_enhanced = False
-                            else:
-                                person.distancing_enhanced = False
+                    person.distancing_enhanced = False
+
+    def _threshold_crossed(self, index, microcell, above):
+        """Record whether a microcell has at least the threshold number of
+        infectious persons.
+
+        Parameters
+        ----------
+        index : int
+            Position of the microcell in the population
+        microcell : Microcell
+            Microcell whose infectious count crossed the threshold
+        above : bool
+            Whether the count is now at or above the threshold
+
+        """
+        if above:
+            self._above_threshold[index] = microcell
+        else:
+            self._above_threshold.pop(index, None)
 
     def turn_off(self):
         """Turn off intervention after intervention stops being active.
@@ -75,6 +119,15 @@ class SocialDistancing(AbstractIntervention):
         """
         for cell in self._population.cells:
             for microcell in cell.microcells:
-                if (hasattr(microcell, 'distancing_start_time')) and (
-                        microcell.distancing_start_time is not None):
+                if microcell.distancing_start_time is not None:
                     microcell.distancing_start_time = None
+        self._distancing.clear()
+
+    def detach(self):
+        """Remove the threshold callbacks from the microcells.
+
+        """
+        for microcell, callback in self._callbacks:
+            microcell.remove_threshold_callback(callback)
+        self._callbacks.clear()
+        self._above_threshold.clear()
@@ -17,6 +17,7 @@ class Vaccination(AbstractIntervention):
         self,
         daily_doses,
         population,
+        time_to_efficacy=0,
         **kwargs
     ):
         """Set the parameters for vaccinations.
@@ -25,9 +26,12 @@ class Vaccination(AbstractIntervention):
         ----------
         daily_doses : int
             Number of vaccine doses administered per day nationwide
+        time_to_efficacy : float
+            Mean number of days until a vaccine becomes effective
 
         """
         self.daily_doses = daily_doses
+        self.time_to_efficacy = time_to_efficacy
 
         # kwargs read in by this method are: start_time, policy_duration,
         # and case_threshold
@@ -35,7 +39,8 @@ class Vaccination(AbstractIntervention):
 
     def __call__(self, time):
         """Move down the priority queue removing people and
-        vaccinating them.
+        vaccinating them. The whole day's doses are taken from the rollout
+        plan at once.
 
         Parameters
         ----------
@@ -43,12 +48,8 @@ class Vaccination(AbstractIntervention):
             Current simulation time
 
         """
-        number_vaccinated = 0
-        while (number_vaccinated < self.daily_doses
-                and not self._population.vaccine_queue.empty()):
-            person = self._population.vaccine_queue.get()[2]
-            person.vaccinate(time)
-            number_vaccinated += 1
+        self._population.vaccine_queue.vaccinate_next(
+            self.daily_doses, time, self.time_to_efficacy)
 
     def turn_off(self):
         # empty function since, unlike non-pharmaceutical interventions, if
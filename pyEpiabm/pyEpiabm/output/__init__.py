@@ -12,3 +12,4 @@ from ._csv_dict_writer import _CsvDictWriter
 from ._csv_writer import _CsvWriter
 from .new_cases_writer import NewCasesWriter
 from .age_stratified_new_cases_writer import AgeStratifiedNewCasesWriter
+from .sparse_output_reader import read_sparse_output, sparse_output_to_array
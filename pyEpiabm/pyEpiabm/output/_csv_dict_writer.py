@@ -5,6 +5,7 @@
 import csv
 import typing
 import os
+import shutil
 
 from pyEpiabm.output.abstract_reporter import AbstractReporter
 
@@ -52,3 +53,32 @@ class _CsvDictWriter(AbstractReporter):
 
         """
         self.writer.writerow(row)
+
+    def flush(self):
+        """Writes any buffered data to file.
+
+        """
+        self.f.flush()
+
+    def branch(self, folder: str):
+        """Copies the file written so far into another folder, and
+        continues writing to the copy. Used to give each scenario branching
+        from a simulation its own output.
+
+        Parameters
+        ----------
+        folder : str
+            Output folder path of the copy
+
+        """
+        self.f.flush()
+        super().__init__(folder)
+        path = os.path.join(folder, os.path.basename(self.f.name))
+        if os.path.abspath(path) == os.path.abspath(self.f.name):
+            raise ValueError("Cannot branch output into the file it is "
+                             + "copied from")
+        shutil.copyfile(self.f.name, path)
+        self.f.close()
+        self.f = open(path, 'a')
+        self.writer = csv.DictWriter(
+            self.f, fieldnames=self.writer.fieldnames, delimiter=',')
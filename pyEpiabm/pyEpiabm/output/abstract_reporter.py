@@ -43,3 +43,16 @@ class AbstractReporter:
 
         """
         raise NotImplementedError
+
+    def flush(self):
+        """Write any buffered data to file.
+
+        """
+        pass
+
+    def branch(self, folder: str):
+        """Continue writing to a copy of the data written so far in another
+        folder.
+
+        """
+        raise NotImplementedError
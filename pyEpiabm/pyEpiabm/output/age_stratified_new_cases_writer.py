@@ -8,21 +8,25 @@ class AgeStratifiedNewCasesWriter(_CsvWriter):
 
     """
 
-    def __init__(self, folder: str):
+    def __init__(self, folder: str, window: float = 1):
         """ Constructor method.
 
         Parameters
         ----------
         folder : str
             Absolute path to folder to store results
+        window : float
+            Length of the time window (in days) over which new cases are
+            counted at each write, defaults to one day
         """
+        self.window = window
         super().__init__(
             folder, 'age_stratified_new_cases.csv',
             ['t', 'cell', 'age_group', 'new_cases'], False)
 
     def write(self, t: float, population: Population):
-        """ Write method - write daily new cases split
-         by age group in population to file.
+        """ Write method - write new cases within the time window ending
+         at t split by age group in population to file.
 
         Parameters
         ----------
@@ -32,13 +36,7 @@ class AgeStratifiedNewCasesWriter(_CsvWriter):
             Population to record
         """
         for cell in population.cells:
-            new_cases = {}
-            for person in cell.persons:
-                if (person.infection_start_time is not None
-                   and person.infection_start_time > (t-1)):
-                    if person.age_group in new_cases:
-                        new_cases[person.age_group] += 1
-                    else:
-                        new_cases[person.age_group] = 1
-            for age_group, cases in new_cases.items():
-                super().write([t, cell.id, age_group, cases])
+            new_cases = cell.new_case_counter.retrieve(t - self.window, t)
+            for age_group, cases in enumerate(new_cases):
+                if cases > 0:
+                    super().write([t, cell.id, age_group, cases])
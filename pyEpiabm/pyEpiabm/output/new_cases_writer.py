@@ -6,21 +6,26 @@ class NewCasesWriter(_CsvWriter):
     """ Writer for collecting number of daily new cases
     """
 
-    def __init__(self, folder: str):
+    def __init__(self, folder: str, window: float = 1):
         """ Constructor method
 
         Parameters
         ----------
         folder : str
             Absolute path to folder to store results
+        window : float
+            Length of the time window (in days) over which new cases are
+            counted at each write, defaults to one day
         """
+        self.window = window
         super().__init__(
             folder, 'new_cases.csv',
             ['t', 'cell', 'new_cases'], False)
 
     def write(self, t: float, population: Population):
         """ Write method
-        Write daily new cases from population to file
+        Write new cases within the time window ending at t from population
+        to file
 
         Parameters
         ----------
@@ -30,9 +35,5 @@ class NewCasesWriter(_CsvWriter):
             Population to record
         """
         for cell in population.cells:
-            new_cases = 0
-            for person in cell.persons:
-                if person.infection_start_time is not None and \
-                   person.infection_start_time > (t-1):
-                    new_cases += 1
-            super().write([t, cell.id, new_cases])
+            new_cases = cell.new_case_counter.retrieve(t - self.window, t)
+            super().write([t, cell.id, sum(new_cases)])
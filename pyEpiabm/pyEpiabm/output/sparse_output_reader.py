@@ -0,0 +1,91 @@
+#
+# Reconstruct dense compartment outputs from sparse (delta) output files
+#
+
+import typing
+import numpy as np
+import pandas as pd
+
+_TIME_COLUMNS = ["time", "timestep"]
+_KEY_COLUMNS = ["cell", "location_x", "location_y", "age_group"]
+
+
+def read_sparse_output(filename: str,
+                       times: typing.Iterable = None) -> pd.DataFrame:
+    """Reads a compartment output file written with sparse output, where rows
+    are only present when their counts changed (or on keyframes), and
+    reconstructs the dense output by carrying each row forward until the
+    next row for the same cell and age group. Files written in dense mode
+    are returned unchanged.
+
+    Both pyEpiabm (`time` column) and cEpiabm (`timestep` column) outputs
+    are supported. Rows are identified by whichever of the `cell`,
+    `location_x`, `location_y` and `age_group` columns are present.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the output .csv file
+    times : typing.Iterable
+        Times to output. Defaults to all times present in the file. Times
+        at which no count changed and which are not keyframes are only
+        restored if listed here
+
+    Returns
+    -------
+    pd.DataFrame
+        Dense output, sorted by time and then by key columns
+
+    """
+    df = pd.read_csv(filename)
+    time_col = next((c for c in _TIME_COLUMNS if c in df.columns), None)
+    if time_col is None:
+        raise ValueError(f"No time column found in {filename}")
+    key_cols = [c for c in _KEY_COLUMNS if c in df.columns]
+
+    all_times = set(df[time_col])
+    if times is not None:
+        all_times.update(times)
+    all_times = sorted(all_times)
+
+    if key_cols:
+        keys = list(df[key_cols].drop_duplicates().itertuples(index=False))
+        index = pd.MultiIndex.from_tuples(
+            [(t, *k) for k in keys for t in all_times],
+            names=[time_col] + key_cols)
+        dense = df.set_index([time_col] + key_cols).reindex(index)
+        dense = dense.groupby(level=key_cols, sort=False).ffill()
+        dense = dense.reset_index().sort_values([time_col] + key_cols)
+    else:
+        dense = df.set_index(time_col).reindex(all_times).ffill()
+        dense = dense.reset_index().rename(columns={"index": time_col})
+
+    # Keys which are absent before their first row have no counts yet
+    count_cols = [c for c in df.columns if c not in [time_col] + key_cols]
+    dense[count_cols] = dense[count_cols].fillna(0).astype(
+        df[count_cols].dtypes)
+    return dense[df.columns].reset_index(drop=True)
+
+
+def sparse_output_to_array(dense: pd.DataFrame) -> np.ndarray:
+    """Converts a dense output, as returned by :func:`read_sparse_output`,
+    into an array of compartment counts.
+
+    Parameters
+    ----------
+    dense : pd.DataFrame
+        Dense output with one row per time and key
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (number of times, number of keys, number of
+        compartments). Keys are ordered as in the sorted dataframe
+
+    """
+    time_col = next(c for c in _TIME_COLUMNS if c in dense.columns)
+    key_cols = [c for c in _KEY_COLUMNS if c in dense.columns]
+    count_cols = [c for c in dense.columns
+                  if c not in [time_col] + key_cols]
+    n_times = dense[time_col].nunique()
+    return dense[count_cols].to_numpy().reshape(n_times, -1, len(count_cols))
@@ -34,13 +34,12 @@ class HouseholdInfection:
         closure_inf = Parameters.instance().\
             intervention_params['place_closure'][
                 'closure_household_infectiousness'] \
-            if (hasattr(infector.microcell, 'closure_start_time')) and (
-                infector.is_place_closed(
-                    Parameters.instance().intervention_params[
-                        'place_closure']['closure_place_type'])) and (
-                            infector.microcell.closure_start_time <= time
-                        ) else 1
-        household_infectiousness = infector.infectiousness * closure_inf
+            if (infector.microcell.closure_start_time
+                is not None) and infector.is_place_closed(
+                Parameters.instance().intervention_params[
+                    'place_closure']['closure_place_type'], time) else 1
+        household_infectiousness = infector.infectiousness_at(time) \
+            * closure_inf
         return household_infectiousness
 
     @staticmethod
@@ -66,8 +65,7 @@ class HouseholdInfection:
         """
         household_susceptibility = PersonalInfection.person_susc(
             infector, infectee, time)
-        if (hasattr(infector.microcell, 'distancing_start_time')) and (
-                infector.microcell.distancing_start_time is not None) and (
+        if (infector.microcell.distancing_start_time is not None) and (
                     infector.microcell.distancing_start_time <= time):
             if infector.distancing_enhanced is True:
                 household_susceptibility *= Parameters.instance().\
@@ -111,20 +109,17 @@ class HouseholdInfection:
         travel_isolation_scale = Parameters.instance().\
             intervention_params['travel_isolation']['isolation_house'
                                                     '_effectiveness'] \
-            if (hasattr(infector, 'travel_isolation_start_time')) and (
-                infector.travel_isolation_start_time is not None) and (
+            if (infector.travel_isolation_start_time is not None) and (
                     infector.travel_isolation_start_time <= time) else 1
         isolation_scale = Parameters.instance().\
             intervention_params['case_isolation']['isolation_house'
                                                   '_effectiveness'] \
-            if (hasattr(infector, 'isolation_start_time')) and (
-                infector.isolation_start_time is not None) and (
+            if (infector.isolation_start_time is not None) and (
                     infector.isolation_start_time <= time) else 1
         quarantine_scale = Parameters.instance().\
             intervention_params['household_quarantine']['quarantine_house'
                                                         '_effectiveness'] \
-            if (hasattr(infectee, 'quarantine_start_time')) and (
-                infectee.quarantine_start_time is not None) and (
+            if (infectee.quarantine_start_time is not None) and (
                     infectee.quarantine_start_time <= time) else 1
         vacc_inf_drop = 1
         if infector.is_vaccinated:
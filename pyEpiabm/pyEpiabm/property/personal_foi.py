@@ -27,7 +27,7 @@ class PersonalInfection:
             Infectiousness parameter of person
 
         """
-        infector_inf = infector.infectiousness
+        infector_inf = infector.infectiousness_at(time)
         if infector.is_vaccinated:
             params = Parameters.instance().\
                 intervention_params['vaccine_params']
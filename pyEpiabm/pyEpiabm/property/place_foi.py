@@ -44,12 +44,10 @@ class PlaceInfection:
         except IndexError:  # For place types not in parameters
             num_groups = 1
         # Use group-wise capacity not max_capacity once implemented
-        place_inf = 0 if ((hasattr(infector.microcell, 'closure_start_time'))
-                          ) and (infector.is_place_closed(
-                            Parameters.instance().intervention_params[
-                                'place_closure']['closure_place_type'])) and (
-                                infector.microcell.closure_start_time <= time
-                                ) else \
+        place_inf = 0 if (
+            infector.microcell.closure_start_time is not None) and \
+            infector.is_place_closed(Parameters.instance().intervention_params[
+                'place_closure']['closure_place_type'], time) else \
             (transmission / num_groups
                 * PersonalInfection.person_inf(infector, time))
         return place_inf
@@ -80,8 +78,7 @@ class PlaceInfection:
         """
         place_susc = 1.0
         place_idx = place.place_type.value - 1
-        if (hasattr(infector.microcell, 'distancing_start_time')) and (
-                infector.microcell.distancing_start_time is not None) and (
+        if (infector.microcell.distancing_start_time is not None) and (
                     infector.microcell.distancing_start_time <= time):
             if infector.distancing_enhanced is True:
                 place_susc *= Parameters.instance().\
@@ -127,20 +124,17 @@ class PlaceInfection:
         travel_isolation_scale = Parameters.instance().\
             intervention_params['travel_isolation']['isolation'
                                                     '_effectiveness'] \
-            if (hasattr(infector, 'travel_isolation_start_time')) and (
-                infector.travel_isolation_start_time is not None) and (
+            if (infector.travel_isolation_start_time is not None) and (
                     infector.travel_isolation_start_time <= time) else 1
         isolation_scale = Parameters.instance().\
             intervention_params['case_isolation']['isolation_effectiveness']\
-            if (hasattr(infector, 'isolation_start_time')) and (
-                infector.isolation_start_time is not None) and (
+            if (infector.isolation_start_time is not None) and (
                     infector.isolation_start_time <= time) else 1
         place_idx = place.place_type.value - 1
         quarantine_scale = Parameters.instance().\
             intervention_params['household_quarantine'][
                 'quarantine_place_effectiveness'][place_idx]\
-            if (hasattr(infectee, 'quarantine_start_time')) and (
-                infectee.quarantine_start_time is not None) and (
+            if (infectee.quarantine_start_time is not None) and (
                     infectee.quarantine_start_time <= time) else 1
 
         # Dominant interventions: 1) travel_isolate; 2) case_isolate;
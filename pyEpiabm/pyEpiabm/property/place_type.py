@@ -17,3 +17,25 @@ class PlaceType(Enum):
     CareHome = 5  # two groups, workers [0] and residents [1], both remain
     # unchanged, but interact differently.
     OutdoorSpace = 6  # one group, updated each timestep
+
+    @staticmethod
+    def mask(place_types) -> int:
+        """Get an integer bitmask with the bit of each given place type set,
+        so that membership of several place types can be checked with a
+        single AND.
+
+        Parameters
+        ----------
+        place_types : list
+            PlaceTypes, or their integer values
+
+        Returns
+        -------
+        int
+            Bitmask of the place types
+
+        """
+        mask = 0
+        for place_type in place_types:
+            mask |= 1 << int(getattr(place_type, 'value', place_type))
+        return mask
@@ -64,12 +64,11 @@ class SpatialInfection:
             if pyEpiabm.core.Parameters.instance().use_ages is True else 1
         closure_spatial = Parameters.instance().\
             intervention_params['place_closure']['closure_spatial_params'] \
-            if ((hasattr(infector.microcell, 'closure_start_time'))) and (
-                infector.is_place_closed(
-                    Parameters.instance().intervention_params[
-                        'place_closure']['closure_place_type'])) and (
-                        infector.microcell.closure_start_time <= time) else 1
-        return infector.infectiousness * age * closure_spatial
+            if (infector.microcell.closure_start_time
+                is not None) and infector.is_place_closed(
+                Parameters.instance().intervention_params[
+                    'place_closure']['closure_place_type'], time) else 1
+        return infector.infectiousness_at(time) * age * closure_spatial
 
     @staticmethod
     def spatial_susc(susc_cell, infector, infectee, time: float):
@@ -100,14 +99,12 @@ class SpatialInfection:
 
         spatial_susc *= Parameters.instance().\
             intervention_params['place_closure']['closure_spatial_params'] \
-            if ((hasattr(infector.microcell, 'closure_start_time'))) and (
-                infector.is_place_closed(
-                    Parameters.instance().intervention_params[
-                        'place_closure']['closure_place_type'])) and (
-                        infector.microcell.closure_start_time <= time) else 1
-
-        if (hasattr(infector.microcell, 'distancing_start_time')) and (
-                infector.microcell.distancing_start_time is not None) and (
+            if (infector.microcell.closure_start_time
+                is not None) and infector.is_place_closed(
+                Parameters.instance().intervention_params[
+                    'place_closure']['closure_place_type'], time) else 1
+
+        if (infector.microcell.distancing_start_time is not None) and (
                     infector.microcell.distancing_start_time <= time):
             if infector.distancing_enhanced is True:
                 spatial_susc *= Parameters.instance().\
@@ -155,19 +152,16 @@ class SpatialInfection:
         travel_isolation_scale = Parameters.instance().\
             intervention_params['travel_isolation']['isolation'
                                                     '_effectiveness'] \
-            if (hasattr(infector, 'travel_isolation_start_time')) and (
-                infector.travel_isolation_start_time is not None) and (
+            if (infector.travel_isolation_start_time is not None) and (
                     infector.travel_isolation_start_time <= time) else 1
         isolation_scale = Parameters.instance().\
             intervention_params['case_isolation']['isolation_effectiveness']\
-            if (hasattr(infector, 'isolation_start_time')) and (
-                infector.isolation_start_time is not None) and (
+            if (infector.isolation_start_time is not None) and (
                     infector.isolation_start_time <= time) else 1
         quarantine_scale = Parameters.instance().\
             intervention_params['household_quarantine'][
                 'quarantine_spatial_effectiveness']\
-            if (hasattr(infectee, 'quarantine_start_time')) and (
-                infectee.quarantine_start_time is not None) and (
+            if (infectee.quarantine_start_time is not None) and (
                     infectee.quarantine_start_time <= time) else 1
 
         # Dominant interventions: 1) travel_isolate; 2) case_isolate
@@ -1,10 +1,89 @@
 import time
+import numpy as np
+
 from pyEpiabm.core import Population
 from pyEpiabm.property import InfectionStatus
 
 
-def py2c_population(py_population: Population, c_factory, c_status_map):
-    return _py2c_converter(py_population, c_factory, c_status_map).c_population
+def py2c_population(py_population: Population, c_factory, c_status_map,
+                    bulk: bool = False, time: float = None):
+    """Convert a python population to a cEpiabm population.
+
+    Parameters
+    ----------
+    py_population : Population
+        Population to convert
+    c_factory : epiabm.PopulationFactory
+        cEpiabm factory used to build the population
+    c_status_map : dict
+        Dictionary mapping python :class:`InfectionStatus` to cEpiabm
+        InfectionStatus
+    bulk : bool
+        Whether to export the population to arrays and build the cEpiabm
+        population in a single call, rather than configuring each object
+        across the python/C++ boundary
+    time : float
+        Simulation time at which the infectiousness of people is exported.
+        Required if any infectiousness is evaluated lazily (see
+        :meth:`Person.infectiousness_at`)
+
+    Returns
+    -------
+    epiabm.Population
+        Converted cEpiabm population
+
+    """
+    if bulk:
+        return c_factory.make_population_from_arrays(
+            **py2c_population_arrays(py_population, c_status_map, time))
+    return _py2c_converter(py_population, c_factory, c_status_map,
+                           time).c_population
+
+
+def py2c_population_arrays(py_population: Population, c_status_map,
+                           time: float = None):
+    """Export a python population to the flat NumPy arrays accepted by
+    `PopulationFactory.make_population_from_arrays` in cEpiabm.
+
+    Microcells are ordered by cell, and people and households are ordered
+    by microcell, so the position of a person within its cell is the running
+    count of people in that cell. Places are numbered consecutively over the
+    places of each cell.
+
+    Parameters
+    ----------
+    py_population : Population
+        Population to export
+    c_status_map : dict
+        Dictionary mapping python :class:`InfectionStatus` to cEpiabm
+        InfectionStatus (or to its integer value)
+    time : float
+        Simulation time at which the infectiousness of people is exported.
+        Required if any infectiousness is evaluated lazily (see
+        :meth:`Person.infectiousness_at`)
+
+    Returns
+    -------
+    dict
+        Dictionary of arrays, keyed by the argument names of
+        `make_population_from_arrays`
+
+    """
+    return _py2c_array_exporter(py_population, c_status_map, time).arrays
+
+
+def _infectiousness(person, time: float):
+    """Get the infectiousness of a person to export, which must be
+    evaluated at a given time if it is evaluated lazily.
+
+    """
+    if time is None:
+        if person.infectiousness_progression is not None and \
+                person.infection_start_time is not None:
+            raise ValueError("Time is required to export lazily evaluated "
+                             + "infectiousness")
+        return person.infectiousness
+    return person.infectiousness_at(time)
 
 
 class _Timer:
@@ -17,8 +96,10 @@ class _Timer:
 
 
 class _py2c_converter:
-    def __init__(self, py_population: Population, c_factory, c_status_map):
+    def __init__(self, py_population: Population, c_factory, c_status_map,
+                 time: float = None):
         self.py_population = py_population
+        self.time = time
         self.c_factory = c_factory
         self.c_population = None
         self.c_status_map = c_status_map
@@ -120,7 +201,8 @@ class _py2c_converter:
                 (c_i, mc_i, p_i) = py_person._index
                 assert c_i == py_cell._index
                 params = c_person.params()
-                params.infectiousness = py_person.infectiousness
+                params.infectiousness = _infectiousness(py_person,
+                                                        self.time)
                 params.initial_infectiousness =\
                     py_person.initial_infectiousness
                 params.susceptibility = 1.0  # Is this correct? each
@@ -186,3 +268,119 @@ class _py2c_converter:
                         c_cell.get_person(p_i).add_place(
                             self.c_population, c_cell,
                             c_place.index(), group)
+
+
+class _py2c_array_exporter:
+    def __init__(self, py_population: Population, c_status_map,
+                 time: float = None):
+        self.py_population = py_population
+        self.time = time
+        self.status_values = {status: int(c_status)
+                              for status, c_status in c_status_map.items()}
+        self.arrays = {}
+
+        self._export_structure()
+        self._export_people()
+        self._export_households()
+        self._export_places()
+
+    def _export_structure(self):
+        cells = self.py_population.cells
+        self.arrays["cell_locations"] = np.array(
+            [cell.location for cell in cells], dtype=np.float64
+        ).reshape(len(cells), 2)
+        self.arrays["microcells_per_cell"] = np.array(
+            [len(cell.microcells) for cell in cells], dtype=np.uint64)
+        self.microcells = [m_cell for cell in cells
+                           for m_cell in cell.microcells]
+        self.arrays["people_per_microcell"] = np.array(
+            [len(m_cell.persons) for m_cell in self.microcells],
+            dtype=np.uint64)
+        self.arrays["households_per_microcell"] = np.array(
+            [len(m_cell.households) for m_cell in self.microcells],
+            dtype=np.uint64)
+
+    def _export_people(self):
+        # Position of each household within its microcell
+        household_index = {}
+        for m_cell in self.microcells:
+            for hh_i, household in enumerate(m_cell.households):
+                household_index[household] = hh_i
+
+        # (cell index, position within cell) of each person, to link places
+        self.person_index = {}
+        persons = []
+        for c_i, cell in enumerate(self.py_population.cells):
+            person_i = 0
+            for m_cell in cell.microcells:
+                for person in m_cell.persons:
+                    assert person.microcell == m_cell, \
+                        "Person incorrectly linked to microcell"
+                    assert person not in self.person_index, \
+                        "Person already indexed (is person in two microcells?)"
+                    assert person.household is None or \
+                        person.household.microcell == m_cell, \
+                        "Household cannot link two people in different " \
+                        "microcells."
+                    self.person_index[person] = (c_i, person_i)
+                    person_i += 1
+                    persons.append(person)
+
+        susceptible = self.status_values[InfectionStatus.Susceptible]
+        status_time = np.array(
+            [p.time_of_status_change
+             if p.time_of_status_change is not None else 0
+             for p in persons], dtype=np.float64)
+        status_time[~np.isfinite(status_time)] = 0
+
+        self.arrays["status"] = np.array(
+            [self.status_values[p.infection_status] for p in persons],
+            dtype=np.uint8)
+        self.arrays["age_group"] = np.array(
+            [p.age_group if p.age_group is not None else 0
+             for p in persons], dtype=np.uint8)
+        self.arrays["susceptibility"] = np.ones(len(persons),
+                                                dtype=np.float32)
+        self.arrays["infectiousness"] = np.array(
+            [_infectiousness(p, self.time) for p in persons],
+            dtype=np.float32)
+        self.arrays["initial_infectiousness"] = np.array(
+            [p.initial_infectiousness for p in persons], dtype=np.float32)
+        self.arrays["next_status"] = np.array(
+            [self.status_values[p.next_infection_status]
+             if p.next_infection_status is not None else susceptible
+             for p in persons], dtype=np.uint8)
+        self.arrays["next_status_time"] = status_time.astype(np.uint16)
+        self.arrays["household"] = np.array(
+            [household_index[p.household] if p.household is not None else -1
+             for p in persons], dtype=np.int64)
+
+    def _export_households(self):
+        households = [household for m_cell in self.microcells
+                      for household in m_cell.households]
+        self.arrays["household_susceptibility"] = np.array(
+            [hh.susceptibility for hh in households], dtype=np.float64)
+        self.arrays["household_infectiousness"] = np.array(
+            [hh.infectiousness for hh in households], dtype=np.float64)
+        self.arrays["household_locations"] = np.array(
+            [hh.location for hh in households], dtype=np.float64
+        ).reshape(len(households), 2)
+
+    def _export_places(self):
+        # cEpiabm stores places alongside population not cell
+        memberships = []
+        place_i = 0
+        for cell in self.py_population.cells:
+            for place in cell.places:
+                for group, persons in place.person_groups.items():
+                    for person in persons:
+                        c_i, person_i = self.person_index[person]
+                        memberships.append((place_i, c_i, person_i, group))
+                place_i += 1
+        self.arrays["n_places"] = place_i
+
+        memberships = np.array(memberships, dtype=np.uint64).reshape(-1, 4)
+        self.arrays["membership_place"] = memberships[:, 0].copy()
+        self.arrays["membership_cell"] = memberships[:, 1].copy()
+        self.arrays["membership_person"] = memberships[:, 2].copy()
+        self.arrays["membership_group"] = memberships[:, 3].copy()
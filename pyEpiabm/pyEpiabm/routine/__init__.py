@@ -9,5 +9,8 @@ create a population.
 
 from .abstract_population_config import AbstractPopulationFactory
 from .file_population_config import FilePopulationFactory
+from .replicate_simulation import ReplicateSimulation
+from .scenario_branching import ScenarioBranching
 from .simulation import Simulation
+from .simulation_instrumentation import SimulationInstrumentation
 from .toy_population_config import ToyPopulationFactory
@@ -0,0 +1,383 @@
+#
+# Runs replicates of a simulation on a shared population structure
+#
+
+import os
+import copy
+import random
+import logging
+import typing
+import numpy as np
+
+from pyEpiabm.core import Parameters, Population
+from pyEpiabm.core.cell import _ACTIVE_STATUSES
+from pyEpiabm.output import _CsvDictWriter
+from pyEpiabm.property import InfectionStatus
+from pyEpiabm.sweep import AbstractSweep, HostProgressionSweep
+from pyEpiabm.sweep import HouseholdSweep, InitialInfectedSweep, PlaceSweep
+from pyEpiabm.sweep import QueueSweep, SpatialSweep
+from pyEpiabm.utility import log_exceptions
+
+from .simulation import Simulation
+
+
+# Person attributes which change during a simulation, with their dtype in
+# the replicate state arrays. Statuses are stored by value (0 for None) and
+# times as NaN for None. Whether a person is in the list of susceptible
+# people of their household is stored separately from their status, as
+# people infected by the initial sweeps stay on it.
+_PERSON_STATE = {"infection_status": np.int8,
+                 "next_infection_status": np.int8,
+                 "time_of_status_change": float,
+                 "infection_start_time": float,
+                 "initial_infectiousness": float,
+                 "infectiousness": float,
+                 "infectiousness_time_step": float,
+                 "infectiousness_progression": bool,
+                 "household_susceptible": bool}
+
+# Columns of the active statuses in the counts of each cell
+_ACTIVE_COLUMNS = [status.value - 1 for status in _ACTIVE_STATUSES]
+
+
+class ReplicateSimulation(Simulation):
+    """Class to run stochastic replicates of a simulation on one shared
+    population structure. The structure of the population (cells,
+    microcells, households and places) is built once, and each replicate
+    only keeps the changing state of each person (statuses, timers and
+    infectiousness) in arrays of shape (replicates, people), along with its
+    own random state, new case counters and output file.
+
+    At each time step, each replicate's state is swapped into the shared
+    population in turn before the sweeps run. Only the people whose state
+    differs from the previous replicate are updated, and only the cells the
+    epidemic has reached are read back, so the cost of swapping tracks the
+    epidemic footprint rather than the population size. The sweeps still
+    act on person objects and run once for each replicate, so the time
+    spent in sweeps is the same as for separate runs. Sharing the structure
+    saves the memory and build time of a population for each replicate.
+
+    Only sweeps which change the state of people, and not the structure of
+    the population, are supported: :class:`InitialInfectedSweep` to
+    initialise each replicate, and :class:`HouseholdSweep`,
+    :class:`PlaceSweep`, :class:`SpatialSweep`, :class:`QueueSweep` and
+    :class:`HostProgressionSweep` at each time step, which must include a
+    :class:`QueueSweep`. Households and places should be assigned before
+    configuring.
+
+    """
+
+    _initial_sweep_types = (InitialInfectedSweep,)
+    _sweep_types = (HouseholdSweep, PlaceSweep, SpatialSweep, QueueSweep,
+                    HostProgressionSweep)
+
+    @log_exceptions()
+    def configure(self,
+                  population: Population,
+                  initial_sweeps: typing.List[AbstractSweep],
+                  sweeps: typing.List[AbstractSweep],
+                  sim_params: typing.Dict,
+                  file_params: typing.Dict):
+        """Initialise a population structure shared by all replicates. As
+        in :meth:`Simulation.configure`, with the additional simulation
+        parameter:
+
+            * `replicates`: Number of replicates to run. Defaults to 1
+
+        Replicate r is seeded with `simulation_seed` + r if a seed is given,
+        and its output is written to the output file name with the suffix
+        `_replicate_r`.
+
+        Parameters
+        ----------
+        population : Population
+            Population structure for the model
+        initial_sweeps : typing.List
+            List of sweeps used to initialise each replicate
+        sweeps : typing.List
+            List of sweeps used in the simulation
+        sim_params : dict
+            Dictionary of parameters specific to the simulation
+        file_params : dict
+            Dictionary of parameters specific to the output file
+
+        """
+        self.n_replicates = sim_params.get("replicates", 1)
+        if self.n_replicates < 1:
+            raise ValueError("Number of replicates must be positive")
+        for sweep in initial_sweeps:
+            if not isinstance(sweep, self._initial_sweep_types):
+                raise ValueError(f"{sweep.__class__.__name__} is not "
+                                 + "supported as an initial sweep of "
+                                 + "replicates")
+        for sweep in sweeps:
+            if not isinstance(sweep, self._sweep_types):
+                raise ValueError(f"{sweep.__class__.__name__} is not "
+                                 + "supported by replicates")
+        # Queued people are not part of the state of each replicate, so the
+        # queues must be emptied within each time step
+        if not any(isinstance(sweep, QueueSweep) for sweep in sweeps):
+            raise ValueError("Replicates require a QueueSweep")
+        if "disease_testing" in getattr(Parameters.instance(),
+                                        "intervention_params", {}):
+            raise ValueError("Disease testing is not supported by "
+                             + "replicates")
+
+        root, ext = os.path.splitext(file_params["output_file"])
+        filenames = [f"{root}_replicate_{r}{ext}"
+                     for r in range(self.n_replicates)]
+        super().configure(population, initial_sweeps, sweeps, sim_params,
+                          dict(file_params, output_file=filenames[0]))
+
+        self._persons = [person for cell in population.cells
+                         for person in cell.persons]
+        self._cell_offsets = np.cumsum(
+            [0] + [len(cell.persons) for cell in population.cells])
+        self.person_states = {
+            name: np.zeros((self.n_replicates, len(self._persons)),
+                           dtype=dtype)
+            for name, dtype in _PERSON_STATE.items()}
+        self._progression = None
+        self._save(0)
+        for values in self.person_states.values():
+            values[1:] = values[0]
+
+        # Replicate specific state outside the population arrays
+        seed = sim_params.get("simulation_seed")
+        folder = self.writer.folder
+        fieldnames = self.writer.writer.fieldnames
+        self._contexts = []
+        for r in range(self.n_replicates):
+            Simulation.set_random_seed(None if seed is None else seed + r)
+            if r == 0:
+                writer = self.writer
+                counters = [cell.new_case_counter
+                            for cell in population.cells]
+            else:
+                writer = _CsvDictWriter(folder, filenames[r], fieldnames)
+                counters = [copy.deepcopy(cell.new_case_counter)
+                            for cell in population.cells]
+            self._contexts.append({
+                "random_state": random.getstate(),
+                "np_random_state": np.random.get_state(),
+                "new_case_counters": counters, "writer": writer,
+                "_last_written": {}, "_write_count": 0,
+                "termination_time": None})
+        self._loaded = 0
+        self._restore_context(0)
+
+    def add_writer(self, writer):
+        """Extra writers are not supported, as they would mix the output of
+        all replicates.
+
+        """
+        raise NotImplementedError("Extra writers are not supported by "
+                                  + "replicates")
+
+    def _initialise(self):
+        """Run the initialisation sweeps and write the initial state of
+        each replicate.
+
+        """
+        for r in range(self.n_replicates):
+            self.load_replicate(r)
+            super()._initialise()
+            self._save(r)
+            self._contexts[r]["cell_counts"] = self._cell_counts()
+
+    def _run_time_step(self, t: float):
+        """Run the sweeps for one time step on each replicate in turn.
+
+        Parameters
+        ----------
+        t : float
+            Simulation time
+
+        """
+        for r in range(self.n_replicates):
+            self.load_replicate(r)
+            # Counts at the end of the replicate's previous time step
+            before = self._contexts[r]["cell_counts"]
+            super()._run_time_step(t)
+            after = self._cell_counts()
+            self._contexts[r]["cell_counts"] = after
+            # People only change in cells with active people at the start of
+            # the time step, whose counts changed during it or with exposures
+            # still to be applied
+            active = before[:, _ACTIVE_COLUMNS].any(axis=1)
+            pending = np.array([cell.pending_exposures > 0
+                                for cell in self.population.cells])
+            self._save(r, np.flatnonzero(
+                active | pending | (before != after).any(axis=1)))
+
+    def _cell_counts(self) -> np.ndarray:
+        """Get the number of people in each status in each cell.
+
+        Returns
+        -------
+        np.ndarray
+            Array of counts with a row for each cell and a column for each
+            status, in order of their values
+
+        """
+        return np.array([cell.compartment_counter.totals()
+                         for cell in self.population.cells])
+
+    def _save(self, r: int, cells: typing.Iterable[int] = None):
+        """Read the state of the people in the shared population into the
+        arrays of a replicate.
+
+        Parameters
+        ----------
+        r : int
+            Index of the replicate
+        cells : typing.Iterable[int]
+            Indices of the cells whose people are read, or None to read
+            everyone
+
+        """
+        if cells is None:
+            indices = range(len(self._persons))
+        else:
+            indices = (j for i in cells for j in range(
+                self._cell_offsets[i], self._cell_offsets[i + 1]))
+        states = self.person_states
+        for j in indices:
+            person = self._persons[j]
+            states["infection_status"][r, j] = person.infection_status.value
+            next_status = person.next_infection_status
+            states["next_infection_status"][r, j] = \
+                0 if next_status is None else next_status.value
+            states["time_of_status_change"][r, j] = np.nan \
+                if person.time_of_status_change is None \
+                else person.time_of_status_change
+            states["infection_start_time"][r, j] = np.nan \
+                if person.infection_start_time is None \
+                else person.infection_start_time
+            states["initial_infectiousness"][r, j] = \
+                person.initial_infectiousness
+            # Saved as state, so it is not evaluated for people whose
+            # infectiousness is evaluated lazily
+            states["infectiousness"][r, j] = person.infectiousness
+            states["infectiousness_time_step"][r, j] = \
+                person.infectiousness_time_step
+            if person.infectiousness_progression is not None:
+                self._progression = person.infectiousness_progression
+            states["infectiousness_progression"][r, j] = \
+                person.infectiousness_progression is not None
+            states["household_susceptible"][r, j] = \
+                person.household is not None and \
+                person in person.household.susceptible_persons
+
+    def load_replicate(self, r: int):
+        """Swap the state of a replicate into the shared population, so it
+        can be run or inspected.
+
+        Parameters
+        ----------
+        r : int
+            Index of the replicate
+
+        """
+        if r == self._loaded:
+            return
+        old = self._loaded
+        differ = np.zeros(len(self._persons), dtype=bool)
+        for values in self.person_states.values():
+            if values.dtype.kind == 'f':
+                differ |= ~((values[old] == values[r])
+                            | (np.isnan(values[old]) & np.isnan(values[r])))
+            else:
+                differ |= values[old] != values[r]
+
+        states = self.person_states
+        households = set()
+        for j in np.flatnonzero(differ):
+            person = self._persons[j]
+            was_pending = person.is_susceptible() and \
+                person.time_of_status_change is not None
+            status = InfectionStatus(states["infection_status"][r, j])
+            if status != person.infection_status:
+                # Statuses may move in any direction between replicates, so
+                # the counters are updated directly
+                person.microcell.notify_person_status_change(
+                    person.infection_status, status, person.age_group)
+                person.infection_status = status
+            household = person.household
+            if household is not None and \
+                    states["household_susceptible"][r, j] != \
+                    states["household_susceptible"][old, j]:
+                if states["household_susceptible"][r, j]:
+                    household.add_susceptible_person(person)
+                    households.add(household)
+                else:
+                    household.remove_susceptible_person(person)
+            next_status = states["next_infection_status"][r, j]
+            person.next_infection_status = \
+                None if next_status == 0 else InfectionStatus(next_status)
+            time = states["time_of_status_change"][r, j]
+            person.time_of_status_change = \
+                None if np.isnan(time) else float(time)
+            # Exposures still to be applied keep the cell active
+            person.microcell.cell.pending_exposures += int(
+                person.is_susceptible()
+                and person.time_of_status_change is not None) \
+                - int(was_pending)
+            time = states["infection_start_time"][r, j]
+            person.infection_start_time = \
+                None if np.isnan(time) else float(time)
+            person.initial_infectiousness = \
+                float(states["initial_infectiousness"][r, j])
+            person.infectiousness = float(states["infectiousness"][r, j])
+            person.infectiousness_time_step = \
+                float(states["infectiousness_time_step"][r, j])
+            person.infectiousness_progression = self._progression \
+                if states["infectiousness_progression"][r, j] else None
+        # Keep susceptible people in household order, so each replicate
+        # draws random numbers for them in the same order as a single run
+        for household in households:
+            household.susceptible_persons.sort(key=household.persons.index)
+
+        self._save_context(old)
+        self._restore_context(r)
+        self._loaded = r
+        logging.debug(f"Loaded replicate {r}, updating "
+                      + f"{np.count_nonzero(differ)} people")
+
+    def _save_context(self, r: int):
+        """Store the replicate specific state outside the population
+        arrays.
+
+        Parameters
+        ----------
+        r : int
+            Index of the replicate
+
+        """
+        self._contexts[r].update({
+            "random_state": random.getstate(),
+            "np_random_state": np.random.get_state(),
+            "writer": self.writer, "_last_written": self._last_written,
+            "_write_count": self._write_count,
+            "termination_time": self.termination_time})
+
+    def _restore_context(self, r: int):
+        """Restore the replicate specific state outside the population
+        arrays.
+
+        Parameters
+        ----------
+        r : int
+            Index of the replicate
+
+        """
+        context = self._contexts[r]
+        random.setstate(context["random_state"])
+        np.random.set_state(context["np_random_state"])
+        for cell, counter in zip(self.population.cells,
+                                 context["new_case_counters"]):
+            cell.new_case_counter = counter
+        self.writer = context["writer"]
+        self._last_written = context["_last_written"]
+        self._write_count = context["_write_count"]
+        self.termination_time = context["termination_time"]
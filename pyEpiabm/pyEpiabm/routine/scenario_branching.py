@@ -0,0 +1,212 @@
+#
+# Branches a simulation into intervention scenarios
+#
+
+import os
+import sys
+import random
+import logging
+import typing
+
+from pyEpiabm.core import Parameters
+from pyEpiabm.sweep import InterventionSweep
+
+
+class ScenarioBranching:
+    """Class to compare intervention scenarios which share a warm-up. The
+    simulation runs once up to the branch time, then the full state is
+    forked into one worker process per scenario, each of which continues
+    the simulation to its end time with its own intervention parameters and
+    output folder. The warm-up rows of each scenario output are copied from
+    the shared run.
+
+    Each worker starts from the same random state, so scenarios are compared
+    under common random numbers. As the interventions of the warm-up are not
+    carried into the scenarios, all interventions must start after the
+    branch time. Workers are created with :func:`os.fork`, so this is only
+    available on platforms which support it.
+
+    """
+
+    def __init__(self, simulation, branch_time: float,
+                 max_workers: int = None):
+        """Constructor Method.
+
+        Parameters
+        ----------
+        simulation : Simulation
+            Configured simulation, which has not yet been run past the
+            branch time
+        branch_time : float
+            Time at which the scenarios branch from the shared warm-up
+        max_workers : int
+            Maximum number of scenarios run at once. Defaults to the number
+            of CPUs
+
+        """
+        self.simulation = simulation
+        self.branch_time = branch_time
+        self.max_workers = max_workers if max_workers is not None \
+            else (os.cpu_count() or 1)
+        if self.max_workers < 1:
+            raise ValueError("Maximum number of workers must be positive")
+
+    def _check_interventions(self, intervention_params: typing.Dict,
+                             name: str):
+        """Raise an error if any intervention starts by the branch time.
+
+        Parameters
+        ----------
+        intervention_params : dict
+            Dictionary of intervention parameters
+        name : str
+            Name used to identify the parameters in the error
+
+        """
+        for intervention, params in intervention_params.items():
+            if params.get("start_time", 0) <= self.branch_time:
+                raise ValueError(f"Intervention {intervention} of {name} "
+                                 + f"starts at {params.get('start_time', 0)},"
+                                 + " not after the branch time "
+                                 + f"{self.branch_time}")
+
+    def _writers(self) -> typing.List:
+        """Get the writers of all outputs of the simulation.
+
+        Returns
+        -------
+        list
+            Writers of the simulation
+
+        """
+        writers = [self.simulation.writer] + self.simulation.writers
+        instrumentation = self.simulation.instrumentation
+        if instrumentation is not None and instrumentation.writer is not None:
+            writers.append(instrumentation.writer)
+        return writers
+
+    def apply_scenario(self, scenario: typing.Dict):
+        """Set the intervention parameters of a scenario, and move the
+        output of the simulation into the scenario's output folder.
+
+        Parameters
+        ----------
+        scenario : dict
+            Scenario with keys `name`, `output_dir` (relative to the
+            working directory) and `intervention_params`
+
+        """
+        intervention_params = scenario.get("intervention_params", {})
+        Parameters.instance().intervention_params = intervention_params
+        for sweep in self.simulation.sweeps:
+            if isinstance(sweep, InterventionSweep):
+                sweep.intervention_params = intervention_params
+                sweep.bind_population(self.simulation.population)
+        folder = os.path.join(os.getcwd(), scenario["output_dir"])
+        for writer in self._writers():
+            writer.branch(folder)
+        logging.info(f"Applied scenario {scenario['name']} at time "
+                     + f"{self.simulation.time} days")
+
+    def _flush(self):
+        """Write all buffered output, so it is not duplicated or lost when
+        forking.
+
+        """
+        for writer in self._writers():
+            writer.flush()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        for handler in logging.getLogger().handlers:
+            handler.flush()
+
+    def _run_scenario(self, scenario: typing.Dict):  # pragma: no cover
+        """Run a scenario to the end of the simulation in a worker process,
+        which exits once finished.
+
+        Parameters
+        ----------
+        scenario : dict
+            Scenario to run
+
+        """
+        status = 0
+        try:
+            # The random module reseeds itself in forked processes
+            random.setstate(self._random_state)
+            self.apply_scenario(scenario)
+            self.simulation.run_until(
+                self.simulation.sim_params["simulation_end_time"])
+        except Exception as e:
+            logging.exception(f"{type(e).__name__} in scenario "
+                              + f"{scenario['name']}")
+            status = 1
+        finally:
+            self._flush()
+            os._exit(status)
+
+    def run(self, scenarios: typing.List[typing.Dict]) -> typing.Dict:
+        """Run the simulation up to the branch time, then each scenario to
+        the end of the simulation.
+
+        Parameters
+        ----------
+        scenarios : list
+            List of scenario dicts, see :meth:`apply_scenario`
+
+        Returns
+        -------
+        dict
+            Exit status of the worker of each scenario, by name
+
+        """
+        if not hasattr(os, "fork"):  # pragma: no cover
+            raise NotImplementedError("Scenario branching requires os.fork")
+        names = [scenario["name"] for scenario in scenarios]
+        if len(set(names)) != len(names):
+            raise ValueError("Scenario names must be unique")
+        self._check_interventions(
+            getattr(Parameters.instance(), "intervention_params", {}),
+            "the warm-up")
+        has_intervention_sweep = any(
+            isinstance(sweep, InterventionSweep)
+            for sweep in self.simulation.sweeps)
+        for scenario in scenarios:
+            intervention_params = scenario.get("intervention_params", {})
+            if intervention_params and not has_intervention_sweep:
+                raise ValueError(f"Scenario {scenario['name']} has "
+                                 + "interventions, but the simulation has "
+                                 + "no InterventionSweep to run them")
+            self._check_interventions(intervention_params,
+                                      f"scenario {scenario['name']}")
+
+        self.simulation.run_until(self.branch_time)
+        logging.info(f"Branching {len(scenarios)} scenarios at time "
+                     + f"{self.simulation.time} days")
+        self._flush()
+        self._random_state = random.getstate()
+
+        statuses = {}
+        running = {}
+        remaining = list(scenarios)
+        while remaining or running:
+            while remaining and len(running) < self.max_workers:
+                scenario = remaining.pop(0)
+                pid = os.fork()
+                if pid == 0:  # pragma: no cover
+                    self._run_scenario(scenario)
+                running[pid] = scenario["name"]
+            pid, status = os.waitpid(-1, 0)
+            if pid not in running:  # pragma: no cover
+                continue
+            name = running.pop(pid)
+            # Negative if the worker was killed by a signal
+            statuses[name] = os.WEXITSTATUS(status) if os.WIFEXITED(status) \
+                else -os.WTERMSIG(status)
+            logging.info(f"Scenario {name} finished with status "
+                         + f"{statuses[name]}")
+
+        failed = [name for name in names if statuses[name] != 0]
+        if failed:
+            raise RuntimeError(f"Scenarios {failed} failed")
+        return statuses
@@ -25,6 +25,7 @@ class Simulation:
         """ Constructor
         """
         self.writers = []
+        self.instrumentation = None
 
     @log_exceptions()
     def configure(self,
@@ -41,6 +42,10 @@ class Simulation:
             * `initial_infected_number`: The initial number of infected \
                individuals in the population
             * `simulation_seed`:  Random seed for reproducible simulations
+            * `early_termination`: Boolean to determine whether sweeps stop \
+               running once no one is exposed or infectious and no sweep has \
+               events pending. The remaining (constant) output is still \
+               written. Defaults to False
 
         file_params Contains:
             * `output_file`: String for the name of the output .csv file
@@ -50,6 +55,10 @@ class Simulation:
                should be used
             * `age_stratified`: Boolean to determine whether the output will \
                 be age stratified
+            * `sparse_output`: Boolean to determine whether only rows whose \
+                counts changed since they were last written are output
+            * `keyframe_interval`: Number of output timesteps between full \
+                (dense) writes when using sparse output. Defaults to 10
 
         Parameters
         ----------
@@ -82,6 +91,22 @@ class Simulation:
 
         Parameters.instance().use_ages = self.age_stratified
 
+        self.sparse_output = file_params["sparse_output"] \
+            if "sparse_output" in file_params else False
+        self.keyframe_interval = file_params["keyframe_interval"] \
+            if "keyframe_interval" in file_params else 10
+        if self.keyframe_interval < 1:
+            raise ValueError("Keyframe interval must be a positive integer")
+        self._last_written = {}
+        self._write_count = 0
+
+        self.early_termination = self.sim_params.get("early_termination",
+                                                     False)
+        self.termination_time = None
+        # Last time run, or None before the simulation starts
+        self.time = None
+        self._step = 0
+
         # If random seed is specified in parameters, set this in numpy
         if "simulation_seed" in self.sim_params:
             Simulation.set_random_seed(self.sim_params["simulation_seed"])
@@ -127,8 +152,41 @@ class Simulation:
         as an argument for their call method.
 
         """
-        # Define time step between sweeps
-        ts = 1 / Parameters.instance().time_steps_per_day
+        self.run_until(self.sim_params["simulation_end_time"])
+        logging.info(f"Final time {self.time} days reached")
+
+    def run_until(self, time: float):
+        """Run the simulation up to and including the given time. On the
+        first call the initialisation sweeps run, and later calls continue
+        from the last time step run, so a simulation can be paused (for
+        example to branch into scenarios) and resumed.
+
+        Parameters
+        ----------
+        time : float
+            Time to run the simulation until
+
+        """
+        if self.time is None:
+            # Define time step between sweeps
+            ts = 1 / Parameters.instance().time_steps_per_day
+            self._times = np.arange(
+                self.sim_params["simulation_start_time"] + ts,
+                self.sim_params["simulation_end_time"] + ts, ts)
+            self._initialise()
+            self.time = self.sim_params["simulation_start_time"]
+
+        end = self._step + np.count_nonzero(self._times[self._step:] <= time)
+        for t in tqdm(self._times[self._step:end]):
+            self._step += 1
+            self.time = t
+            self._run_time_step(t)
+
+    def _initialise(self):
+        """Run the initialisation sweeps, and write the initial state to
+        file.
+
+        """
         # Initialise on the time step before starting.
         for sweep in self.initial_sweeps:
             sweep(self.sim_params)
@@ -137,17 +195,47 @@ class Simulation:
         # First entry of the data file is the initial state
         self.write_to_file(self.sim_params["simulation_start_time"])
 
-        for t in tqdm(np.arange(self.sim_params["simulation_start_time"] + ts,
-                                self.sim_params["simulation_end_time"] + ts,
-                                ts)):
-            for sweep in self.sweeps:
-                sweep(t)
+    def _run_time_step(self, t: float):
+        """Run the sweeps for one time step, and write the output.
+
+        Parameters
+        ----------
+        t : float
+            Simulation time
+
+        """
+        if self.termination_time is not None:
+            # Population no longer changes, so only write its output
             self.write_to_file(t)
             for writer in self.writers:
                 writer.write(t, self.population)
-            logging.debug(f'Iteration at time {t} days completed')
+            return
+        if self.instrumentation is None:
+            for sweep in self.sweeps:
+                sweep(t)
+        else:
+            self.instrumentation.run_sweeps(self.sweeps, self.population, t)
+        self.write_to_file(t)
+        for writer in self.writers:
+            writer.write(t, self.population)
+        logging.debug(f'Iteration at time {t} days completed')
+        if self.early_termination and self.is_extinct() and not any(
+                sweep.has_pending_events(t) for sweep in self.sweeps):
+            self.termination_time = t
+            logging.info(f"Epidemic extinct at time {t} days, "
+                         + "skipping remaining sweeps")
+
+    def is_extinct(self):
+        """Query if no one in the population is exposed, infectious or
+        queued to be exposed, using the compartment counters of each cell.
 
-        logging.info(f"Final time {t} days reached")
+        Returns
+        -------
+        bool
+            Whether the epidemic is extinct
+
+        """
+        return not any(cell.is_active() for cell in self.population.cells)
 
     def write_to_file(self, time):
         """Records the count number of a given list of infection statuses
@@ -159,6 +247,10 @@ class Simulation:
             Time of output data
 
         """
+        self._keyframe = (not self.sparse_output) or \
+            (self._write_count % self.keyframe_interval == 0)
+        self._write_count += 1
+        self._time_written = False
         if Parameters.instance().use_ages:
             nb_age_groups = len(Parameters.instance().age_proportions)
         else:
@@ -179,7 +271,7 @@ class Simulation:
                         data["cell"] = cell.id
                         data["location_x"] = cell.location[0]
                         data["location_y"] = cell.location[1]
-                        self.writer.write(data)
+                        self._write_row(data)
             else:  # Summed output across all cells in population
                 data = {s: 0 for s in list(InfectionStatus)}
                 for cell in self.population.cells:
@@ -190,7 +282,7 @@ class Simulation:
                             data[inf_status] += data_per_inf_status[age_i]
                         data["age_group"] = age_i+1
                         data["time"] = time
-                        self.writer.write(data)
+                        self._write_row(data)
         else:  # If age not considered, age_group not written in csv
             if self.spatial_output:  # Separate output line for each cell
                 for cell in self.population.cells:
@@ -201,7 +293,7 @@ class Simulation:
                     data["cell"] = cell.id
                     data["location_x"] = cell.location[0]
                     data["location_y"] = cell.location[1]
-                    self.writer.write(data)
+                    self._write_row(data)
             else:  # Summed output across all cells in population
                 data = {s: 0 for s in list(InfectionStatus)}
                 for cell in self.population.cells:
@@ -209,11 +301,47 @@ class Simulation:
                         # Sum across age compartments
                         data[k] += sum(cell.compartment_counter.retrieve()[k])
                 data["time"] = time
-                self.writer.write(data)
+                self._write_row(data)
+
+    def _write_row(self, data: typing.Dict):
+        """Passes a row of compartment counts to the writer. With sparse
+        output, rows are only written on keyframes or if their counts changed
+        since the last row written for the same cell and age group (the first
+        row of each timestep is always written, so that no time is lost). Use
+        :func:`pyEpiabm.output.read_sparse_output` to reconstruct the dense
+        output.
+
+        Parameters
+        ----------
+        data : dict
+            Dictionary of data to be saved
+
+        """
+        if self.sparse_output:
+            key = (data.get("cell"), data.get("age_group"))
+            counts = tuple(data[s] for s in InfectionStatus)
+            if (self._time_written and not self._keyframe
+                    and self._last_written.get(key) == counts):
+                return
+            self._last_written[key] = counts
+            self._time_written = True
+        self.writer.write(data)
 
     def add_writer(self, writer: AbstractReporter):
         self.writers.append(writer)
 
+    def set_instrumentation(self, instrumentation):
+        """Record the timings and counters of each sweep at each time step.
+
+        Parameters
+        ----------
+        instrumentation : SimulationInstrumentation
+            Instrumentation to record the sweeps with, or None to stop
+            recording
+
+        """
+        self.instrumentation = instrumentation
+
     @staticmethod
     def set_random_seed(seed):
         """ Set random seed for all subsequent operations. Should be used
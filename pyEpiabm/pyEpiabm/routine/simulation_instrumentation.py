@@ -0,0 +1,166 @@
+#
+# Records timings and counters of the sweeps run in a simulation
+#
+
+import sys
+import time as timer
+import typing
+
+from pyEpiabm.output import _CsvDictWriter
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    # Not available on Windows
+    resource = None
+
+
+class SimulationInstrumentation:
+    """Class to record where time goes in a simulation. Each time step
+    gives a record with the wall time, infection attempts and infections of
+    each sweep, the number of people queued for infection after each sweep
+    and the memory high-water mark of the process.
+
+    Records are kept in :attr:`records`, passed to an optional callback as
+    they are made, and can be written to a .csv file alongside the
+    simulation output, with one row per sweep per time step.
+
+    """
+    fieldnames = ["time", "sweep", "seconds", "infection_attempts",
+                  "infections", "queue_length", "max_rss_kb"]
+
+    def __init__(self, callback: typing.Callable = None,
+                 folder: str = None, filename: str = None,
+                 keep_records: bool = True):
+        """Constructor Method.
+
+        Parameters
+        ----------
+        callback : typing.Callable
+            Function called with each time step's record
+        folder : str
+            Folder to write the records to, or None to not write them
+        filename : str
+            Name of the .csv file to write the records to
+        keep_records : bool
+            Whether to keep all records in memory
+
+        """
+        self.callback = callback
+        self.keep_records = keep_records
+        self.records = []
+        self.writer = None
+        if folder is not None:
+            if filename is None:
+                raise ValueError("Filename required to write records")
+            self.writer = _CsvDictWriter(folder, filename, self.fieldnames)
+
+    @staticmethod
+    def max_rss_kb() -> typing.Optional[int]:
+        """Get the peak resident memory of the process so far.
+
+        Returns
+        -------
+        int
+            Memory high-water mark in kilobytes, or None if unavailable
+
+        """
+        if resource is None:  # pragma: no cover
+            return None
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":  # pragma: no cover
+            # Reported in bytes rather than kilobytes on macOS
+            max_rss //= 1024
+        return max_rss
+
+    @staticmethod
+    def queue_length(population) -> int:
+        """Get the number of people queued for infection in a population.
+
+        Parameters
+        ----------
+        population : Population
+            Population to count queued people in
+
+        Returns
+        -------
+        int
+            Number of queued people
+
+        """
+        return sum(cell.person_queue.qsize() for cell in population.cells)
+
+    def run_sweeps(self, sweeps: typing.List, population,
+                   time: float) -> typing.Dict:
+        """Run the sweeps for one time step, and record their timings and
+        counters.
+
+        Parameters
+        ----------
+        sweeps : typing.List
+            Sweeps to run, in order
+        population : Population
+            Population the sweeps act on
+        time : float
+            Simulation time
+
+        Returns
+        -------
+        dict
+            Record of this time step
+
+        """
+        sweep_records = []
+        for sweep in sweeps:
+            attempts = sweep.infection_attempts
+            infections = sweep.infections
+            start = timer.perf_counter()
+            sweep(time)
+            seconds = timer.perf_counter() - start
+            sweep_records.append({
+                "sweep": sweep.__class__.__name__,
+                "seconds": seconds,
+                "infection_attempts": sweep.infection_attempts - attempts,
+                "infections": sweep.infections - infections,
+                "queue_length": self.queue_length(population)})
+        record = {"time": time, "sweeps": sweep_records,
+                  "max_rss_kb": self.max_rss_kb()}
+        self.add_record(record)
+        return record
+
+    def add_record(self, record: typing.Dict):
+        """Store a time step's record, pass it to the callback and write it
+        to file.
+
+        Parameters
+        ----------
+        record : dict
+            Record of a time step
+
+        """
+        if self.keep_records:
+            self.records.append(record)
+        if self.callback is not None:
+            self.callback(record)
+        if self.writer is not None:
+            for sweep_record in record["sweeps"]:
+                self.writer.write({"time": record["time"],
+                                   "max_rss_kb": record["max_rss_kb"],
+                                   **sweep_record})
+
+    def total_seconds(self) -> typing.Dict[str, float]:
+        """Get the total wall time spent in each sweep over the kept
+        records.
+
+        Returns
+        -------
+        dict
+            Total seconds by sweep name
+
+        """
+        totals = {}
+        for record in self.records:
+            for sweep_record in record["sweeps"]:
+                name = sweep_record["sweep"]
+                totals[name] = totals.get(name, 0) + sweep_record["seconds"]
+        return totals
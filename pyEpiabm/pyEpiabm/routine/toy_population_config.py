@@ -184,20 +184,19 @@ class ToyPopulationFactory(AbstractPopulationFactory):
         """
         try:
             if method == "random":
-                for cell in population.cells:
+                cell_locations = np.array([cell.location for cell
+                                           in population.cells], dtype=float)
+                for i, cell in enumerate(population.cells):
                     cell.set_location(tuple(np.random.rand(2)))
+                    cell_locations[i] = cell.location
                     for microcell in cell.microcells:
                         while True:
                             # Will keep random location only if microcell
                             # is closer to its cell's location than any other.
-                            # Not very efficient.
                             microcell.set_location(tuple(np.random.rand(2)))
-                            cell_dist = (DistanceFunctions.dist(microcell.
-                                         location, cell.location))
-                            inter_dist = [DistanceFunctions.dist(microcell.
-                                          location, cell2.location) for cell2
-                                          in population.cells]
-                            if min(inter_dist) == cell_dist:
+                            inter_dist = DistanceFunctions.dist_many(
+                                microcell.location, cell_locations)
+                            if np.min(inter_dist) == inter_dist[i]:
                                 break
 
             elif method == "uniform_x":
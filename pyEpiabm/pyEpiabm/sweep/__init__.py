@@ -17,6 +17,7 @@ from .queue_sweep import QueueSweep
 from .spatial_sweep import SpatialSweep
 from .update_place_sweep import UpdatePlaceSweep
 from .intervention_sweep import InterventionSweep
+from .traveller_manager import TravellerManager
 from .travel_sweep import TravelSweep
 from .transition_matrices import StateTransitionMatrix, TransitionTimeMatrix
 from .initial_vaccine_sweep import InitialVaccineQueue
@@ -8,7 +8,20 @@ from pyEpiabm.core import Population
 class AbstractSweep:
     """Abstract class for Population Sweeps.
 
+    Sweeps which test infection events count the events tested in
+    `infection_attempts` and the successful ones in `infections`.
+
+    Sweeps which support aggregate mode (`aggregate_inactive_cells`) only
+    visit the people of active cells (see :meth:`Cell.is_active`), leaving
+    cells which are fully susceptible or past the epidemic described by
+    their compartment counters alone. A cell is visited again once an
+    infection lands in it.
+
     """
+    infection_attempts = 0
+    infections = 0
+    aggregate_inactive_cells = False
+
     def bind_population(self, population: Population):
         """Set the population which the sweep will act on.
 
@@ -21,6 +34,21 @@ class AbstractSweep:
         # Possibly add check to see if self._population has already been set
         self._population = population
 
+    def _cells(self):
+        """Get the cells whose people the sweep visits, which are only the
+        active cells in aggregate mode.
+
+        Returns
+        -------
+        typing.Iterable[Cell]
+            Cells to visit
+
+        """
+        if self.aggregate_inactive_cells:
+            return (cell for cell in self._population.cells
+                    if cell.is_active())
+        return self._population.cells
+
     def __call__(self, time: float):
         """Run sweep over population.
 
@@ -31,3 +59,21 @@ class AbstractSweep:
 
         """
         raise NotImplementedError
+
+    def has_pending_events(self, time: float) -> bool:
+        """Query if the sweep may still change the population once no one
+        is exposed or infectious, for example by introducing infected
+        people. Used to end simulations early once the epidemic is extinct.
+
+        Parameters
+        ----------
+        time : float
+            Current simulation time
+
+        Returns
+        -------
+        bool
+            Whether the sweep has events pending
+
+        """
+        return False
@@ -20,7 +20,8 @@ class HostProgressionSweep(AbstractSweep):
 
     """
 
-    def __init__(self):
+    def __init__(self, lazy_infectiousness: bool = False,
+                 aggregate_inactive_cells: bool = False):
         """Initialise parameters to be used in class methods. State
         transition matrix is set where each row of the matrix corresponds
         to a current infection status of a person. The columns of that
@@ -34,7 +35,21 @@ class HostProgressionSweep(AbstractSweep):
         infectiousness and which depends on time since the start of the
         infection, measured in timesteps (following what is done in Covidsim).
 
+        Parameters
+        ----------
+        lazy_infectiousness : bool
+            Whether infectious people keep a reference to the infectiousness
+            progression, so their infectiousness is computed when needed at
+            the time of the force of infection calculation rather than
+            updated by this sweep every time step
+        aggregate_inactive_cells : bool
+            Whether to only visit the people of active cells, in which
+            people may change status. Ignored when disease testing is used,
+            as everyone may then be tested
+
         """
+        self.lazy_infectiousness = lazy_infectiousness
+        self.aggregate_inactive_cells = aggregate_inactive_cells
         # Instantiate state transition matrix
         use_ages = Parameters.instance().use_ages
         coefficients = defaultdict(int, Parameters.instance()
@@ -104,7 +119,8 @@ class HostProgressionSweep(AbstractSweep):
         """Assigns the initial infectiousness of a person for when they go from
         the exposed infection state to the next state, either InfectAsympt,
         InfectMild or InfectGP. Also assigns the infection start time and
-        stores it as an attribute of the person.
+        stores it as an attribute of the person, and reports the new case to
+        the person's cell.
 
         Called right after an exposed person has been given its
         new infection status in the call method below.
@@ -132,6 +148,7 @@ class HostProgressionSweep(AbstractSweep):
         person.infection_start_time = time
         if person.infection_start_time < 0:
             raise ValueError('The infection start time cannot be negative')
+        person.microcell.cell.notify_new_case(time, person.age_group)
 
     def update_next_infection_status(self, person: Person):
         """Assigns next infection status based on current infection status
@@ -245,7 +262,10 @@ class HostProgressionSweep(AbstractSweep):
         if the person is in an infectious state. Updates the infectiousness to
         0 if the person has just been transferred to Recovered or Dead. Doesn't
         do anything if the person was already in Recovered, Dead, Susceptible,
-        or Exposed (ie if the infectiousness of the person was 0).
+        or Exposed (ie if the infectiousness of the person was 0). With lazy
+        infectiousness, infectious people are only given the infectiousness
+        progression, from which :meth:`Person.infectiousness_at` computes
+        their infectiousness.
 
         Parameters
         ----------
@@ -258,6 +278,14 @@ class HostProgressionSweep(AbstractSweep):
         """
         # Updates infectiousness with scaling if person is infectious:
         if str(person.infection_status).startswith('InfectionStatus.Infect'):
+            if self.lazy_infectiousness:
+                # Infectiousness is computed from the progression when needed
+                if person.infectiousness_progression is not \
+                        self.infectiousness_progression:
+                    person.infectiousness_progression = \
+                        self.infectiousness_progression
+                    person.infectiousness_time_step = self.model_time_step
+                return
             scale_infectiousness = self.infectiousness_progression
             time_since_infection = (int((time - person.infection_start_time)
                                         / self.model_time_step))
@@ -265,7 +293,9 @@ class HostProgressionSweep(AbstractSweep):
                 scale_infectiousness[time_since_infection]
         # Sets infectiousness to 0 if person just became Recovered, Dead, or
         # Vaccinated, and sets its infection start time to None again.
-        elif person.infectiousness != 0:
+        elif person.infectiousness != 0 or (
+                self.lazy_infectiousness and
+                person.infection_start_time is not None):
             if person.infection_status in [InfectionStatus.Recovered,
                                            InfectionStatus.Dead,
                                            InfectionStatus.Vaccinated]:
@@ -287,7 +317,13 @@ class HostProgressionSweep(AbstractSweep):
         # store list of uninfected or asymptomatic people for processing
         # for disease testing.
         asympt_or_uninf_people = []
-        for cell in self._population.cells:
+        if hasattr(Parameters.instance(), 'intervention_params') and \
+                'disease_testing' in Parameters.instance().\
+                intervention_params.keys():
+            cells = self._population.cells
+        else:
+            cells = self._cells()
+        for cell in cells:
             for person in cell.persons:
                 if person.time_of_status_change is None:
                     assert person.is_susceptible()
@@ -296,6 +332,10 @@ class HostProgressionSweep(AbstractSweep):
                 if person.infection_status in [InfectionStatus.Recovered,
                                                InfectionStatus.Vaccinated]:
                     asympt_or_uninf_people.append((cell, person))
+                if person.is_susceptible() and \
+                        person.time_of_status_change <= time:
+                    # Exposure set by the queue sweep is applied
+                    cell.pending_exposures -= 1
                 while person.time_of_status_change <= time:
                     person.update_status(person.next_infection_status)
                     if person.infection_status in \
@@ -18,6 +18,17 @@ class HouseholdSweep(AbstractSweep):
     exposed person is added to an infection queue.
 
     """
+    def __init__(self, aggregate_inactive_cells: bool = False):
+        """Constructor Method.
+
+        Parameters
+        ----------
+        aggregate_inactive_cells : bool
+            Whether to only visit the people of active cells
+
+        """
+        self.aggregate_inactive_cells = aggregate_inactive_cells
+
     def __call__(self, time: float):
         """Given a population structure, loops over infected members
         and considers whether they infected household members based
@@ -31,7 +42,7 @@ class HouseholdSweep(AbstractSweep):
         """
         # Double loop over the whole population, checking infectiousness
         # status, and whether they are absent from their household.
-        for cell in self._population.cells:
+        for cell in self._cells():
             infectious_persons = filter(Person.is_infectious, cell.persons)
             for infector in infectious_persons:
 
@@ -51,5 +62,7 @@ class HouseholdSweep(AbstractSweep):
                     # to see whether an infection event occurs in this timestep
                     # between the given persons.
                     r = random.uniform(0, 1)
+                    self.infection_attempts += 1
                     if r < force_of_infection:
                         cell.enqueue_person(infectee)
+                        self.infections += 1
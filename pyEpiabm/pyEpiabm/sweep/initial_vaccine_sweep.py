@@ -2,9 +2,8 @@
 # Initial Vaccination Sweep
 #
 
-import random
 import logging
-from itertools import count
+import numpy as np
 
 from pyEpiabm.core import Parameters
 from .abstract_sweep import AbstractSweep
@@ -13,7 +12,8 @@ from .abstract_sweep import AbstractSweep
 class InitialVaccineQueue(AbstractSweep):
     """Runs through the eligible population and adds people to a priority
     queue for vaccination, prioritised by age and added according to the
-    uptake in each age group.
+    uptake in each age group. The queue is built for the whole population at
+    once as an array based rollout plan.
     For a description of how the method functions in the context of vaccination
     see
     https://github.com/SABS-R3-Epidemiology/epiabm/wiki/Interventions#vaccination
@@ -68,6 +68,35 @@ class InitialVaccineQueue(AbstractSweep):
 
         return level
 
+    def assign_priority_groups(self, persons, age_thresholds):
+        """Assigns priority groups to a list of people at once, as in
+        :meth:`assign_priority_group`.
+
+        Parameters
+        ----------
+        persons : list
+            People in population
+        age_thresholds : list
+            List of the minimum age in each priority group
+
+        Returns
+        ----------
+        np.ndarray
+            Priority level of 1, 2, 3, or 4 for each person, or 0 if they
+            are not eligible for vaccination
+
+        """
+        ages = np.fromiter((np.nan if person.age is None else person.age
+                            for person in persons), dtype=float,
+                           count=len(persons))
+        care_home = np.fromiter((person.care_home_resident
+                                 for person in persons), dtype=bool,
+                                count=len(persons))
+        return np.select([care_home | (ages >= age_thresholds[0]),
+                          ages >= age_thresholds[1],
+                          ages >= age_thresholds[2],
+                          ages >= age_thresholds[3]], [1, 2, 3, 4], 0)
+
     def __call__(self, sim_params):
         """If vaccinations are to be performed, runs through the population
         and adds people to a priority queue if elligible for vaccination
@@ -78,15 +107,15 @@ class InitialVaccineQueue(AbstractSweep):
         if 'vaccine_params' in Parameters.instance().intervention_params:
             all_persons = [pers for cell in self._population.cells
                            for pers in cell.persons]
-            random.shuffle(all_persons)
-            unique = count()  # returns a count object. each time next() is
-            # called returns consecutive value. used to generate secondary
-            # priority index to order within each priority group.
-            for person in all_persons:
-                level = self.assign_priority_group(person,
-                                                   self.age_thresholds)
-                if (level is not None
-                        and random.random() <= self.prob_by_age[int(level)-1]):
-                    self._population.enqueue_vaccine(level,
-                                                     next(unique),
-                                                     person)
+            # Random order within each priority group
+            counters = np.random.permutation(len(all_persons))
+            levels = self.assign_priority_groups(all_persons,
+                                                 self.age_thresholds)
+            uptake = np.append(np.asarray(self.prob_by_age, dtype=float), 0)
+            vaccinated = np.random.random(len(all_persons)) <= \
+                uptake[levels - 1]
+            vaccinated &= levels > 0
+            people = np.empty(len(all_persons), dtype=object)
+            people[:] = all_persons
+            self._population.vaccine_queue.set_plan(
+                people[vaccinated], levels[vaccinated], counters[vaccinated])
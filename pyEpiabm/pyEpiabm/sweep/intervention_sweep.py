@@ -6,13 +6,14 @@ from pyEpiabm.core import Parameters
 from pyEpiabm.intervention import CaseIsolation, Vaccination, PlaceClosure
 from pyEpiabm.intervention import HouseholdQuarantine, SocialDistancing
 from pyEpiabm.intervention import DiseaseTesting, TravelIsolation
+from pyEpiabm.intervention import InterventionScheduler
 from .abstract_sweep import AbstractSweep
 
 
 class InterventionSweep(AbstractSweep):
     """Class to sweep through all possible interventions.
     Check if intervention should be active based on policy time and number
-    of infected individuals.
+    of infected individuals, using an :class:`InterventionScheduler`.
 
     Possible interventions:
 
@@ -48,10 +49,15 @@ class InterventionSweep(AbstractSweep):
                              'vaccine_params': Vaccination,
                              'travel_isolation': TravelIsolation}
 
+        # Interventions bound to a previous population are no longer used
+        for intervention in self.intervention_active_status:
+            intervention.detach()
+        self._scheduler = InterventionScheduler(self._population)
+        self.intervention_active_status = self._scheduler.active_status
         for intervention in self.intervention_params.keys():
             params = self.intervention_params[intervention]
-            self.intervention_active_status[(intervention_dict[intervention](
-                population=self._population, **params))] = False
+            self._scheduler.add_intervention(intervention_dict[intervention](
+                population=self._population, **params))
 
     def __call__(self, time):
         """Perform interventions that should take place.
@@ -62,21 +68,30 @@ class InterventionSweep(AbstractSweep):
             Simulation time
 
         """
-        for intervention in self.intervention_active_status.keys():
-            # TODO:
-            # - Include an alternative way of case-count.
-            #   Idealy this will be a global parameter that we can plot
-            # - Include condition on ICU
-            #   Intervention will be activated based on time and cases now.
-            #   We would like to implement a threshold based on ICU numbers.
-            num_cases = sum(map(lambda cell: cell.number_infectious(),
-                            self._population.cells))
-            if intervention.is_active(time, num_cases):
-                intervention(time)
-                if self.intervention_active_status[intervention] is False:
-                    self.intervention_active_status[intervention] = True
-
-            elif self.intervention_active_status[intervention] is True:
-                # turn off intervention
-                self.intervention_active_status[intervention] = False
-                intervention.turn_off()
+        # TODO:
+        # - Include an alternative way of case-count.
+        #   Idealy this will be a global parameter that we can plot
+        # - Include condition on ICU
+        #   Intervention will be activated based on time and cases now.
+        #   We would like to implement a threshold based on ICU numbers.
+        self._scheduler(time)
+
+    def has_pending_events(self, time: float) -> bool:
+        """Query if vaccination is still to be rolled out, as people may
+        still be vaccinated when no one is infectious.
+
+        Parameters
+        ----------
+        time : float
+            Current simulation time
+
+        Returns
+        -------
+        bool
+            Whether the sweep has events pending
+
+        """
+        return any(isinstance(intervention, Vaccination) and
+                   intervention.start_time + intervention.policy_duration
+                   >= time
+                   for intervention in self.intervention_active_status)
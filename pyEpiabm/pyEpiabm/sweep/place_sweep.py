@@ -18,6 +18,17 @@ class PlaceSweep(AbstractSweep):
     exposed person is added to an infection queue.
 
     """
+    def __init__(self, aggregate_inactive_cells: bool = False):
+        """Constructor Method.
+
+        Parameters
+        ----------
+        aggregate_inactive_cells : bool
+            Whether to only visit the people of active cells
+
+        """
+        self.aggregate_inactive_cells = aggregate_inactive_cells
+
     def __call__(self, time: float):
         """
         Given a population structure with places, loops over infected
@@ -33,7 +44,7 @@ class PlaceSweep(AbstractSweep):
         """
         # Double loop over the whole population, checking infectiousness
         # status, and whether they are absent from their household.
-        for cell in self._population.cells:
+        for cell in self._cells():
             for infector in cell.persons:
                 if not infector.is_infectious():
                     continue
@@ -54,6 +65,8 @@ class PlaceSweep(AbstractSweep):
                             if not infectee.is_susceptible():
                                 continue
                             cell.enqueue_person(infectee)
+                            self.infection_attempts += 1
+                            self.infections += 1
 
                     # Otherwise number of infectees is binomially
                     # distributed. Not sure if covidsim considers only
@@ -88,6 +101,8 @@ class PlaceSweep(AbstractSweep):
                             # occurs in this timestep between the given
                             # persons.
                             r = random.uniform(0, 1)
+                            self.infection_attempts += 1
 
                             if r < force_of_infection:
                                 cell.enqueue_person(infectee)
+                                self.infections += 1
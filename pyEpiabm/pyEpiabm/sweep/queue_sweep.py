@@ -26,18 +26,24 @@ class QueueSweep(AbstractSweep):
 
         """
         for cell in self._population.cells:
-            while not cell.person_queue.empty():
-                person = cell.person_queue.get()
-                # Get takes person from the queue and removes them, so clears
-                # the queue for the next timestep.
+            # Drain takes everyone from the queue and removes them, so
+            # clears the queue for the next timestep.
+            for person in cell.person_queue.drain():
+                if person.time_of_status_change is None:
+                    # Keep the cell active until the host progression sweep
+                    # applies the change of status
+                    cell.pending_exposures += 1
                 # Update the infection status
                 if person.is_vaccinated:
                     vacc_params = Parameters.instance().\
                         intervention_params['vaccine_params']
-                    delay = np.random.poisson(vacc_params['time_to_efficacy'],
-                                              1)
-                    if time > (person.date_vaccinated +
-                               delay):
+                    if person.date_vaccine_efficacy is None:
+                        # Efficacy dates are usually drawn on vaccination
+                        delay = np.random.poisson(
+                            vacc_params['time_to_efficacy'])
+                        person.date_vaccine_efficacy = \
+                            person.date_vaccinated + delay
+                    if time > person.date_vaccine_efficacy:
                         r = random.random()
                         if r < vacc_params['vacc_protectiveness']:
                             person.next_infection_status = InfectionStatus.\
@@ -3,6 +3,7 @@
 #
 
 
+import functools
 import random
 import numpy as np
 import logging
@@ -10,7 +11,8 @@ import typing
 
 from pyEpiabm.core import Cell, Parameters, Person
 from pyEpiabm.property import InfectionStatus, SpatialInfection
-from pyEpiabm.utility import DistanceFunctions, SpatialKernel
+from pyEpiabm.utility import DistanceFunctions, NeighbourCells, \
+    SpatialKernel
 
 from .abstract_sweep import AbstractSweep
 
@@ -26,6 +28,59 @@ class SpatialSweep(AbstractSweep):
     exposed person is added to an infection queue.
 
     """
+    def __init__(self, neighbour_cache_dir: typing.Optional[str] = None,
+                 kernel_cache_size: int = 65536):
+        """Constructor Method.
+
+        Parameters
+        ----------
+        neighbour_cache_dir : str
+            Directory in which the table of cells within the infection
+            radius of each cell is cached, so it is reused across runs over
+            the same cell locations. The table is not cached if None
+        kernel_cache_size : int
+            Maximum number of cell pairs for which the spatial kernel ratio
+            used in :meth:`find_infectees_Covidsim` is remembered
+
+        """
+        self.neighbour_cache_dir = neighbour_cache_dir
+        self.kernel_cache_size = kernel_cache_size
+        self._reset_kernel_cache()
+
+    def _reset_kernel_cache(self):
+        """Forget the spatial kernel ratios computed so far.
+
+        """
+        self.kernel_ratio = functools.lru_cache(
+            maxsize=self.kernel_cache_size)(self._kernel_ratio)
+
+    @staticmethod
+    def _kernel_ratio(infector_cell: Cell, infectee_cell: Cell) -> float:
+        """Ratio of the spatial kernel at the distance between two cells
+        to the spatial kernel at the minimum distance between their
+        microcells. This only depends on the cell and microcell locations,
+        so is memoised by :meth:`kernel_ratio` for each pair of cells.
+
+        Parameters
+        ----------
+        infector_cell : Cell
+            Cell of the infector
+        infectee_cell : Cell
+            Cell of the infectee
+
+        Returns
+        -------
+        float
+            Ratio of the spatial kernels
+
+        """
+        infection_distance = DistanceFunctions.dist(
+            infector_cell.location, infectee_cell.location)
+        minimum_dist = DistanceFunctions.minimum_between_cells(
+            infectee_cell, infector_cell)
+        return (SpatialKernel.weighting(infection_distance) /
+                SpatialKernel.weighting(minimum_dist))
+
     def __call__(self, time: float):
         """
         Given a population structure, loops over cells and generates
@@ -175,18 +230,20 @@ class SpatialSweep(AbstractSweep):
         current_cell = infector.microcell.cell
         infectee_list = []
         count = 0
+        # Weighting for cell choice in Covidsim uses cum_trans and
+        # invCDF arrays, which are equivalent to weighting by total
+        # susceptibles*max_transmission. May want to add transmission
+        # parameter later
+        susceptibles = np.array([sum(cell2.compartment_counter.retrieve()
+                                     [InfectionStatus.Susceptible])
+                                 for cell2 in possible_infectee_cells])
+        distances = DistanceFunctions.dist_many(
+            current_cell.location,
+            [cell2.location for cell2 in possible_infectee_cells])
+        weights = (susceptibles
+                   * SpatialKernel.weighting_many(distances)).tolist()
         while number_to_infect > 0 and count < self._population.total_people():
             count += 1
-            # Weighting for cell choice in Covidsim uses cum_trans and
-            # invCDF arrays, which are equivalent to weighting by total
-            # susceptibles*max_transmission. May want to add transmission
-            # parameter later
-            weights = [sum(cell2.compartment_counter.retrieve()
-                       [InfectionStatus.Susceptible]) * SpatialKernel
-                       .weighting(DistanceFunctions.dist(cell2.location,
-                                                         current_cell
-                                                         .location))
-                       for cell2 in possible_infectee_cells]
             infectee_cell = random.choices(possible_infectee_cells,
                                            weights=weights, k=1)[0]
             # Sample at random from the infectee cell to find
@@ -196,12 +253,7 @@ class SpatialSweep(AbstractSweep):
             # of the spatial kernel applied to the distance between people
             # to the spatial kernel of the shortest distance between
             # their cells.
-            infection_distance = DistanceFunctions.dist(
-                infector.microcell.cell.location, infectee_cell.location)
-            minimum_dist = DistanceFunctions.minimum_between_cells(
-                infectee_cell, current_cell)
-            infection_kernel = (SpatialKernel.weighting(infection_distance) /
-                                SpatialKernel.weighting(minimum_dist))
+            infection_kernel = self.kernel_ratio(current_cell, infectee_cell)
             if (infection_kernel > random.random()):
                 # Covidsim rejects the infection event if the distance
                 # between infector/infectee is too large.
@@ -247,11 +299,30 @@ class SpatialSweep(AbstractSweep):
         # occurs in this timestep between the given
         # persons.
         r = random.random()
+        self.infection_attempts += 1
         if r < force_of_infection:
             infectee.microcell.cell.enqueue_person(infectee)
+            self.infections += 1
 
     def bind_population(self, population):
+        """Set the population which the sweep will act on, and find the
+        cells within the infection radius of each cell.
+
+        Parameters
+        ----------
+        population : Population
+            Population: :class:`Population` to bind
+
+        """
         super().bind_population(population)
-        for cell in population.cells:
-            other_cells = [x for x in population.cells if x != cell]
-            cell.find_nearby_cells(other_cells)
+        self._reset_kernel_cache()
+        cells = population.cells
+        self.neighbour_cells = NeighbourCells.load_or_build(
+            [cell.location for cell in cells],
+            Parameters.instance().infection_radius,
+            self.neighbour_cache_dir)
+        for i, cell in enumerate(cells):
+            indices, distances = self.neighbour_cells.neighbours(i)
+            cell.nearby_cell_distances = {
+                cells[j].id: distance for j, distance
+                in zip(indices.tolist(), distances.tolist())}
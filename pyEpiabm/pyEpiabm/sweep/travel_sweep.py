@@ -6,10 +6,11 @@ import numpy as np
 import random
 import math
 
-from pyEpiabm.core import Population, Parameters, Microcell
+from pyEpiabm.core import Population, Parameters
 from pyEpiabm.property import InfectionStatus
 from pyEpiabm.sweep import HostProgressionSweep
 from .abstract_sweep import AbstractSweep
+from .traveller_manager import TravellerManager
 
 
 class TravelSweep(AbstractSweep):
@@ -20,7 +21,11 @@ class TravelSweep(AbstractSweep):
     the population and will be distributed over microcells based
     on population density of the microcells. Individuals will
     be removed from the population after a certain number of days
-    if they are isolated or quarantined.
+    if they are isolated or quarantined. A :class:`TravellerManager` keeps
+    the number of infectious people, the microcell density ranking and the
+    departure times of travellers up to date as people arrive, leave and
+    change status, so each time step scales with the number of travellers
+    rather than the population size.
 
     """
 
@@ -35,6 +40,21 @@ class TravelSweep(AbstractSweep):
         self.initial_cell.add_microcells(1)
         self.initial_microcell = self.initial_cell.microcells[0]
 
+    def bind_population(self, population):
+        """Set the population which the sweep will act on, and rank its
+        microcells by population density.
+
+        Parameters
+        ----------
+        population : Population
+            Population: :class:`Population` to bind
+
+        """
+        super(TravelSweep, self).bind_population(population)
+        if hasattr(self, "traveller_manager"):
+            self.traveller_manager.detach()
+        self.traveller_manager = TravellerManager(population)
+
     def __call__(self, time: float):
         """Based on number of infected cases in population, infected
         individuals are introduced to the population for a certain
@@ -49,8 +69,7 @@ class TravelSweep(AbstractSweep):
 
         """
         # Introduce number of individuals
-        num_cases = sum(map(lambda cell: cell.number_infectious(),
-                        self._population.cells))
+        num_cases = self.traveller_manager.number_infectious
         num_individuals_introduced_ratio = math.floor(
             num_cases * self.travel_params['ratio_introduce_cases'])
         if len(self.travel_params['constant_introduce_cases']) > 1:
@@ -75,6 +94,28 @@ class TravelSweep(AbstractSweep):
         # Remove individuals if the duration of their stay has passed
         self.remove_leaving_individuals(time)
 
+    def has_pending_events(self, time: float) -> bool:
+        """Query if travellers are still to leave the population, or a
+        constant number of infected individuals are still to be introduced.
+
+        Parameters
+        ----------
+        time : float
+            Current simulation time
+
+        Returns
+        -------
+        bool
+            Whether the sweep has events pending
+
+        """
+        if len(self.traveller_manager) > 0:
+            return True
+        constant = self.travel_params['constant_introduce_cases']
+        if len(constant) > 1:
+            return any(n >= 1 for n in constant[int(time):])
+        return constant[0] >= 1
+
     def create_introduced_individuals(self, time,
                                       number_individuals_introduced):
         """Create individuals and assign them an age and infectious status.
@@ -131,18 +172,22 @@ class TravelSweep(AbstractSweep):
                     number_indiv_InfectedMild,
                     status=InfectionStatus.InfectMild)
 
-        for person in self.initial_cell.persons:
-            # Assign introduced individuals a time to stay
-            person.travel_end_time = time + random.randint(
-                self.travel_params["duration_travel_stay"][0],
-                self.travel_params["duration_travel_stay"][1])
+        # Assign introduced individuals a time to stay
+        stay = np.random.randint(
+            self.travel_params["duration_travel_stay"][0],
+            self.travel_params["duration_travel_stay"][1] + 1,
+            size=len(self.initial_cell.persons))
+        host_progression = HostProgressionSweep()
+        for person, duration in zip(self.initial_cell.persons, stay):
+            person.travel_end_time = time + int(duration)
             # Assigns them their next infection status and the time of
             # their next status change. Also updates their infectiousness.
             person.next_infection_status = InfectionStatus.Recovered
             HostProgressionSweep.set_infectiousness(person, time)
-            HostProgressionSweep().update_time_status_change(person, time)
+            host_progression.update_time_status_change(person, time)
             # Store travellers
             self._population.travellers.append(person)
+            self.traveller_manager.add_departure(person)
 
     def assign_microcell_and_household(self, number_individuals_introduced):
         """Assign individuals introduced to microcells based on population
@@ -160,42 +205,35 @@ class TravelSweep(AbstractSweep):
             Infected individuals added to population at certain time step
 
         """
-        num_microcells_population = sum(len(cell.microcells) for cell in
-                                        self._population.cells)
-        microcells_to_choose_dict = {Microcell(self.initial_cell): 0 for _ in
-                                     range(min(number_individuals_introduced,
-                                               num_microcells_population))}
-        for possible_cell in self._population.cells:
-            for possible_microcell in possible_cell.microcells:
-                density_microcells_list = microcells_to_choose_dict.values()
-                if min(density_microcells_list) < len(
-                        possible_microcell.persons):
-                    # Remove old object
-                    microcells_to_choose_dict.pop(list(
-                        microcells_to_choose_dict.keys())[
-                        list(microcells_to_choose_dict.values()).index(
-                            min(density_microcells_list))])
-                    # Add new microcell
-                    microcells_to_choose_dict[possible_microcell] = \
-                        len(possible_microcell.persons)
+        people = self.initial_cell.persons
+        microcells = self.traveller_manager.choose_microcells(len(people))
+        r = np.random.random(len(people))
+        # Households not used for isolation in each selected microcell
+        existing_households = {}
 
         # Assign to microcell and household in existing population
-        for person in self.initial_cell.persons:
-            selected_microcell = random.choice(list(
-                microcells_to_choose_dict.keys()))
+        for person, selected_microcell, r_household in zip(
+                people, microcells, r):
             # Assign person to microcell and microcell to person
             selected_microcell.add_person(person)
+            self.traveller_manager.update_size(selected_microcell, 1)
             person.microcell = selected_microcell
-            r = random.random()
-            if r < self.travel_params['prob_existing_household']:
+            selected_microcell.cell.notify_new_case(
+                person.infection_start_time, person.age_group)
+            if selected_microcell not in existing_households:
+                existing_households[selected_microcell] = [
+                    h for h in selected_microcell.households
+                    if not h.isolation_location]
+            if r_household < self.travel_params['prob_existing_household']:
                 # Assign to existing household
                 selected_household = random.choice(
-                    [h for h in selected_microcell.households if not
-                     h.isolation_location])
+                    existing_households[selected_microcell])
                 selected_household.add_person(person)
             else:
                 # Create new household
                 selected_microcell.add_household([person])
+                existing_households[selected_microcell].append(
+                    person.household)
 
     def check_leaving_individuals(self, time, person):
         """Check if individuals travel_end_time is reached. If interventions
@@ -211,35 +249,14 @@ class TravelSweep(AbstractSweep):
             Instance of Person class
 
         """
-        if (hasattr(person, 'travel_end_time')) and \
+        if (person.travel_end_time is not None) and \
                 (time > person.travel_end_time):
-            interventions_list = {'isolation_start_time': hasattr(
-                                  person, 'isolation_start_time'),
-                                  'quarantine_start_time': hasattr(
-                                  person, 'quarantine_start_time'),
-                                  'travel_isolation_start_time': hasattr(
-                                  person, 'travel_isolation_start_time')}
-            if any(interventions_list.values()):
-                interventions_not_active = True
-                for intervention in interventions_list.keys():
-                    if interventions_list[intervention]:
-                        if intervention == 'isolation_start_time':
-                            if (person.isolation_start_time is not None) and \
-                                    (person.isolation_start_time <= time):
-                                interventions_not_active = False
-                        if intervention == 'quarantine_start_time':
-                            if (person.quarantine_start_time is not None) and \
-                                    (person.quarantine_start_time <= time):
-                                interventions_not_active = False
-                        if intervention == 'travel_isolation_start_time':
-                            if (person.travel_isolation_start_time is
-                                    not None) and \
-                                    (person.travel_isolation_start_time
-                                     <= time):
-                                interventions_not_active = False
-                return interventions_not_active
-            else:
-                return True
+            for start_time in (person.isolation_start_time,
+                               person.quarantine_start_time,
+                               person.travel_isolation_start_time):
+                if (start_time is not None) and (start_time <= time):
+                    return False
+            return True
         else:
             return False
 
@@ -253,7 +270,14 @@ class TravelSweep(AbstractSweep):
             Simulation time
 
         """
-        for person in list(reversed(self._population.travellers)):
-            if self.check_leaving_individuals(time, person):
-                person.remove_person()
-                self._population.travellers.remove(person)
+        leaving = self.traveller_manager.leaving(
+            time, self.check_leaving_individuals)
+        if not leaving:
+            return
+        for person in leaving:
+            self.traveller_manager.update_size(person.microcell, -1)
+            person.remove_person()
+        leaving = set(leaving)
+        self._population.travellers[:] = [
+            person for person in self._population.travellers
+            if person not in leaving]
@@ -0,0 +1,179 @@
+#
+# Bookkeeping for travellers arriving in and leaving the population
+#
+
+import bisect
+import heapq
+import itertools
+import numpy as np
+
+
+class TravellerManager:
+    """Class to track where travellers are placed and when they leave.
+    Microcells are ranked by population density once, and only the
+    microcells travellers arrive in or leave are moved in the ranking
+    afterwards. The number of infectious people in the population is kept
+    up to date by listening to the counts of each microcell. Travellers
+    are kept in a heap ordered by their `travel_end_time` so only those due
+    to leave are checked each time step.
+
+    """
+
+    def __init__(self, population):
+        """Constructor Method.
+
+        Parameters
+        ----------
+        population : Population
+            Population: :class:`Population` travellers are introduced to
+
+        """
+        self._population = population
+        self._departures = []
+        self._counter = itertools.count()
+        # Travellers whose stay has ended but who are still isolating or
+        # quarantining
+        self._waiting = []
+
+        self._microcells = [microcell for cell in population.cells
+                            for microcell in cell.microcells]
+        self._indices = {microcell: i
+                         for i, microcell in enumerate(self._microcells)}
+        self._sizes = [len(microcell.persons)
+                       for microcell in self._microcells]
+        # Sorted (-size, index) of each microcell, so ties keep the
+        # population order
+        self._ranking = sorted((-size, i)
+                               for i, size in enumerate(self._sizes))
+        self.number_infectious = 0
+        for microcell in self._microcells:
+            self.number_infectious += microcell.count_infectious()
+            microcell.add_count_listener(self._change_infectious)
+
+    def __len__(self):
+        """Number of travellers who have not yet left the population.
+
+        Returns
+        -------
+        int
+            Number of travellers waiting to leave
+
+        """
+        return len(self._departures) + len(self._waiting)
+
+    def detach(self):
+        """Stop listening to the counts of the microcells, for example when
+        the manager is replaced by a new one.
+
+        """
+        for microcell in self._microcells:
+            microcell.remove_count_listener(self._change_infectious)
+
+    def _change_infectious(self, microcell, n: int):
+        """Update the number of infectious people when the count of a
+        microcell changes.
+
+        Parameters
+        ----------
+        microcell : Microcell
+            Microcell whose count changed
+        n : int
+            Change in the count
+
+        """
+        self.number_infectious += n
+
+    @property
+    def density_ranking(self) -> list:
+        """Microcells ranked by their number of people, from the most to
+        the least densely populated. Ties keep the population order.
+
+        Returns
+        -------
+        list
+            Ranked microcells
+
+        """
+        return [self._microcells[i] for _, i in self._ranking]
+
+    def update_size(self, microcell, n: int):
+        """Move a microcell in the density ranking after n people are added
+        to it (or removed if n is negative).
+
+        Parameters
+        ----------
+        microcell : Microcell
+            Microcell whose number of people changed
+        n : int
+            Change in the number of people
+
+        """
+        i = self._indices[microcell]
+        key = (-self._sizes[i], i)
+        del self._ranking[bisect.bisect_left(self._ranking, key)]
+        self._sizes[i] += n
+        bisect.insort(self._ranking, (-self._sizes[i], i))
+
+    def choose_microcells(self, n: int) -> list:
+        """Choose microcells for n travellers. Each traveller is placed in
+        one of the n most densely populated microcells (or any microcell if
+        there are fewer), chosen uniformly at random.
+
+        Parameters
+        ----------
+        n : int
+            Number of travellers
+
+        Returns
+        -------
+        list
+            Microcell for each traveller
+
+        """
+        num_choices = min(n, len(self._ranking))
+        if num_choices == 0:
+            return []
+        choices = np.random.randint(num_choices, size=n)
+        return [self._microcells[self._ranking[i][1]] for i in choices]
+
+    def add_departure(self, person):
+        """Record when a traveller is due to leave the population.
+
+        Parameters
+        ----------
+        person : Person
+            Traveller with a `travel_end_time`
+
+        """
+        heapq.heappush(self._departures, (person.travel_end_time,
+                                          next(self._counter), person))
+
+    def leaving(self, time: float, can_leave) -> list:
+        """Get the travellers who leave the population at this time. People
+        past their `travel_end_time` leave once `can_leave(time, person)` is
+        True, and are checked again at later times until then.
+
+        Parameters
+        ----------
+        time : float
+            Simulation time
+        can_leave : callable
+            Function returning whether a person can leave at this time
+
+        Returns
+        -------
+        list
+            Travellers leaving the population
+
+        """
+        while self._departures and self._departures[0][0] < time:
+            self._waiting.append(heapq.heappop(self._departures)[2])
+        leaving = []
+        still_waiting = []
+        for person in self._waiting:
+            if can_leave(time, person):
+                leaving.append(person)
+            else:
+                still_waiting.append(person)
+        self._waiting = still_waiting
+        return leaving
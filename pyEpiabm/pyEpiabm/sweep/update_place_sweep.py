@@ -17,6 +17,19 @@ class UpdatePlaceSweep(AbstractSweep):
     class.
 
     """
+    def __init__(self, aggregate_inactive_cells: bool = False):
+        """Constructor Method.
+
+        Parameters
+        ----------
+        aggregate_inactive_cells : bool
+            Whether to only visit the people of active cells. Places of
+            inactive cells are only refilled once the cell is active again,
+            as no one in them can infect or be infected until then
+
+        """
+        self.aggregate_inactive_cells = aggregate_inactive_cells
+
     def __call__(self, time: float):
         """Given a population structure, updates the people
         present in each place at a specific timepoint.
@@ -32,7 +45,7 @@ class UpdatePlaceSweep(AbstractSweep):
 
         # Can call a this line if being called in from file etc.
         params = Parameters.instance().place_params
-        for cell in self._population.cells:
+        for cell in self._cells():
             for place in cell.places:
                 param_ind = place.place_type.value - 1
                 if param_ind < len(params["mean_size"]):
@@ -257,6 +257,60 @@ class TestSimFunctional(TestFunctional):
                                  (file_input['Susceptible'][i]
                                   + file_input["InfectMild"][i]))
 
+    def test_aggregate_inactive_cells(self, *mocks):
+        """Functional test to ensure skipping inactive cells gives the same
+        epidemic as visiting everyone, including people infected in cells
+        which had no one exposed or infectious.
+        """
+        pop_params = {"population_size": 1000, "cell_number": 20,
+                      "microcell_number": 2, "household_number": 5,
+                      "population_seed": 42}
+        sim_params = {"simulation_start_time": 0, "simulation_end_time": 40,
+                      "initial_infected_number": 2, "simulation_seed": 42}
+        params = pe.Parameters.instance()
+        intervention_params = params.intervention_params
+        infectiousness_prof = list(params.infectiousness_prof)
+        # Disease testing visits everyone, so is not used
+        params.intervention_params = {}
+        populations = []
+        for _ in range(2):
+            population = pe.routine.ToyPopulationFactory.make_pop(pop_params)
+            pe.routine.ToyPopulationFactory.assign_cell_locations(population)
+            populations.append(population)
+        states = []
+        try:
+            for population, aggregate in zip(populations, [False, True]):
+                # Making a host progression sweep changes the
+                # infectiousness profile used by the next one
+                params.infectiousness_prof = list(infectiousness_prof)
+                sweeps = [pe.sweep.HouseholdSweep(aggregate),
+                          pe.sweep.SpatialSweep(), pe.sweep.QueueSweep(),
+                          pe.sweep.HostProgressionSweep(
+                              aggregate_inactive_cells=aggregate)]
+                with patch('pyEpiabm.output._csv_dict_writer.open',
+                           mock_open()):
+                    sim = pe.routine.Simulation()
+                    sim.configure(population,
+                                  [pe.sweep.InitialInfectedSweep()],
+                                  sweeps, sim_params, self.file_params)
+                    sim.run_sweeps()
+                del sim.writer
+                states.append([(person.infection_status,
+                                person.next_infection_status,
+                                person.time_of_status_change)
+                               for cell in population.cells
+                               for person in cell.persons])
+        finally:
+            params.intervention_params = intervention_params
+            params.infectiousness_prof = infectiousness_prof
+
+        self.assertEqual(states[0], states[1])
+        # The epidemic spread to cells with no one exposed or infectious
+        infected_cells = sum(
+            any(not person.is_susceptible() for person in cell.persons)
+            for cell in populations[1].cells)
+        self.assertGreater(infected_cells, 2)
+
 
 if __name__ == '__main__':
     unittest.main()
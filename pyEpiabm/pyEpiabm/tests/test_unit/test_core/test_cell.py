@@ -1,5 +1,4 @@
 import unittest
-from queue import Queue
 
 import pyEpiabm as pe
 from pyEpiabm.property.infection_status import InfectionStatus
@@ -19,9 +18,9 @@ class TestCell(TestPyEpiabm):
         self.assertEqual(self.cell.microcells, [])
         self.assertEqual(self.cell.persons, [])
         self.assertEqual(self.cell.places, [])
-        self.assertIsInstance(self.cell.person_queue, Queue)
-        self.assertIsInstance(self.cell.PCR_queue, Queue)
-        self.assertIsInstance(self.cell.LFT_queue, Queue)
+        self.assertIsInstance(self.cell.person_queue, pe._PersonQueue)
+        self.assertIsInstance(self.cell.PCR_queue, pe._PersonQueue)
+        self.assertIsInstance(self.cell.LFT_queue, pe._PersonQueue)
         self.assertRaises(ValueError, pe.Cell, (.2, .3, .4))
 
     def test_repr(self):
@@ -59,6 +58,11 @@ class TestCell(TestPyEpiabm):
         person.update_status(InfectionStatus.Recovered)
         self.assertEqual(self.cell.number_infectious(), 0)
 
+    def test_notify_new_case(self):
+        self.cell.notify_new_case(2.0, 0)
+        self.assertEqual(sum(self.cell.new_case_counter.retrieve(1, 2)), 1)
+        self.assertEqual(sum(self.cell.new_case_counter.retrieve(2, 3)), 0)
+
     def test_set_loc(self):
         self.assertEqual(self.cell.location, (0, 0))
         self.cell.set_location((3.0, 2.0))
@@ -74,6 +78,41 @@ class TestCell(TestPyEpiabm):
         self.assertEqual(self.cell.PCR_queue.qsize(), 1)
         self.assertEqual(self.cell.LFT_queue.qsize(), 1)
 
+    def test_enqueue_person_unique(self):
+        self.cell.add_microcells(1)
+        self.cell.microcells[0].add_people(1)
+        person = self.cell.microcells[0].persons[0]
+        self.cell.enqueue_person(person)
+        self.cell.enqueue_person(person)
+        self.assertEqual(self.cell.person_queue.qsize(), 1)
+
+    def test_is_active(self):
+        self.cell.add_microcells(1)
+        self.cell.microcells[0].add_people(2)
+        person = self.cell.microcells[0].persons[0]
+        self.assertFalse(self.cell.is_active())
+        self.cell.enqueue_person(person)
+        self.assertTrue(self.cell.is_active())
+        self.cell.person_queue = pe._PersonQueue()
+        person.update_status(InfectionStatus.Exposed)
+        self.assertTrue(self.cell.is_active())
+        person.update_status(InfectionStatus.InfectASympt)
+        self.assertTrue(self.cell.is_active())
+        person.update_status(InfectionStatus.Recovered)
+        self.assertFalse(self.cell.is_active())
+        self.cell.pending_exposures = 1
+        self.assertTrue(self.cell.is_active())
+
+    def test_expire_isolation_events(self):
+        self.cell.add_microcells(1)
+        self.cell.microcells[0].add_people(2)
+        for start, person in zip([1, 3], self.cell.persons):
+            person.isolation_start_time = start
+            self.cell.schedule_isolation(person)
+        self.cell.expire_isolation_events(3)
+        self.assertEqual([event[0] for event in self.cell.isolation_events],
+                         [3])
+
 
 if __name__ == '__main__':
     unittest.main()
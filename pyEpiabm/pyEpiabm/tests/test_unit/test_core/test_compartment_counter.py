@@ -1,4 +1,5 @@
 import unittest
+import copy
 import random
 import numpy as np
 from unittest.mock import patch
@@ -43,6 +44,26 @@ class TestCompartmentCounter(TestPyEpiabm):
         self.assertEqual(counter.retrieve()[InfectionStatus.Susceptible].all(),
                          0)
 
+    def test_totals(self):
+        counter = pe._CompartmentCounter("test")
+        counter._increment_compartment(2, InfectionStatus.Susceptible, 0)
+        counter._increment_compartment(1, InfectionStatus.Recovered,
+                                       counter.nb_age_groups - 1)
+        totals = np.zeros(len(InfectionStatus), dtype=int)
+        totals[InfectionStatus.Susceptible.value - 1] = 2
+        totals[InfectionStatus.Recovered.value - 1] = 1
+        np.testing.assert_array_equal(counter.totals(), totals)
+
+    def test_deepcopy(self):
+        counter = pe._CompartmentCounter("test")
+        counter._increment_compartment(1, InfectionStatus.Susceptible, 0)
+        copied = copy.deepcopy(counter)
+        copied.report(InfectionStatus.Susceptible, InfectionStatus.Exposed)
+        self.assertEqual(copied.totals()[InfectionStatus.Exposed.value - 1],
+                         1)
+        self.assertEqual(counter.totals()[InfectionStatus.Exposed.value - 1],
+                         0)
+
     @patch('pyEpiabm.core.Parameters.instance')
     def test_construct_no_age(self, mock_params):
         mock_params.return_value.use_ages = False
@@ -17,6 +17,9 @@ class TestMicrocell(TestPyEpiabm):
         self.assertEqual(self.microcell.persons, [])
         self.assertEqual(self.microcell.cell, self.cell)
         self.assertEqual(self.microcell.places, [])
+        self.assertIsNone(self.microcell.closure_start_time)
+        self.assertIsNone(self.microcell.distancing_start_time)
+        self.assertFalse(hasattr(self.microcell, '__dict__'))
 
     def test_repr(self):
         self.assertEqual(repr(self.microcell),
@@ -109,6 +112,69 @@ class TestMicrocell(TestPyEpiabm):
             person.update_status(InfectionStatus(i+3))
         self.assertEqual(self.microcell.count_infectious(), 4)
 
+    def test_threshold_callback(self):
+        self.microcell.add_people(3)
+        calls = []
+        self.microcell.add_threshold_callback(
+            2, lambda mc, above: calls.append((mc, above)))
+        self.microcell.add_threshold_callback(
+            1, lambda mc, above: calls.append(('icu', above)), count="icu")
+        self.assertRaises(ValueError, self.microcell.add_threshold_callback,
+                          1, print, count="dead")
+
+        persons = self.microcell.persons
+        persons[0].update_status(InfectionStatus.InfectMild)
+        self.assertEqual(calls, [])
+        persons[1].update_status(InfectionStatus.InfectASympt)
+        self.assertEqual(calls, [(self.microcell, True)])
+        persons[1].update_status(InfectionStatus.InfectICU)
+        self.assertEqual(calls[1:], [('icu', True)])
+        persons[1].update_status(InfectionStatus.Recovered)
+        self.assertEqual(calls[2:], [(self.microcell, False), ('icu', False)])
+        self.assertEqual(self.microcell.count_infectious(), 1)
+        self.assertEqual(self.microcell.count_icu(), 0)
+
+        # Callbacks are called on registration if already above threshold
+        self.microcell.add_threshold_callback(
+            1, lambda mc, above: calls.append(('new', above)))
+        self.assertEqual(calls[-1], ('new', True))
+
+    def test_remove_threshold_callback(self):
+        self.microcell.add_people(1)
+        calls = []
+
+        def callback(microcell, above):
+            calls.append(above)
+        self.microcell.add_threshold_callback(1, callback)
+        self.microcell.add_threshold_callback(2, callback)
+        self.microcell.remove_threshold_callback(callback)
+        self.microcell.persons[0].update_status(InfectionStatus.InfectMild)
+        self.assertEqual(calls, [])
+        self.assertRaises(ValueError,
+                          self.microcell.remove_threshold_callback,
+                          callback, count="dead")
+
+    def test_count_listener(self):
+        self.microcell.add_people(2)
+        calls = []
+
+        def listener(microcell, n):
+            calls.append((microcell, n))
+        self.microcell.add_count_listener(listener)
+        self.assertRaises(ValueError, self.microcell.add_count_listener,
+                          listener, count="dead")
+        persons = self.microcell.persons
+        persons[0].update_status(InfectionStatus.InfectMild)
+        persons[0].update_status(InfectionStatus.InfectGP)
+        persons[0].update_status(InfectionStatus.Recovered)
+        self.assertEqual(calls, [(self.microcell, 1), (self.microcell, -1)])
+
+        self.microcell.remove_count_listener(listener)
+        persons[1].update_status(InfectionStatus.InfectMild)
+        self.assertEqual(len(calls), 2)
+        self.assertRaises(ValueError, self.microcell.remove_count_listener,
+                          listener, count="dead")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+import numpy as np
+
+import pyEpiabm as pe
+from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
+
+
+class TestNewCaseCounter(TestPyEpiabm):
+    """Test the _NewCaseCounter class
+    """
+    def setUp(self) -> None:
+        self.subject = pe._NewCaseCounter("Cell 1")
+
+    def test_construct(self):
+        self.assertEqual(self.subject.identifier, "Cell 1")
+        if pe.Parameters.instance().use_ages:
+            nb_groups = len(pe.Parameters.instance().age_proportions)
+        else:
+            nb_groups = 1
+        self.assertEqual(self.subject.nb_age_groups, nb_groups)
+        np.testing.assert_array_equal(self.subject.retrieve(0, 10),
+                                      np.zeros(nb_groups))
+
+    def test_report(self):
+        self.subject.report(1.0, 0)
+        self.subject.report(1.0, 1)
+        self.subject.report(2.0, 1)
+        # Out of order times are kept sorted
+        self.subject.report(0.5, 0)
+        self.subject.report(1.0, 0)
+        self.assertEqual(self.subject._times, [0.5, 1.0, 2.0])
+        self.assertEqual(list(self.subject.retrieve(0, 1)[:2]), [3, 1])
+        self.assertEqual(list(self.subject.retrieve(1, 2)[:2]), [0, 1])
+        self.assertEqual(list(self.subject.retrieve(0.5, 1.5)[:2]), [2, 1])
+        self.assertEqual(sum(self.subject.retrieve(2, 3)), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 from unittest.mock import patch, MagicMock
+import numpy as np
 
 import pyEpiabm as pe
 from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
@@ -21,6 +22,19 @@ class TestPerson(TestPyEpiabm):
         self.assertTrue(0 <= self.person.age_group < 17)
         self.assertEqual(self.person.infectiousness, 0)
         self.assertEqual(self.person.microcell, self.microcell)
+        # Intervention fields are declared up front
+        self.assertIsNone(self.person.isolation_start_time)
+        self.assertIsNone(self.person.quarantine_start_time)
+        self.assertIsNone(self.person.travel_isolation_start_time)
+        self.assertFalse(self.person.travel_isolated)
+        self.assertIsNone(self.person.travel_end_time)
+        self.assertIsNone(self.person.distancing_enhanced)
+        self.assertIsNone(self.person.date_vaccinated)
+
+    def test_slots(self):
+        self.assertFalse(hasattr(self.person, '__dict__'))
+        with self.assertRaises(AttributeError):
+            self.person.undeclared_field = 1
 
     @patch("random.randint")
     @patch("random.choices")
@@ -81,6 +95,7 @@ class TestPerson(TestPyEpiabm):
                               self.cell, self.microcell)
         self.person.add_place(test_place)
         self.assertTrue(len(self.person.places) > 0)
+        self.assertEqual(self.person.place_type_mask, 0b10000)
         test_cell = pe.Cell()
         test_place_2 = pe.Place((1.0, 1.0), pe.property.PlaceType.Workplace,
 
@@ -89,26 +104,78 @@ class TestPerson(TestPyEpiabm):
 
         self.person.remove_place(test_place)
         self.assertEqual(len(self.person.places), 0)
+        self.assertEqual(self.person.place_type_mask, 0)
         self.assertRaises(KeyError, self.person.remove_place, test_place_2)
 
+    def test_place_type_mask(self):
+        workplaces = [pe.Place((1.0, 1.0), pe.property.PlaceType.Workplace,
+                               self.cell, self.microcell) for _ in range(2)]
+        outdoor = pe.Place((1.0, 1.0), pe.property.PlaceType.OutdoorSpace,
+                           self.cell, self.microcell)
+        # Swapping a place for one of another type updates the mask
+        self.person.add_place(workplaces[0])
+        self.assertEqual(self.person.place_type_mask,
+                         pe.property.PlaceType.mask(
+                             [pe.property.PlaceType.Workplace]))
+        self.person.remove_place(workplaces[0])
+        self.person.add_place(outdoor)
+        self.assertEqual(self.person.place_type_mask,
+                         pe.property.PlaceType.mask(
+                             [pe.property.PlaceType.OutdoorSpace]))
+        # The type stays set while the person is in another place of it
+        self.person.add_place(workplaces[0])
+        self.person.add_place(workplaces[1])
+        self.person.remove_place(workplaces[0])
+        self.assertEqual(self.person.place_type_mask,
+                         pe.property.PlaceType.mask(
+                             [pe.property.PlaceType.OutdoorSpace,
+                              pe.property.PlaceType.Workplace]))
+
     def test_is_place_closed(self):
         closure_place_type = pe.Parameters.instance().intervention_params[
             'place_closure']['closure_place_type']
         # Not in place closure
-        self.assertFalse(hasattr(self.person.microcell, 'closure_start_time'))
+        self.assertIsNone(self.person.microcell.closure_start_time)
         self.assertFalse(self.person.is_place_closed(closure_place_type))
         # Place closure time starts but the place is not in closure_place_type
         self.person.microcell.closure_start_time = 1
-        self.person.place_types.append(pe.property.PlaceType.Workplace)
+        self.person.add_place(pe.Place(
+            (1.0, 1.0), pe.property.PlaceType.Workplace,
+            self.person.microcell.cell, self.person.microcell))
         self.assertFalse(self.person.is_place_closed(closure_place_type))
         # Place closure time starts and the place is in closure_place_type
-        self.person.place_types.append(pe.property.PlaceType.PrimarySchool)
+        self.person.add_place(pe.Place(
+            (1.0, 1.0), pe.property.PlaceType.PrimarySchool,
+            self.person.microcell.cell, self.person.microcell))
         self.assertTrue(self.person.is_place_closed(closure_place_type))
+        # Place closure has not started yet at this time
+        self.assertFalse(self.person.is_place_closed(closure_place_type, 0))
+        self.assertTrue(self.person.is_place_closed(closure_place_type, 1))
+
+    def test_infectiousness_at(self):
+        self.person.infectiousness = 0.5
+        self.assertEqual(self.person.infectiousness_at(3), 0.5)
+        # Lazy evaluation from the infectiousness progression
+        self.person.infectiousness_progression = np.array([1.0, 2.0, 3.0])
+        self.person.infectiousness_time_step = 0.5
+        self.person.initial_infectiousness = 2
+        self.person.infection_start_time = 1
+        self.person.update_status(pe.property.InfectionStatus.InfectMild)
+        # The infectiousness seen at a time step is that of the step before
+        self.assertEqual(self.person.infectiousness_at(2), 4.0)
+        self.assertEqual(self.person.infectiousness_at(2.5), 6.0)
+        self.assertEqual(self.person.infectiousness_at(1.7), 2.0)
+        self.assertEqual(self.person.infectiousness_at(1), 2.0)
+        self.person.update_status(pe.property.InfectionStatus.Recovered)
+        self.assertEqual(self.person.infectiousness_at(2), 0)
 
     def test_vaccinate(self):
         self.person.vaccinate(time=5)
         self.assertTrue(self.person.is_vaccinated)
         self.assertEqual(self.person.date_vaccinated, 5)
+        self.assertIsNone(self.person.date_vaccine_efficacy)
+        self.person.vaccinate(time=5, efficacy_delay=2)
+        self.assertEqual(self.person.date_vaccine_efficacy, 7)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,38 @@
+import unittest
+
+import pyEpiabm as pe
+
+
+class TestPersonQueue(unittest.TestCase):
+    """Test the '_PersonQueue' class.
+    """
+
+    def test_fifo(self):
+        queue = pe._PersonQueue()
+        self.assertTrue(queue.empty())
+        for item in ["a", "b", "a", "c"]:
+            queue.put(item)
+        self.assertEqual(queue.qsize(), 4)
+        self.assertEqual(queue.get(), "a")
+        self.assertEqual(queue.drain(2), ["b", "a"])
+        self.assertEqual(queue.drain(), ["c"])
+        self.assertTrue(queue.empty())
+        self.assertRaises(IndexError, queue.get)
+
+    def test_unique(self):
+        queue = pe._PersonQueue(unique=True)
+        for item in ["a", "b", "a"]:
+            queue.put(item)
+        self.assertEqual(len(queue), 2)
+        self.assertEqual(queue.drain(1), ["a"])
+        # Once removed, a person can be enqueued again
+        queue.put("a")
+        self.assertEqual(queue.drain(), ["b", "a"])
+        queue.put("a")
+        self.assertEqual(queue.get(), "a")
+        queue.put("a")
+        self.assertEqual(queue.qsize(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+from unittest import mock
+
+import pyEpiabm as pe
+from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
+
+
+class TestVaccineRollout(TestPyEpiabm):
+    """Test the '_VaccineRollout' class.
+    """
+
+    def setUp(self) -> None:
+        super(TestVaccineRollout, self).setUp()
+        self.cell = pe.Cell()
+        self.cell.add_microcells(1)
+        self.cell.microcells[0].add_people(5)
+        self.people = self.cell.persons
+        self.rollout = pe._VaccineRollout()
+
+    def test_set_plan(self):
+        self.assertTrue(self.rollout.empty())
+        self.rollout.set_plan(self.people, [2, 1, 2, 1, 3], [0, 4, 1, 2, 3])
+        self.assertEqual(self.rollout.qsize(), 5)
+        self.assertEqual(self.rollout.queue[0], (1, 2, self.people[3]))
+        self.assertEqual(list(self.rollout.next_doses(3)),
+                         [self.people[3], self.people[1], self.people[0]])
+        self.assertEqual(len(self.rollout), 2)
+        self.assertEqual(list(self.rollout.next_doses(5)),
+                         [self.people[2], self.people[4]])
+        self.assertEqual(len(self.rollout.next_doses(1)), 0)
+
+    def test_put(self):
+        self.rollout.set_plan(self.people[:2], [2, 2])
+        self.rollout.next_doses(1)
+        self.rollout.put((1, 5, self.people[4]))
+        self.rollout.put((2, 0, self.people[3]))
+        self.assertEqual(self.rollout.qsize(), 3)
+        self.assertEqual([entry[2] for entry in self.rollout.queue],
+                         [self.people[4], self.people[3], self.people[1]])
+
+    @mock.patch('numpy.random.poisson')
+    def test_vaccinate_next(self, mock_poisson):
+        mock_poisson.return_value = [3, 0]
+        self.rollout.set_plan(self.people, [1, 1, 1, 2, 2])
+        vaccinated = self.rollout.vaccinate_next(2, 5, 2)
+        mock_poisson.assert_called_once_with(2, 2)
+        self.assertEqual(list(vaccinated), self.people[:2])
+        self.assertTrue(self.people[0].is_vaccinated)
+        self.assertEqual(self.people[0].date_vaccinated, 5)
+        self.assertEqual(self.people[0].date_vaccine_efficacy, 8)
+        self.assertEqual(self.people[1].date_vaccine_efficacy, 5)
+        self.assertFalse(self.people[2].is_vaccinated)
+
+
+if __name__ == '__main__':
+    unittest.main()
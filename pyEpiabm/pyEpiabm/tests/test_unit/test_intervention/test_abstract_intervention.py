@@ -42,6 +42,9 @@ class TestAbstractIntervention(unittest.TestCase):
         self.assertRaises(NotImplementedError,
                           self.intervention_object.turn_off)
 
+    def test_detach(self):
+        self.intervention_object.detach()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -50,17 +50,17 @@ class TestCaseIsolation(TestPyEpiabm):
     def test___call__(self, mock_random):
         mock_random.return_value = 0
         # Before isolation starts
-        self.assertFalse(hasattr(self.person_susc, 'isolation_start_time'))
-        self.assertFalse(hasattr(self.person_symp, 'isolation_start_time'))
+        self.assertIsNone(self.person_susc.isolation_start_time)
+        self.assertIsNone(self.person_symp.isolation_start_time)
 
         # Start isolation if the person is symptomatic
         self.caseisolation(time=5)
-        self.assertFalse(hasattr(self.person_susc, 'isolation_start_time'))
+        self.assertIsNone(self.person_susc.isolation_start_time)
         self.assertEqual(self.person_symp.isolation_start_time, 5)
 
         # End isolation
         self.caseisolation(time=150)
-        self.assertFalse(hasattr(self.person_susc, 'isolation_start_time'))
+        self.assertIsNone(self.person_susc.isolation_start_time)
         self.assertIsNone(self.person_symp.isolation_start_time)
 
     @mock.patch('random.random')
@@ -80,6 +80,7 @@ class TestCaseIsolation(TestPyEpiabm):
         mock_random.return_value = 0
         self.caseisolation.use_testing = 1
         self.person_susc.date_positive = 0
+        self._population.cells[0].add_isolation_candidate(self.person_susc)
         self.caseisolation(time=1)
 
         self.assertTrue(self.caseisolation.
@@ -87,6 +88,51 @@ class TestCaseIsolation(TestPyEpiabm):
         self.assertEqual(self.person_susc.isolation_start_time, 1)
         self.assertEqual(self._population.test_isolate_count[1], 1)
 
+    @mock.patch('random.random')
+    def test_candidates(self, mock_random):
+        mock_random.return_value = 0
+        cell = self._population.cells[0]
+        self.assertEqual(cell.isolation_candidates, {self.person_symp})
+        # People who are no longer eligible are dropped
+        self.person_symp.update_status(InfectionStatus.Recovered)
+        self.assertEqual(cell.isolation_candidates, set())
+        cell.add_isolation_candidate(self.person_susc)
+        self.caseisolation(time=1)
+        self.assertEqual(cell.isolation_candidates, set())
+        self.assertIsNone(self.person_susc.isolation_start_time)
+
+    @mock.patch('random.random')
+    def test_reisolation(self, mock_random):
+        mock_random.return_value = 0
+        self.caseisolation(time=5)
+        self.assertEqual(self.person_symp.isolation_start_time, 5)
+        self.assertEqual(len(self._population.cells[0].isolation_events), 1)
+        # Still symptomatic when isolation ends: isolate again next time
+        end_time = 5 + self.caseisolation.isolation_duration + 1
+        self.caseisolation(time=end_time)
+        self.assertIsNone(self.person_symp.isolation_start_time)
+        self.caseisolation(time=end_time + 1)
+        self.assertEqual(self.person_symp.isolation_start_time, end_time + 1)
+
+    @mock.patch('random.random')
+    def test_turn_off(self, mock_random):
+        mock_random.return_value = 0
+        self.caseisolation(time=5)
+        self.caseisolation.turn_off()
+        self.assertIsNone(self.person_symp.isolation_start_time)
+        self.assertEqual(self.caseisolation._isolation_ends, [])
+
+    @mock.patch('random.random')
+    def test_expire_isolation_events(self, mock_random):
+        mock_random.return_value = 0
+        events = self._population.cells[0].isolation_events
+        self.caseisolation(time=5)
+        self.assertEqual(len(events), 1)
+        # Without household quarantine to act on them, isolation events are
+        # dropped once their start time has passed
+        self.caseisolation(time=6)
+        self.assertEqual(events, [])
+
 
 if __name__ == '__main__':
     unittest.main()
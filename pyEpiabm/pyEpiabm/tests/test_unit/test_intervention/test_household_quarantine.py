@@ -60,14 +60,16 @@ class TestHouseholdQuarantine(TestPyEpiabm):
         self.householdquarantine.quarantine_house_compliant = 1.0
         self.householdquarantine.quarantine_individual_compliant = 1.0
         self.sympt_person.isolation_start_time = 3
+        self.test_population.cells[0].schedule_isolation(self.sympt_person)
         self.householdquarantine(time=3)
-        self.assertFalse(hasattr(self.sympt_person, 'quarantine_start_time'))
+        self.assertIsNone(self.sympt_person.quarantine_start_time)
         self.assertEqual(self.susc_person1.quarantine_start_time, 4)
         self.assertEqual(self.susc_person2.quarantine_start_time, 4)
 
         # Second household infection while in quarantine. Quarantine
         # also assigned to first infected individual still in isolation.
         self.susc_person2.isolation_start_time = 6
+        self.test_population.cells[0].schedule_isolation(self.susc_person2)
         self.householdquarantine(time=6)
         self.assertEqual(self.sympt_person.quarantine_start_time, 7)
         self.assertEqual(self.susc_person1.quarantine_start_time, 7)
@@ -76,13 +78,43 @@ class TestHouseholdQuarantine(TestPyEpiabm):
         self.householdquarantine(time=22)
         self.assertIsNone(self.susc_person1.quarantine_start_time)
 
+    def test_missed_isolation(self):
+        # Isolations which started before the intervention was called do not
+        # trigger quarantine
+        self.sympt_person.isolation_start_time = 3
+        self.test_population.cells[0].schedule_isolation(self.sympt_person)
+        self.householdquarantine(time=4)
+        self.assertIsNone(self.susc_person1.quarantine_start_time)
+        self.assertEqual(self.test_population.cells[0].isolation_events, [])
+
     def test_turn_off(self):
-        self.susc_person1.quarantine_start_time = 370
+        self.householdquarantine.quarantine_individual_compliant = 1.0
+        self.sympt_person.isolation_start_time = 370
+        self.test_population.cells[0].schedule_isolation(self.sympt_person)
         self.householdquarantine(time=370)
+        self.assertIsNotNone(self.susc_person1.quarantine_start_time)
 
         self.householdquarantine.turn_off()
         self.assertIsNone(self.susc_person1.quarantine_start_time)
 
+    def test_restarted_quarantine(self):
+        self.householdquarantine.quarantine_individual_compliant = 1.0
+        self.sympt_person.isolation_start_time = 3
+        self.test_population.cells[0].schedule_isolation(self.sympt_person)
+        self.householdquarantine(time=3)
+        self.susc_person2.isolation_start_time = 6
+        self.test_population.cells[0].schedule_isolation(self.susc_person2)
+        self.householdquarantine(time=6)
+        ends = self.householdquarantine._quarantine_ends
+        self.assertEqual(len(ends), 4)
+        # The stale end of the first quarantine is dropped without queueing
+        # the new end again
+        duration = self.householdquarantine.quarantine_duration
+        self.householdquarantine(time=4 + duration + 1)
+        self.assertEqual(len(ends), 2)
+        self.assertEqual(self.susc_person1.quarantine_start_time, 7)
+        self.assertEqual(len(self.householdquarantine._queued_ends), 2)
+
 
 if __name__ == '__main__':
     unittest.main()
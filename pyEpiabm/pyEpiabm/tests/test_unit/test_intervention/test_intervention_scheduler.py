@@ -0,0 +1,89 @@
+import unittest
+from unittest import mock
+
+import pyEpiabm as pe
+from pyEpiabm.intervention import AbstractIntervention, InterventionScheduler
+from pyEpiabm.property import InfectionStatus
+from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
+
+
+class RecordingIntervention(AbstractIntervention):
+    """Intervention which records when it is run.
+    """
+    calls = []
+
+    def __init__(self, name, *args, **kwargs):
+        super(RecordingIntervention, self).__init__(*args, **kwargs)
+        self.name = name
+        self.turn_off = mock.Mock()
+        self.detach = mock.Mock()
+
+    def __call__(self, time):
+        RecordingIntervention.calls.append(self.name)
+
+
+class TestInterventionScheduler(TestPyEpiabm):
+    """Test the 'InterventionScheduler' class.
+    """
+
+    def setUp(self) -> None:
+        super(TestInterventionScheduler, self).setUp()
+        self._population = pe.Population()
+        self._population.add_cells(1)
+        self._population.cells[0].add_microcells(1)
+        self._population.cells[0].microcells[0].add_people(
+            2, status=InfectionStatus.InfectMild)
+        self.scheduler = InterventionScheduler(self._population)
+        RecordingIntervention.calls = []
+
+    def make_intervention(self, start_time, policy_duration,
+                          case_threshold=0, name=None):
+        return RecordingIntervention(name, start_time, policy_duration,
+                                     self._population, case_threshold)
+
+    def test_number_of_cases(self):
+        self.assertEqual(self.scheduler.number_of_cases(), 2)
+
+    def test_windows(self):
+        late = self.make_intervention(5, 2, name="late")
+        early = self.make_intervention(0, 3, name="early")
+        self.scheduler.add_intervention(late)
+        self.scheduler.add_intervention(early)
+        for time in range(9):
+            self.scheduler(time)
+        self.assertEqual(RecordingIntervention.calls,
+                         ["early"] * 4 + ["late"] * 3)
+        early.turn_off.assert_called_once()
+        late.turn_off.assert_called_once()
+        # Interventions are detached once their policy has ended
+        early.detach.assert_called_once()
+        late.detach.assert_called_once()
+        self.assertEqual(self.scheduler.active_status,
+                         {late: False, early: False})
+        self.assertEqual(self.scheduler._open, {})
+
+    def test_case_threshold(self):
+        intervention = self.make_intervention(0, 10, case_threshold=3)
+        self.scheduler.add_intervention(intervention)
+        with mock.patch.object(self.scheduler, 'number_of_cases',
+                               side_effect=[2, 3, 2]) as mock_cases:
+            self.scheduler(0)
+            self.assertFalse(self.scheduler.active_status[intervention])
+            self.scheduler(1)
+            self.assertTrue(self.scheduler.active_status[intervention])
+            self.scheduler(2)
+            self.assertFalse(self.scheduler.active_status[intervention])
+        # Cases are counted once per step
+        self.assertEqual(mock_cases.call_count, 3)
+        intervention.turn_off.assert_called_once()
+
+    def test_not_started(self):
+        self.scheduler.add_intervention(self.make_intervention(5, 2))
+        with mock.patch.object(self.scheduler,
+                               'number_of_cases') as mock_cases:
+            self.scheduler(0)
+        mock_cases.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
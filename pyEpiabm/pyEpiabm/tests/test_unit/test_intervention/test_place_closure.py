@@ -45,12 +45,20 @@ class TestPlaceClosure(TestPyEpiabm):
                          self.params['case_microcell_threshold'])
 
     def test___call__(self):
-        self.assertFalse(hasattr(self._microcell, 'closure_start_time'))
+        self.assertIsNone(self._microcell.closure_start_time)
         self.placeclosure(time=5)
         self.assertIsNotNone(self._microcell.closure_start_time)
         self.placeclosure(time=150)
         self.assertIsNone(self._microcell.closure_start_time)
 
+    def test_threshold_crossed(self):
+        self.assertEqual(self.placeclosure._above_threshold,
+                         {0: self._microcell})
+        self._microcell.persons[0].update_status(InfectionStatus.Recovered)
+        self.assertEqual(self.placeclosure._above_threshold, {})
+        self.placeclosure(time=5)
+        self.assertIsNone(self._microcell.closure_start_time)
+
     def test_turn_off(self):
         self._microcell.closure_start_time = 370
         self.placeclosure(time=370)
@@ -58,6 +66,14 @@ class TestPlaceClosure(TestPyEpiabm):
         self.placeclosure.turn_off()
         self.assertIsNone(self._microcell.closure_start_time)
 
+    def test_detach(self):
+        self.placeclosure.detach()
+        self.assertEqual(self.placeclosure._above_threshold, {})
+        # Threshold crossings are no longer reported
+        self._microcell.persons[0].update_status(InfectionStatus.Recovered)
+        self._microcell.persons[0].update_status(InfectionStatus(7))
+        self.assertEqual(self.placeclosure._above_threshold, {})
+
 
 if __name__ == '__main__':
     unittest.main()
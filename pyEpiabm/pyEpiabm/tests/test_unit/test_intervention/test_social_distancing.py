@@ -51,11 +51,11 @@ class TestSocialDistancing(TestPyEpiabm):
 
     def test___call__(self):
         # Social distancing haven't start
-        self.assertFalse(hasattr(self.microcell, 'distancing_start_time'))
+        self.assertIsNone(self.microcell.distancing_start_time)
         # Age group exists with normal social distancing
         self.person.age_group = 0
         self.socialdistancing(time=5)
-        self.assertTrue(hasattr(self.microcell, 'distancing_start_time'))
+        self.assertIsNotNone(self.microcell.distancing_start_time)
         self.assertFalse(self.person.distancing_enhanced)
         # Social distancing ends
         self.socialdistancing(time=150)
@@ -79,6 +79,22 @@ class TestSocialDistancing(TestPyEpiabm):
         self.socialdistancing.turn_off()
         self.assertIsNone(self.microcell.distancing_start_time)
 
+    def test_detach(self):
+        population = self.pop_factory.make_pop(self.pop_params)
+        microcell = population.cells[0].microcells[0]
+        person = microcell.persons[0]
+        person.update_status(InfectionStatus(7))
+        params = pe.Parameters.instance().intervention_params[
+            'social_distancing']
+        socialdistancing = SocialDistancing(population=population, **params)
+        self.assertEqual(socialdistancing._above_threshold, {0: microcell})
+        socialdistancing.detach()
+        self.assertEqual(socialdistancing._above_threshold, {})
+        # Threshold crossings are no longer reported
+        person.update_status(InfectionStatus.Recovered)
+        person.update_status(InfectionStatus(7))
+        self.assertEqual(socialdistancing._above_threshold, {})
+
 
 if __name__ == '__main__':
     unittest.main()
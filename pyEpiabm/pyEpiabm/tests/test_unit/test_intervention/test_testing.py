@@ -1,5 +1,6 @@
 import unittest
 from unittest import mock
+import numpy as np
 
 import pyEpiabm as pe
 from pyEpiabm.property import InfectionStatus
@@ -43,9 +44,9 @@ class TestDiseaseTesting(TestPyEpiabm):
         self.assertEqual(self.testing.false_positive,
                          self.params['false_positive'])
 
-    @mock.patch('random.random')
+    @mock.patch('numpy.random.random')
     def test_true_results(self, mock_random):
-        mock_random.return_value = 1
+        mock_random.side_effect = lambda n: np.full(n, 1)
         self.person1.infection_status = InfectionStatus.InfectMild
         self.person2.infection_status = InfectionStatus.InfectMild
         self.cell.enqueue_PCR_testing(self.person1)
@@ -59,11 +60,12 @@ class TestDiseaseTesting(TestPyEpiabm):
         self.assertEqual(self.person2.date_positive, 1.0)
         self.assertEqual(self._population.test_count[0], 2)
 
-        self.assertEqual(mock_random.call_count, 2)
+        # All results are drawn at once
+        mock_random.assert_called_once_with(2)
 
-    @mock.patch('random.random')
+    @mock.patch('numpy.random.random')
     def test_false_results(self, mock_random):
-        mock_random.return_value = 0
+        mock_random.side_effect = lambda n: np.full(n, 0)
         self.person1.infection_status = InfectionStatus.Susceptible
         self.person2.infection_status = InfectionStatus.Susceptible
 
@@ -78,7 +80,65 @@ class TestDiseaseTesting(TestPyEpiabm):
         self.assertEqual(self.person2.date_positive, 1.0)
         self.assertEqual(self._population.test_count[1], 2)
 
-        self.assertEqual(mock_random.call_count, 2)
+        # All results are drawn at once
+        mock_random.assert_called_once_with(2)
+
+    @mock.patch('numpy.random.random')
+    def test_do_testing(self, mock_random):
+        mock_random.side_effect = lambda n: np.full(n, 0.5)
+        self.person1.infection_status = InfectionStatus.InfectMild
+        self.testing.do_testing(2.0, self.person1, 1)
+        self.testing.do_testing(2.0, self.person2, 1)
+        self.assertEqual(self.person1.date_positive, 2.0)
+        self.assertIsNone(self.person2.date_positive)
+        self.assertEqual(self._population.test_count, [1, 0])
+        self.assertIn(self.person1, self.cell.isolation_candidates)
+
+    def test_capacity_scope(self):
+        self.assertRaises(ValueError, DiseaseTesting,
+                          population=self._population,
+                          capacity_scope="global", **self.params)
+
+    @mock.patch('numpy.random.random')
+    def test_national_capacity(self, mock_random):
+        mock_random.side_effect = lambda n: np.full(n, 0.5)
+        self._population.add_cells(1)
+        cell2 = self._population.cells[1]
+        cell2.add_microcells(1)
+        cell2.microcells[0].add_people(2)
+        people = [self.person1, self.person2] + cell2.persons
+        for person in people[1:]:
+            person.infection_status = InfectionStatus.InfectMild
+        self.person2.infection_status = InfectionStatus.InfectASympt
+        self.cell.enqueue_PCR_testing(self.person1)
+        self.cell.enqueue_PCR_testing(self.person2)
+        for person in cell2.persons:
+            cell2.enqueue_PCR_testing(person)
+
+        params = dict(self.params, testing_capacity=[3, 0])
+        testing = DiseaseTesting(population=self._population,
+                                 capacity_scope="national", **params)
+        testing(time=1.0)
+        # The first three people in cell order are tested
+        self.assertEqual(self._population.test_count, [2, 0])
+        self.assertEqual(self.cell.PCR_queue.qsize(), 0)
+        self.assertEqual(cell2.PCR_queue.qsize(), 1)
+        self.assertEqual(cell2.persons[0].date_positive, 1.0)
+
+        testing = DiseaseTesting(population=self._population,
+                                 capacity_scope="national",
+                                 prioritise_symptomatic=True, **params)
+        for person in people[:3]:
+            person.microcell.cell.enqueue_PCR_testing(person)
+            person.date_positive = None
+        testing(time=2.0)
+        # Symptomatic people in cell 2 are tested first, then people in
+        # queue order, so only person 2 still waits
+        self.assertEqual(self._population.test_count, [2, 0])
+        self.assertEqual(list(self.cell.PCR_queue.drain()), [self.person2])
+        self.assertEqual(cell2.PCR_queue.qsize(), 0)
+        self.assertIsNone(self.person2.date_positive)
+        self.assertEqual(cell2.persons[1].date_positive, 2.0)
 
     def test_turn_off(self):
         self.person1.date_positive = 1.0
@@ -61,8 +61,7 @@ class TestTravelIsolation(TestPyEpiabm):
     def test___call__(self, mock_random):
         mock_random.return_value = 0
         # Before travel isolation starts
-        self.assertFalse(hasattr(
-            self.person_introduced, 'travel_isolation_start_time'))
+        self.assertIsNone(self.person_introduced.travel_isolation_start_time)
 
         # Create individual and test re-assigning household
         self.assertEqual(len(self._microcell.households), 1)
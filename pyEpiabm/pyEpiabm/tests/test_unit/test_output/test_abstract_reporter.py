@@ -45,6 +45,14 @@ class TestAbstractReporter(unittest.TestCase):
         self.assertRaises(NotImplementedError,
                           subject.write)
 
+    @mock.patch("os.path.exists")
+    @mock.patch("os.makedirs")
+    def test_branch(self, mock_makedirs, mock_pathexists):
+        subject = pe.output.AbstractReporter("test_folder", False)
+        subject.flush()
+        self.assertRaises(NotImplementedError,
+                          subject.branch, "branch_folder")
+
 
 if __name__ == '__main__':
     unittest.main()
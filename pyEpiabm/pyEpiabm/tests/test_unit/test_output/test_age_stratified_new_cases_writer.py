@@ -41,14 +41,12 @@ class TestAgeStratifiedNewCasesWriter(TestPyEpiabm):
             pe.Person(p.cells[0].microcells[0]) for i in range(
                 n_susc + n_old_cases + n_new_cases + n_new_cases_group_2)]
         for i in range(n_old_cases):
-            p.cells[0].persons[i].infection_start_time = 1.0
+            p.cells[0].notify_new_case(1.0, 0)
         for i in range(n_old_cases, n_old_cases + n_new_cases):
-            p.cells[0].persons[i].infection_start_time = 10.0
-            p.cells[0].persons[i].age_group = 0
+            p.cells[0].notify_new_case(10.0, 0)
         for i in range(n_old_cases + n_new_cases,
                        n_old_cases + n_new_cases + n_new_cases_group_2):
-            p.cells[0].persons[i].infection_start_time = 10.0
-            p.cells[0].persons[i].age_group = 1
+            p.cells[0].notify_new_case(10.0, 1)
 
         with patch('pyEpiabm.output._csv_writer.open', mo):
             m = pe.output.AgeStratifiedNewCasesWriter('mock_folder')
@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import patch, mock_open, call, MagicMock
 import os
+import tempfile
 
 import pyEpiabm as pe
 
@@ -50,6 +51,25 @@ class TestCsvDictWriter(unittest.TestCase):
             m.__del__()
             fake_file.close.assert_called_once()
 
+    def test_branch(self):
+        """Test the branch method of the _CsvDictWriter class.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            branch_folder = os.path.join(folder, 'branch')
+            m = pe.output._CsvDictWriter(folder, 'file.csv', ['Cat1', 'Cat2'])
+            m.write({'Cat1': 'a', 'Cat2': 'b'})
+            m.branch(branch_folder)
+            m.write({'Cat1': 'c', 'Cat2': 'd'})
+            m.flush()
+            self.assertEqual(m.folder, branch_folder)
+            with open(os.path.join(folder, 'file.csv')) as f:
+                self.assertEqual(f.read().split(), ['Cat1,Cat2', 'a,b'])
+            with open(os.path.join(branch_folder, 'file.csv')) as f:
+                self.assertEqual(f.read().split(),
+                                 ['Cat1,Cat2', 'a,b', 'c,d'])
+            self.assertRaises(ValueError, m.branch, branch_folder)
+            m.__del__()
+
 
 if __name__ == '__main__':
     unittest.main()
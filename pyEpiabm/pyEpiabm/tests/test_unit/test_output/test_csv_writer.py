@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import patch, mock_open, call, MagicMock
 import os
+import tempfile
 
 import pyEpiabm as pe
 
@@ -49,6 +50,25 @@ class TestCsvWriter(unittest.TestCase):
             m.__del__()
             fake_file.close.assert_called_once()
 
+    def test_branch(self):
+        """Test the branch method of the _CsvWriter class.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            branch_folder = os.path.join(folder, 'branch')
+            m = pe.output._CsvWriter(folder, 'file.csv', ['Cat1', 'Cat2'])
+            m.write(['a', 'b'])
+            m.branch(branch_folder)
+            m.write(['c', 'd'])
+            m.flush()
+            self.assertEqual(m.folder, branch_folder)
+            with open(os.path.join(folder, 'file.csv')) as f:
+                self.assertEqual(f.read().split(), ['Cat1,Cat2', 'a,b'])
+            with open(os.path.join(branch_folder, 'file.csv')) as f:
+                self.assertEqual(f.read().split(),
+                                 ['Cat1,Cat2', 'a,b', 'c,d'])
+            self.assertRaises(ValueError, m.branch, branch_folder)
+            m.__del__()
+
 
 if __name__ == '__main__':
     unittest.main()
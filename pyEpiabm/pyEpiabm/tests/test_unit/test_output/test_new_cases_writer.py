@@ -40,9 +40,9 @@ class TestNewCasesWriter(TestPyEpiabm):
             pe.Person(p.cells[0].microcells[0]) for i in range(
                 n_susc + n_old_cases + n_new_cases)]
         for i in range(n_old_cases):
-            p.cells[0].persons[i].infection_start_time = 1.0
+            p.cells[0].notify_new_case(1.0, 0)
         for i in range(n_old_cases, n_old_cases + n_new_cases):
-            p.cells[0].persons[i].infection_start_time = 10.0
+            p.cells[0].notify_new_case(10.0, 0)
 
         with patch('pyEpiabm.output._csv_writer.open', mo):
             m = pe.output.NewCasesWriter('mock_folder')
@@ -51,6 +51,25 @@ class TestNewCasesWriter(TestPyEpiabm):
             call('t,cell,new_cases\r\n'),
             call(f'10,{p.cells[0].id},{n_new_cases}\r\n')])
 
+    @patch('os.makedirs')
+    def test_write_window(self, mock_mkdir):
+        """Test the write method of the NewCasesWriter class with a
+        sub-daily window.
+        """
+        mo = mock_open()
+        p = pe.Population()
+        p.cells = [pe.Cell()]
+        p.cells[0].notify_new_case(9.5, 0)
+        p.cells[0].notify_new_case(9.75, 0)
+        p.cells[0].notify_new_case(10.0, 0)
+
+        with patch('pyEpiabm.output._csv_writer.open', mo):
+            m = pe.output.NewCasesWriter('mock_folder', window=0.5)
+            m.write(10, p)
+        mo().write.assert_has_calls([
+            call('t,cell,new_cases\r\n'),
+            call(f'10,{p.cells[0].id},2\r\n')])
+
     @patch('os.makedirs')
     def test_del(self, mock_mkdir):
         """Test the destructor method of the NewCasesWriter class.
@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+
+import pyEpiabm as pe
+
+
+class TestSparseOutputReader(unittest.TestCase):
+    """Test the methods to read sparse output files.
+    """
+
+    def setUp(self) -> None:
+        self.folder = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.folder.name, "output.csv")
+
+    def tearDown(self) -> None:
+        self.folder.cleanup()
+
+    def write(self, content):
+        with open(self.filename, 'w') as f:
+            f.write(content)
+
+    def test_read_keyed(self):
+        # Cell 1 is unchanged at time 1, cell 2 at time 2
+        self.write("time,cell,age_group,S,I\n"
+                   "0,1,1,5,0\n0,2,1,3,0\n"
+                   "1,2,1,2,1\n"
+                   "2,1,1,4,1\n")
+        dense = pe.output.read_sparse_output(self.filename)
+        self.assertEqual(list(dense.columns),
+                         ["time", "cell", "age_group", "S", "I"])
+        self.assertEqual(dense.values.tolist(),
+                         [[0, 1, 1, 5, 0], [0, 2, 1, 3, 0],
+                          [1, 1, 1, 5, 0], [1, 2, 1, 2, 1],
+                          [2, 1, 1, 4, 1], [2, 2, 1, 2, 1]])
+
+        array = pe.output.sparse_output_to_array(dense)
+        self.assertEqual(array.shape, (3, 2, 2))
+        np.testing.assert_array_equal(array[1], [[5, 0], [2, 1]])
+
+    def test_read_unkeyed(self):
+        # cEpiabm per-cell files, with an extra time requested
+        self.write("timestep,S,I\n0,5,0\n2,4,1\n")
+        dense = pe.output.read_sparse_output(self.filename, times=[1, 3])
+        self.assertEqual(dense.values.tolist(),
+                         [[0, 5, 0], [1, 5, 0], [2, 4, 1], [3, 4, 1]])
+        self.assertEqual(pe.output.sparse_output_to_array(dense).shape,
+                         (4, 1, 2))
+
+    def test_late_key(self):
+        self.write("timestep,age_group,S\n0,0,5\n1,0,5\n1,1,2\n")
+        dense = pe.output.read_sparse_output(self.filename)
+        self.assertEqual(dense.values.tolist(),
+                         [[0, 0, 5], [0, 1, 0], [1, 0, 5], [1, 1, 2]])
+
+    def test_no_time(self):
+        self.write("cell,S\n0,5\n")
+        self.assertRaises(ValueError, pe.output.read_sparse_output,
+                          self.filename)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -83,7 +83,9 @@ class TestHouseholdInfection(TestPyEpiabm):
 
     def test_house_place_closure(self):
         # Update place type, no place closure (closure_start_time = None)
-        self.infector.place_types.append(PlaceType.PrimarySchool)
+        self.infector.add_place(pe.Place(
+            (1.0, 1.0), PlaceType.PrimarySchool,
+            self.infector.microcell.cell, self.infector.microcell))
         result = HouseholdInfection.household_inf(
             self.infector, self.time)
 
@@ -69,7 +69,9 @@ class TestPlaceInfection(TestPyEpiabm):
 
     def test_place_place_closure(self):
         # Update place type, not place closure (closure_start_time = None)
-        self.infector.place_types.append(PlaceType.PrimarySchool)
+        self.infector.add_place(pe.Place(
+            (1.0, 1.0), PlaceType.PrimarySchool,
+            self.infector.microcell.cell, self.infector.microcell))
         result = PlaceInfection.place_inf(self.place, self.infector, self.time)
         self.assertNotEqual(result, 0)
 
@@ -14,6 +14,14 @@ class TestPLaceType(unittest.TestCase):
            pe.property.PlaceType.SecondarySchool,
            pe.property.PlaceType.OutdoorSpace]
 
+    def test_mask(self):
+        self.assertEqual(pe.property.PlaceType.mask([]), 0)
+        mask = pe.property.PlaceType.mask(
+            [pe.property.PlaceType.PrimarySchool,
+             pe.property.PlaceType.Workplace])
+        self.assertEqual(mask, 0b10010)
+        self.assertEqual(pe.property.PlaceType.mask([1, 4]), mask)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -94,7 +94,9 @@ class TestSpatialInfection(TestPyEpiabm):
 
     def test_spatial_place_closure(self):
         # Update place type, not place closure (closure_start_time = None)
-        self.infector.place_types.append(PlaceType.PrimarySchool)
+        self.infector.add_place(pe.Place(
+            (1.0, 1.0), PlaceType.PrimarySchool,
+            self.infector.microcell.cell, self.infector.microcell))
         result_susc = SpatialInfection.spatial_susc(
             self.cell, self.infector, self.infectee, self.time)
         result_inf = SpatialInfection.spatial_inf(
@@ -0,0 +1,3 @@
+#
+# Tests for subpackage pyEpiabm.py2c
+#
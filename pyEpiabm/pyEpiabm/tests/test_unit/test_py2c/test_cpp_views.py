@@ -0,0 +1,86 @@
+import unittest
+import numpy as np
+
+try:
+    import epiabm
+except ImportError:  # pragma: no cover
+    epiabm = None
+
+
+@unittest.skipIf(epiabm is None, "Requires the cEpiabm python bindings")
+class TestCppViews(unittest.TestCase):
+    """Test the NumPy views over cEpiabm cell state.
+    """
+    def setUp(self) -> None:
+        self.n_statuses = len(epiabm.InfectionStatus.__members__)
+        factory = epiabm.PopulationFactory()
+        self.population = factory.make_population(2, 2, 3)
+        self.population.initialize()
+        self.cell = self.population.cells()[0]
+        self.n_people = len(self.cell.persons())
+
+    def test_status_array(self):
+        statuses = self.cell.status_array()
+        self.assertEqual(statuses.shape, (self.n_people,))
+        self.assertEqual(statuses.dtype.kind, 'i')
+        self.assertFalse(statuses.flags.writeable)
+        with self.assertRaises(ValueError):
+            statuses[0] = int(epiabm.InfectionStatus.Exposed)
+
+        # The view follows changes made in C++
+        self.cell.persons()[1].update_status(
+            self.cell, epiabm.InfectionStatus.Exposed, 0)
+        self.assertEqual(statuses[1], int(epiabm.InfectionStatus.Exposed))
+        self.assertEqual(statuses[0], int(epiabm.InfectionStatus.Susceptible))
+
+    def test_params_array(self):
+        params = self.cell.params_array()
+        self.assertEqual(params.shape, (self.n_people,))
+        self.assertEqual(params.dtype.names, (
+            "age_group", "susceptibility", "infectiousness",
+            "next_status_time", "next_status", "initial_infectiousness",
+            "infection_start_timestep"))
+        self.assertEqual(params.dtype["susceptibility"], np.float32)
+        self.assertFalse(params.flags.writeable)
+        with self.assertRaises(ValueError):
+            params["susceptibility"][0] = 0.5
+
+        # Each field of the view matches the parameters of each person
+        person = self.cell.persons()[2]
+        person.params().infectiousness = 1.5
+        person.params().next_status_time = 7
+        self.assertEqual(params["infectiousness"][2], 1.5)
+        self.assertEqual(params["next_status_time"][2], 7)
+
+    def test_writable_params_array(self):
+        params = self.cell.params_array(True)
+        self.assertTrue(params.flags.writeable)
+        params["susceptibility"][1] = 0.25
+        params["next_status"][1] = int(epiabm.InfectionStatus.InfectMild)
+        person_params = self.cell.persons()[1].params()
+        self.assertEqual(person_params.susceptibility, 0.25)
+        self.assertEqual(person_params.next_status,
+                         epiabm.InfectionStatus.InfectMild)
+        self.assertEqual(self.cell.persons()[0].params().susceptibility,
+                         params["susceptibility"][0])
+
+    def test_compartment_counts(self):
+        self.cell.persons()[0].update_status(
+            self.cell, epiabm.InfectionStatus.InfectMild, 0)
+        counts = self.cell.compartment_array()
+        self.assertEqual(counts.shape, (self.n_statuses,))
+        self.assertFalse(counts.flags.writeable)
+        for status in epiabm.InfectionStatus.__members__.values():
+            self.assertEqual(counts[int(status)],
+                             self.cell.compartment_count(status))
+        self.assertEqual(counts.sum(), self.n_people)
+
+        all_counts = self.population.compartment_counts()
+        self.assertEqual(all_counts.shape, (2, self.n_statuses))
+        np.testing.assert_array_equal(all_counts[0], counts)
+        np.testing.assert_array_equal(
+            all_counts[1], self.population.cells()[1].compartment_array())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+from unittest.mock import MagicMock
+import numpy as np
+
+import pyEpiabm as pe
+from pyEpiabm.property import InfectionStatus, PlaceType
+from pyEpiabm.py2c import py2c_population, py2c_population_arrays
+from pyEpiabm.tests.test_unit.mocked_logging_tests import TestMockedLogs
+
+
+class TestPy2cPopulation(TestMockedLogs):
+    """Test the array export used by the bulk py2c conversion.
+    """
+    def setUp(self) -> None:
+        self.population = pe.Population()
+        self.population.add_cells(2)
+        self.population.cells[1].set_location((1.0, 2.0))
+        self.population.cells[0].add_microcells(2)
+        self.population.cells[1].add_microcells(1)
+        m_0, m_1 = self.population.cells[0].microcells
+        m_2 = self.population.cells[1].microcells[0]
+        m_0.add_people(2)
+        m_1.add_people(1, status=InfectionStatus.Exposed)
+        m_2.add_people(2, status=InfectionStatus.InfectMild)
+        m_0.add_household(m_0.persons)
+        m_2.add_household(m_2.persons[1:])
+        self.infector = m_2.persons[0]
+        self.infector.infectiousness = 0.5
+        self.infector.next_infection_status = InfectionStatus.Recovered
+        self.infector.time_of_status_change = 7.6
+        m_2.add_place(1, (1.0, 2.0), PlaceType.Workplace)
+        m_2.places[0].add_person(m_2.persons[1], person_group=1)
+        # Integer values mimic the cEpiabm InfectionStatus enum
+        self.status_map = {status: status.value - 1
+                           for status in InfectionStatus}
+
+    def test_py2c_population_arrays(self):
+        arrays = py2c_population_arrays(self.population, self.status_map)
+        np.testing.assert_array_equal(arrays["microcells_per_cell"], [2, 1])
+        np.testing.assert_array_equal(arrays["people_per_microcell"],
+                                      [2, 1, 2])
+        np.testing.assert_array_equal(arrays["households_per_microcell"],
+                                      [1, 0, 1])
+        np.testing.assert_array_equal(arrays["cell_locations"][1], [1, 2])
+        np.testing.assert_array_equal(arrays["status"], [0, 0, 1, 3, 3])
+        np.testing.assert_array_equal(arrays["household"], [0, 0, -1, -1, 0])
+        self.assertEqual(arrays["infectiousness"][3], 0.5)
+        self.assertEqual(arrays["next_status"][3], 8)
+        self.assertEqual(arrays["next_status_time"][3], 7)
+        self.assertEqual(arrays["n_places"], 1)
+        np.testing.assert_array_equal(arrays["membership_cell"], [1])
+        np.testing.assert_array_equal(arrays["membership_person"], [1])
+        np.testing.assert_array_equal(arrays["membership_group"], [1])
+        self.assertEqual(arrays["status"].dtype, np.uint8)
+        self.assertEqual(arrays["household_locations"].shape, (2, 2))
+
+    def test_infinite_status_time(self):
+        self.infector.time_of_status_change = np.inf
+        arrays = py2c_population_arrays(self.population, self.status_map)
+        self.assertEqual(arrays["next_status_time"][3], 0)
+
+    def test_bulk_conversion(self):
+        factory = MagicMock()
+        py2c_population(self.population, factory, self.status_map,
+                        bulk=True)
+        factory.make_population_from_arrays.assert_called_once()
+        kwargs = factory.make_population_from_arrays.call_args.kwargs
+        self.assertEqual(len(kwargs["status"]), 5)
+        factory.make_empty_population.assert_not_called()
+
+    def test_lazy_infectiousness(self):
+        self.infector.infectiousness_progression = np.array([1.0, 2.0])
+        self.infector.initial_infectiousness = 0.25
+        self.infector.infection_start_time = 0
+        self.assertRaises(ValueError, py2c_population_arrays,
+                          self.population, self.status_map)
+        arrays = py2c_population_arrays(self.population, self.status_map,
+                                        time=2)
+        self.assertEqual(arrays["infectiousness"][3], 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,193 @@
+import os
+import copy
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+import pyEpiabm as pe
+from pyEpiabm.tests.test_unit.mocked_logging_tests import TestMockedLogs
+
+
+def notqdm(iterable, *args, **kwargs):
+    """Replacement for tqdm that just passes back the iterable
+    useful to silence `tqdm` in tests
+    """
+    return iterable
+
+
+@patch('pyEpiabm.routine.simulation.tqdm', notqdm)
+class TestReplicateSimulation(TestMockedLogs):
+    """Test the 'ReplicateSimulation' class.
+    """
+    def setUp(self) -> None:
+        self.intervention_params = copy.deepcopy(
+            pe.Parameters.instance().intervention_params)
+        pe.Parameters.instance().intervention_params = {}
+        # Configuring sets whether ages are used, which changes the
+        # populations made afterwards
+        self.use_ages = pe.Parameters.instance().use_ages
+        pe.Parameters.instance().use_ages = False
+        self.infectiousness_prof = list(
+            pe.Parameters.instance().infectiousness_prof)
+        self.folder = tempfile.TemporaryDirectory()
+        self.sim_params = {"simulation_start_time": 0,
+                           "simulation_end_time": 12,
+                           "initial_infected_number": 5,
+                           "simulation_seed": 7,
+                           "replicates": 3}
+        self.file_params = {"output_file": "output.csv",
+                            "output_dir": self.folder.name}
+
+    def tearDown(self) -> None:
+        pe.Parameters.instance().intervention_params = \
+            self.intervention_params
+        pe.Parameters.instance().use_ages = self.use_ages
+        pe.Parameters.instance().infectiousness_prof = \
+            self.infectiousness_prof
+        self.folder.cleanup()
+
+    @staticmethod
+    def make_population():
+        population = pe.routine.ToyPopulationFactory.make_pop(
+            {"population_size": 400, "cell_number": 4,
+             "microcell_number": 2, "household_number": 10,
+             "place_number": 2, "population_seed": 3})
+        for i, cell in enumerate(population.cells):
+            cell.set_location((i % 2, i // 2))
+        sweep = pe.sweep.InitialisePlaceSweep()
+        sweep.bind_population(population)
+        sweep()
+        return population
+
+    def make_sweeps(self, lazy_infectiousness=False):
+        # Making a host progression sweep changes the infectiousness profile
+        # used by the next one
+        pe.Parameters.instance().infectiousness_prof = \
+            list(self.infectiousness_prof)
+        return ([pe.sweep.InitialInfectedSweep()],
+                [pe.sweep.HouseholdSweep(), pe.sweep.PlaceSweep(),
+                 pe.sweep.SpatialSweep(), pe.sweep.QueueSweep(),
+                 pe.sweep.HostProgressionSweep(lazy_infectiousness)])
+
+    def read_output(self, filename):
+        with open(os.path.join(self.folder.name, filename)) as f:
+            return f.read().splitlines()
+
+    def test_configure(self):
+        sim = pe.routine.ReplicateSimulation()
+        sim.configure(self.make_population(), *self.make_sweeps(),
+                      self.sim_params, self.file_params)
+        self.assertEqual(sim.n_replicates, 3)
+        self.assertEqual(sim.person_states["infection_status"].shape,
+                         (3, 400))
+        self.assertTrue(np.all(sim.person_states["infection_status"] ==
+                               pe.property.InfectionStatus.Susceptible.value))
+        for r in range(3):
+            self.assertTrue(os.path.exists(os.path.join(
+                self.folder.name, f"output_replicate_{r}.csv")))
+        self.assertRaises(NotImplementedError, sim.add_writer, None)
+
+    @patch('logging.exception')
+    def test_configure_unsupported(self, mock_log):
+        initial_sweeps, sweeps = self.make_sweeps()
+        sim = pe.routine.ReplicateSimulation()
+        sim.configure(self.make_population(), initial_sweeps,
+                      sweeps + [pe.sweep.UpdatePlaceSweep()],
+                      self.sim_params, self.file_params)
+        sim.configure(self.make_population(),
+                      [pe.sweep.InitialisePlaceSweep()], sweeps,
+                      self.sim_params, self.file_params)
+        sim.configure(self.make_population(), initial_sweeps, sweeps,
+                      dict(self.sim_params, replicates=0), self.file_params)
+        sim.configure(self.make_population(), initial_sweeps,
+                      [sweep for sweep in sweeps
+                       if not isinstance(sweep, pe.sweep.QueueSweep)],
+                      self.sim_params, self.file_params)
+        pe.Parameters.instance().intervention_params = \
+            self.intervention_params
+        sim.configure(self.make_population(), initial_sweeps, sweeps,
+                      self.sim_params, self.file_params)
+        self.assertEqual(mock_log.call_count, 5)
+        mock_log.assert_called_with("ValueError in"
+                                    + " ReplicateSimulation.configure()")
+
+    def test_matches_independent_runs(self):
+        for lazy in [False, True]:
+            with self.subTest(lazy_infectiousness=lazy):
+                self.check_matches_independent_runs(lazy)
+
+    def check_matches_independent_runs(self, lazy):
+        sim = pe.routine.ReplicateSimulation()
+        sim.configure(self.make_population(), *self.make_sweeps(lazy),
+                      self.sim_params, self.file_params)
+        sim.run_sweeps()
+        self.assertEqual(sim.time, 12)
+        new_cases = []
+        for r in range(3):
+            # Loading a replicate gives its final state
+            sim.load_replicate(r)
+            cell = sim.population.cells[0]
+            counts = {status: 0 for status in pe.property.InfectionStatus}
+            for person in cell.persons:
+                counts[person.infection_status] += 1
+            self.assertEqual(counts, {
+                status: sum(values) for status, values
+                in cell.compartment_counter.retrieve().items()})
+            new_cases.append(sum(sum(cell.new_case_counter.retrieve(-1, 12))
+                                 for cell in sim.population.cells))
+        del sim
+        replicates = [self.read_output(f"output_replicate_{r}.csv")
+                      for r in range(3)]
+        self.assertEqual(len(replicates[0]), 14)
+        self.assertNotEqual(replicates[0], replicates[1])
+
+        for r in range(3):
+            single = pe.routine.Simulation()
+            single.configure(self.make_population(), *self.make_sweeps(lazy),
+                             dict(self.sim_params, simulation_seed=7 + r),
+                             dict(self.file_params, output_file="single.csv"))
+            single.run_sweeps()
+            del single.writer
+            self.assertEqual(replicates[r], self.read_output("single.csv"))
+            self.assertEqual(new_cases[r], sum(
+                sum(cell.new_case_counter.retrieve(-1, 12))
+                for cell in single.population.cells))
+
+    def test_pending_exposures(self):
+        # Exposures queued after host progression are applied in the next
+        # time step, so are swapped with the rest of each replicate
+        initial_sweeps, sweeps = self.make_sweeps()
+        sweeps = sweeps[:3] + sweeps[:2:-1]
+        sim = pe.routine.ReplicateSimulation()
+        sim.configure(self.make_population(), initial_sweeps, sweeps,
+                      self.sim_params, self.file_params)
+        sim.run_sweeps()
+        for r in [1, 0, 2]:
+            sim.load_replicate(r)
+            for cell in sim.population.cells:
+                self.assertEqual(cell.pending_exposures, sum(
+                    person.is_susceptible()
+                    and person.time_of_status_change is not None
+                    for person in cell.persons))
+        self.assertTrue(any(cell.pending_exposures > 0
+                            for cell in sim.population.cells))
+        del sim
+
+    def test_lazy_matches_eager(self):
+        outputs = []
+        for lazy in [False, True]:
+            sim = pe.routine.Simulation()
+            sim.configure(self.make_population(), *self.make_sweeps(lazy),
+                          dict(self.sim_params, simulation_end_time=30),
+                          dict(self.file_params, output_file="single.csv"))
+            sim.run_sweeps()
+            del sim.writer
+            outputs.append(self.read_output("single.csv"))
+        self.assertEqual(len(outputs[0]), 32)
+        self.assertEqual(outputs[0], outputs[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
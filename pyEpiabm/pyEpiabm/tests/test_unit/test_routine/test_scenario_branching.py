@@ -0,0 +1,138 @@
+import os
+import copy
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pyEpiabm as pe
+from pyEpiabm.tests.test_unit.mocked_logging_tests import TestMockedLogs
+
+
+def notqdm(iterable, *args, **kwargs):
+    """Replacement for tqdm that just passes back the iterable
+    useful to silence `tqdm` in tests
+    """
+    return iterable
+
+
+@patch('pyEpiabm.routine.simulation.tqdm', notqdm)
+class TestScenarioBranching(TestMockedLogs):
+    """Test the 'ScenarioBranching' class.
+    """
+    def setUp(self) -> None:
+        self.intervention_params = copy.deepcopy(
+            pe.Parameters.instance().intervention_params)
+        self.folder = tempfile.TemporaryDirectory()
+        self.population = pe.routine.ToyPopulationFactory.make_pop(
+            {"population_size": 200, "cell_number": 1,
+             "microcell_number": 1, "household_number": 20,
+             "population_seed": 42})
+        self.sim_params = {"simulation_start_time": 0,
+                           "simulation_end_time": 8,
+                           "initial_infected_number": 10,
+                           "simulation_seed": 42}
+        self.file_params = {"output_file": "output.csv",
+                            "output_dir": os.path.join(self.folder.name,
+                                                       "warm_up")}
+        self.simulation = pe.routine.Simulation()
+        self.simulation.configure(
+            self.population, [pe.sweep.InitialInfectedSweep()],
+            [pe.sweep.InterventionSweep(), pe.sweep.HouseholdSweep(),
+             pe.sweep.QueueSweep(), pe.sweep.HostProgressionSweep()],
+            self.sim_params, self.file_params)
+        self.scenarios = [
+            {"name": "none", "intervention_params": {},
+             "output_dir": os.path.join(self.folder.name, "none")},
+            {"name": "isolation",
+             "intervention_params": {"case_isolation": self.intervention_params
+                                     ["case_isolation"]},
+             "output_dir": os.path.join(self.folder.name, "isolation")}]
+
+    def tearDown(self) -> None:
+        pe.Parameters.instance().intervention_params = \
+            self.intervention_params
+        del self.simulation
+        self.folder.cleanup()
+
+    def test_construct(self):
+        branching = pe.routine.ScenarioBranching(self.simulation, 3, 2)
+        self.assertEqual(branching.branch_time, 3)
+        self.assertEqual(branching.max_workers, 2)
+        self.assertGreaterEqual(pe.routine.ScenarioBranching(
+            self.simulation, 3).max_workers, 1)
+        self.assertRaises(ValueError, pe.routine.ScenarioBranching,
+                          self.simulation, 3, 0)
+
+    def test_check_interventions(self):
+        branching = pe.routine.ScenarioBranching(self.simulation, 6)
+        # Interventions of the testing parameters start at time 6
+        self.assertRaises(ValueError, branching.run, self.scenarios)
+        pe.Parameters.instance().intervention_params = {}
+        self.assertRaises(ValueError, branching.run, self.scenarios)
+        self.assertRaises(ValueError, branching.run,
+                          [self.scenarios[0], self.scenarios[0]])
+        # Nothing is run if the scenarios are invalid
+        self.assertIsNone(self.simulation.time)
+        # Scenario interventions need an intervention sweep to run them
+        self.simulation.sweeps = self.simulation.sweeps[1:]
+        self.assertRaises(ValueError, branching.run,
+                          [dict(self.scenarios[1],
+                                intervention_params={"case_isolation": {
+                                    "start_time": 7}})])
+        self.assertIsNone(self.simulation.time)
+
+    def test_apply_scenario(self):
+        branching = pe.routine.ScenarioBranching(self.simulation, 3)
+        self.simulation.run_until(3)
+        branching.apply_scenario(self.scenarios[1])
+        self.assertEqual(pe.Parameters.instance().intervention_params,
+                         self.scenarios[1]["intervention_params"])
+        sweep = self.simulation.sweeps[0]
+        self.assertEqual(len(sweep.intervention_active_status), 1)
+        self.assertEqual(self.simulation.writer.folder,
+                         self.scenarios[1]["output_dir"])
+        self.assertTrue(os.path.exists(os.path.join(
+            self.scenarios[1]["output_dir"], "output.csv")))
+
+    @unittest.skipUnless(hasattr(os, "fork"), "Requires os.fork")
+    def test_run(self):
+        pe.Parameters.instance().intervention_params = {}
+        self.scenarios.append(dict(
+            self.scenarios[0], name="repeat",
+            output_dir=os.path.join(self.folder.name, "repeat")))
+        branching = pe.routine.ScenarioBranching(self.simulation, 3, 1)
+        statuses = branching.run(self.scenarios)
+        self.assertEqual(statuses, {"none": 0, "isolation": 0, "repeat": 0})
+        self.assertEqual(self.simulation.time, 3)
+
+        with open(os.path.join(self.file_params["output_dir"],
+                               "output.csv")) as f:
+            warm_up = f.read().splitlines()
+        # Header and time steps 0 to 3
+        self.assertEqual(len(warm_up), 5)
+        outputs = []
+        for scenario in self.scenarios:
+            with open(os.path.join(scenario["output_dir"],
+                                   "output.csv")) as f:
+                rows = f.read().splitlines()
+            self.assertEqual(rows[:5], warm_up)
+            self.assertEqual([row.split(",")[0] for row in rows[5:]],
+                             ["4.0", "5.0", "6.0", "7.0", "8.0"])
+            outputs.append(rows)
+        # Case isolation starts at time 6 in the isolation scenario
+        self.assertNotEqual(outputs[0][5:], outputs[1][5:])
+        # Scenarios are run with common random numbers
+        self.assertEqual(outputs[0], outputs[2])
+
+    @unittest.skipUnless(hasattr(os, "fork"), "Requires os.fork")
+    def test_run_failure(self):
+        pe.Parameters.instance().intervention_params = {}
+        self.scenarios[1]["intervention_params"] = {
+            "unknown": {"start_time": 6}}
+        branching = pe.routine.ScenarioBranching(self.simulation, 3)
+        with patch('logging.exception'):
+            self.assertRaises(RuntimeError, branching.run, self.scenarios)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -145,6 +145,112 @@ class TestSimulation(TestMockedLogs):
         mock_mkdir.assert_called_with(os.path.join(os.getcwd(),
                                       self.file_params["output_dir"]))
 
+    @patch('pyEpiabm.routine.simulation.tqdm', notqdm)
+    @patch('pyEpiabm.sweep.PlaceSweep.__call__')
+    @patch('pyEpiabm.sweep.InitialInfectedSweep.__call__')
+    @patch('pyEpiabm.routine.Simulation.write_to_file')
+    @patch('os.makedirs')
+    def test_run_sweeps_with_instrumentation(
+            self, mock_mkdir, patch_write, patch_initial, patch_sweep):
+        mo = mock_open()
+        with patch('pyEpiabm.output._csv_dict_writer.open', mo):
+            test_sim = pe.routine.Simulation()
+            test_sim.configure(self.test_population, self.initial_sweeps,
+                               self.sweeps, self.sim_params, self.file_params)
+            records = []
+            test_sim.set_instrumentation(
+                pe.routine.SimulationInstrumentation(records.append))
+            test_sim.run_sweeps()
+            patch_sweep.assert_called_with(1)
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["time"], 1)
+        self.assertEqual([r["sweep"] for r in records[0]["sweeps"]],
+                         ["PlaceSweep"])
+
+    @patch('pyEpiabm.routine.simulation.tqdm', notqdm)
+    @patch('pyEpiabm.sweep.PlaceSweep.__call__')
+    @patch('pyEpiabm.sweep.InitialInfectedSweep.__call__')
+    @patch('pyEpiabm.routine.Simulation.write_to_file')
+    @patch('os.makedirs')
+    def test_run_sweeps_early_termination(
+            self, mock_mkdir, patch_write, patch_initial, patch_sweep):
+        sim_params = dict(self.sim_params)
+        sim_params["simulation_end_time"] = 5
+        sim_params["early_termination"] = True
+        mo = mock_open()
+        with patch('pyEpiabm.output._csv_dict_writer.open', mo):
+            test_sim = pe.routine.Simulation()
+            test_sim.configure(self.test_population, self.initial_sweeps,
+                               self.sweeps, sim_params, self.file_params)
+            test_sim.run_sweeps()
+            # No one is infected, so sweeps only run on the first time step
+            patch_sweep.assert_called_once_with(1)
+            self.assertEqual(test_sim.termination_time, 1)
+            # Output is still written for every time step
+            self.assertEqual(patch_write.call_count, 6)
+            patch_write.assert_called_with(5)
+
+            # Sweeps with pending events keep the simulation running
+            patch_sweep.reset_mock()
+            test_sim.configure(self.test_population, self.initial_sweeps,
+                               self.sweeps, sim_params, self.file_params)
+            with patch('pyEpiabm.sweep.PlaceSweep.has_pending_events',
+                       return_value=True):
+                test_sim.run_sweeps()
+            self.assertEqual(patch_sweep.call_count, 5)
+            self.assertIsNone(test_sim.termination_time)
+
+    @patch('pyEpiabm.routine.simulation.tqdm', notqdm)
+    @patch('pyEpiabm.sweep.PlaceSweep.__call__')
+    @patch('pyEpiabm.sweep.InitialInfectedSweep.__call__')
+    @patch('pyEpiabm.routine.Simulation.write_to_file')
+    @patch('os.makedirs')
+    def test_run_until(self, mock_mkdir, patch_write, patch_initial,
+                       patch_sweep):
+        sim_params = dict(self.sim_params)
+        sim_params["simulation_end_time"] = 5
+        with patch('pyEpiabm.output._csv_dict_writer.open', mock_open()):
+            test_sim = pe.routine.Simulation()
+            test_sim.configure(self.test_population, self.initial_sweeps,
+                               self.sweeps, sim_params, self.file_params)
+            self.assertIsNone(test_sim.time)
+            test_sim.run_until(2)
+            patch_initial.assert_called_once_with(sim_params)
+            self.assertEqual(patch_sweep.call_count, 2)
+            self.assertEqual(test_sim.time, 2)
+
+            # Resumes from the last time step run
+            test_sim.run_until(2)
+            self.assertEqual(patch_sweep.call_count, 2)
+            test_sim.run_until(10)
+            patch_initial.assert_called_once()
+            self.assertEqual([c.args[0] for c in patch_sweep.call_args_list],
+                             [1, 2, 3, 4, 5])
+            self.assertEqual(patch_write.call_count, 6)
+            self.assertEqual(test_sim.time, 5)
+
+    @patch('os.makedirs')
+    def test_is_extinct(self, mock_mkdir):
+        with patch('pyEpiabm.output._csv_dict_writer.open'):
+            population = self.pop_factory.make_pop(
+                {"population_size": 2, "cell_number": 1,
+                 "microcell_number": 1, "household_number": 1})
+            test_sim = pe.routine.Simulation()
+            test_sim.configure(population, self.initial_sweeps, self.sweeps,
+                               self.sim_params, self.file_params)
+            self.assertTrue(test_sim.is_extinct())
+
+            cell = population.cells[0]
+            person = cell.persons[0]
+            cell.enqueue_person(person)
+            self.assertFalse(test_sim.is_extinct())
+            cell.person_queue.drain()
+
+            person.update_status(pe.property.InfectionStatus.InfectMild)
+            self.assertFalse(test_sim.is_extinct())
+            person.update_status(pe.property.InfectionStatus.Recovered)
+            self.assertTrue(test_sim.is_extinct())
+
     @patch('os.makedirs')
     @patch('logging.exception')
     @patch('pyEpiabm.sweep.InitialInfectedSweep.__call__')
@@ -245,6 +351,49 @@ class TestSimulation(TestMockedLogs):
         mock_mkdir.assert_called_with(os.path.join(os.getcwd(),
                                       self.file_params["output_dir"]))
 
+    @patch('os.makedirs')
+    def test_sparse_write_to_file(self, mock_mkdir):
+        mo = mock_open()
+        file_params = dict(self.file_params)
+        file_params.update({"spatial_output": True, "age_stratified": True,
+                            "sparse_output": True, "keyframe_interval": 3})
+        nb_age_groups = len(pe.Parameters.instance().age_proportions)
+        with patch('pyEpiabm.output._csv_dict_writer.open', mo):
+            sparse_sim = pe.routine.Simulation()
+            sparse_sim.configure(self.test_population, self.initial_sweeps,
+                                 self.sweeps, self.sim_params, file_params)
+            self.assertTrue(sparse_sim.sparse_output)
+            self.assertEqual(sparse_sim.keyframe_interval, 3)
+            with patch.object(sparse_sim.writer, 'write') as mock:
+                # Keyframe writes every age group
+                sparse_sim.write_to_file(0)
+                self.assertEqual(mock.call_count, nb_age_groups)
+                # Unchanged counts only write the first row of the timestep
+                mock.reset_mock()
+                sparse_sim.write_to_file(1)
+                mock.assert_called_once()
+                # Changed counts are written
+                mock.reset_mock()
+                cell_id = self.test_population.cells[0].id
+                sparse_sim._last_written[(cell_id, 2)] = None
+                sparse_sim.write_to_file(2)
+                self.assertEqual(mock.call_count, 2)
+                self.assertEqual(mock.call_args[0][0]["age_group"], 2)
+                # Next keyframe
+                mock.reset_mock()
+                sparse_sim.write_to_file(3)
+                self.assertEqual(mock.call_count, nb_age_groups)
+
+        file_params["keyframe_interval"] = 0
+        with patch('pyEpiabm.output._csv_dict_writer.open', mo):
+            with patch('logging.exception') as mock_log:
+                sparse_sim = pe.routine.Simulation()
+                sparse_sim.configure(self.test_population,
+                                     self.initial_sweeps, self.sweeps,
+                                     self.sim_params, file_params)
+                mock_log.assert_called_once_with(
+                    "ValueError in Simulation.configure()")
+
     def test_set_random_seed(self):
         pe.routine.Simulation.set_random_seed(seed=0)
         value = random.random()
@@ -0,0 +1,72 @@
+import unittest
+from unittest.mock import patch, mock_open
+
+import pyEpiabm as pe
+from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
+
+
+class CountingSweep(pe.sweep.AbstractSweep):
+    """Sweep which records two infection attempts and one infection.
+    """
+    def __call__(self, time: float):
+        self.infection_attempts += 2
+        self.infections += 1
+        self._population.cells[0].enqueue_person(
+            self._population.cells[0].persons[0])
+
+
+class TestSimulationInstrumentation(TestPyEpiabm):
+    """Test the 'SimulationInstrumentation' class.
+    """
+    def setUp(self) -> None:
+        self.population = pe.Population()
+        self.population.add_cells(1)
+        self.population.cells[0].add_microcells(1)
+        self.population.cells[0].microcells[0].add_people(2)
+        self.sweep = CountingSweep()
+        self.sweep.bind_population(self.population)
+
+    def test_run_sweeps(self):
+        records = []
+        instrumentation = pe.routine.SimulationInstrumentation(
+            records.append)
+        record = instrumentation.run_sweeps([self.sweep], self.population, 1)
+        instrumentation.run_sweeps([self.sweep], self.population, 2)
+        self.assertEqual(records, instrumentation.records)
+        self.assertEqual(record["time"], 1)
+        sweep_record = record["sweeps"][0]
+        self.assertEqual(sweep_record["sweep"], "CountingSweep")
+        self.assertGreaterEqual(sweep_record["seconds"], 0)
+        self.assertEqual(sweep_record["infection_attempts"], 2)
+        self.assertEqual(sweep_record["infections"], 1)
+        self.assertEqual(sweep_record["queue_length"], 1)
+        # Counters are per time step
+        self.assertEqual(records[1]["sweeps"][0]["infections"], 1)
+        self.assertGreater(record["max_rss_kb"], 0)
+        self.assertEqual(list(instrumentation.total_seconds()),
+                         ["CountingSweep"])
+
+    def test_keep_records(self):
+        instrumentation = pe.routine.SimulationInstrumentation(
+            keep_records=False)
+        instrumentation.run_sweeps([self.sweep], self.population, 1)
+        self.assertEqual(instrumentation.records, [])
+
+    @patch('os.makedirs')
+    def test_write(self, mock_mkdir):
+        mo = mock_open()
+        with patch('pyEpiabm.output._csv_dict_writer.open', mo):
+            instrumentation = pe.routine.SimulationInstrumentation(
+                folder="mock_dir", filename="timings.csv")
+            with patch.object(instrumentation.writer, 'write') as mock_write:
+                instrumentation.run_sweeps([self.sweep], self.population, 1)
+                row = mock_write.call_args[0][0]
+        self.assertEqual(set(row),
+                         set(pe.routine.SimulationInstrumentation.fieldnames))
+        self.assertEqual(row["sweep"], "CountingSweep")
+        self.assertRaises(ValueError, pe.routine.SimulationInstrumentation,
+                          folder="mock_dir")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import Mock
 
 import pyEpiabm as pe
 
@@ -19,6 +20,21 @@ class TestAbstractSweep(unittest.TestCase):
         subject = pe.sweep.AbstractSweep()
         self.assertRaises(NotImplementedError, subject.__call__, 1)
 
+    def test_has_pending_events(self):
+        subject = pe.sweep.AbstractSweep()
+        self.assertFalse(subject.has_pending_events(1))
+
+    def test__cells(self):
+        subject = pe.sweep.AbstractSweep()
+        population = pe.Population()
+        population.cells = [Mock(), Mock()]
+        population.cells[0].is_active.return_value = False
+        population.cells[1].is_active.return_value = True
+        subject.bind_population(population)
+        self.assertEqual(list(subject._cells()), population.cells)
+        subject.aggregate_inactive_cells = True
+        self.assertEqual(list(subject._cells()), [population.cells[1]])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -105,6 +105,9 @@ class TestHostProgressionSweep(TestPyEpiabm):
         self.assertIsInstance(self.person1.initial_infectiousness, float)
         self.assertTrue(0 <= self.person1.initial_infectiousness)
         self.assertEqual(self.person1.infection_start_time, 1.5)
+        # Each call reports a new case to the cell
+        counter = self.person1.microcell.cell.new_case_counter
+        self.assertEqual(sum(counter.retrieve(-1, 5)), 3)
 
     def test_set_infectiousness_neg_time(self):
         """Tests that a value error is raised if the input time in 'set
@@ -397,6 +400,35 @@ class TestHostProgressionSweep(TestPyEpiabm):
                 self.assertGreater(infected_person.infectiousness, 0)
                 self.assertIsInstance(infected_person.infectiousness, float)
 
+    def test_lazy_update_infectiousness(self):
+        test_sweep = pe.sweep.HostProgressionSweep(lazy_infectiousness=True)
+        for i in range(len(InfectionStatus)):
+            person = self.people[i]
+            person.update_status(InfectionStatus(i + 1))
+            person.initial_infectiousness = 1.1
+            person.infection_start_time = 0
+        for person in self.people:
+            test_sweep._updates_infectiousness(person, 1)
+        # The infectiousness attribute is not written in lazy mode
+        for person in self.people:
+            with self.subTest(person=person):
+                self.assertEqual(person.infectiousness, 0)
+        for infected_person in self.people[2:8]:
+            with self.subTest(infected_person=infected_person):
+                self.assertIs(infected_person.infectiousness_progression,
+                              test_sweep.infectiousness_progression)
+                # Seen from the next time step, as in eager mode
+                self.assertAlmostEqual(
+                    infected_person.infectiousness_at(
+                        1 + test_sweep.model_time_step),
+                    1.1 * test_sweep.infectiousness_progression[
+                        int(1 / test_sweep.model_time_step)])
+        # Recovered and dead people have their infection start time reset
+        for i in [8, 9]:
+            with self.subTest(i=i):
+                self.assertIsNone(self.people[i].infection_start_time)
+                self.assertEqual(self.people[i].infectiousness_at(1), 0)
+
     def test_invalid_update_infectiousness(self):
         test_sweep = pe.sweep.HostProgressionSweep()
         self.person1.infectiousness = 1
@@ -715,6 +747,56 @@ class TestHostProgressionSweep(TestPyEpiabm):
 
         self.assertEqual(mock_random.call_count, 8)
 
+    def test_aggregate_inactive_cells(self):
+        """Tests that people of inactive cells are not visited in aggregate
+        mode, unless disease testing is used.
+        """
+        self.person1.time_of_status_change = 1.0
+        self.person1.next_infection_status = InfectionStatus.Exposed
+        test_sweep = pe.sweep.HostProgressionSweep(
+            aggregate_inactive_cells=True)
+        self.assertTrue(test_sweep.aggregate_inactive_cells)
+        test_sweep.bind_population(self.test_population1)
+        intervention_params = pe.Parameters.instance().intervention_params
+        pe.Parameters.instance().intervention_params = {}
+        try:
+            # Nobody in the cell is active, so no one is updated
+            test_sweep(1.0)
+            self.assertEqual(self.person1.infection_status,
+                             InfectionStatus.Susceptible)
+
+            pe.Parameters.instance().intervention_params = {
+                'disease_testing': intervention_params['disease_testing']}
+            with mock.patch.object(test_sweep, 'asympt_uninf_testing_queue'):
+                test_sweep(1.0)
+            self.assertNotEqual(self.person1.infection_status,
+                                InfectionStatus.Susceptible)
+        finally:
+            pe.Parameters.instance().intervention_params = \
+                intervention_params
+
+    def test_aggregate_queued_exposure(self):
+        """Tests that exposures from the queue sweep are applied in
+        aggregate mode to cells with no one exposed or infectious.
+        """
+        self.cell.enqueue_person(self.person1)
+        queue_sweep = pe.sweep.QueueSweep()
+        queue_sweep.bind_population(self.test_population1)
+        test_sweep = pe.sweep.HostProgressionSweep(
+            aggregate_inactive_cells=True)
+        test_sweep.bind_population(self.test_population1)
+        intervention_params = pe.Parameters.instance().intervention_params
+        pe.Parameters.instance().intervention_params = {}
+        try:
+            queue_sweep(1.0)
+            test_sweep(1.0)
+        finally:
+            pe.Parameters.instance().intervention_params = \
+                intervention_params
+        self.assertEqual(self.person1.infection_status,
+                         InfectionStatus.Exposed)
+        self.assertEqual(self.cell.pending_exposures, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,5 @@
 import unittest
 from unittest import mock
-from queue import Queue
 
 import pyEpiabm as pe
 from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
@@ -61,7 +60,7 @@ class TestHouseholdSweep(TestPyEpiabm):
         # Add one susceptible to the population, with the mocked infectiousness
         # ensuring they are added to the infected queue.
         self.person.infection_status = pe.property.InfectionStatus.InfectMild
-        test_queue = Queue()
+        test_queue = pe._PersonQueue()
         new_person = pe.Person(self.microcell)
         new_person.household = self.house
         self.house.persons.append(new_person)
@@ -77,7 +76,7 @@ class TestHouseholdSweep(TestPyEpiabm):
         # is empty.
         new_person.infection_status = pe.property.InfectionStatus.Recovered
         self.cell.persons.append(new_person)
-        self.cell.person_queue = Queue()
+        self.cell.person_queue = pe._PersonQueue()
         self.house.susceptible_persons.remove(new_person)
         self.test_sweep.bind_population(self.pop)
         self.test_sweep(self.time)
@@ -97,6 +96,30 @@ class TestHouseholdSweep(TestPyEpiabm):
         with self.assertRaises(AttributeError):
             false_sweep(1)
 
+    @mock.patch('pyEpiabm.property.HouseholdInfection.household_foi')
+    def test_aggregate_inactive_cells(self, mock_force):
+        mock_force.return_value = 100.0
+        pop = pe.Population()
+        pop.add_cells(1)
+        cell = pop.cells[0]
+        cell.add_microcells(1)
+        cell.microcells[0].add_people(2)
+        infector, infectee = cell.persons
+        house = pe.Household(cell.microcells[0], [1.0, 1.0])
+        for person in cell.persons:
+            house.add_person(person)
+        house.susceptible_persons.remove(infector)
+        infector.update_status(pe.property.InfectionStatus.InfectMild)
+        test_sweep = pe.sweep.HouseholdSweep(aggregate_inactive_cells=True)
+        self.assertTrue(test_sweep.aggregate_inactive_cells)
+        test_sweep.bind_population(pop)
+        with mock.patch('pyEpiabm.core.Cell.is_active', return_value=False):
+            test_sweep(self.time)
+        self.assertTrue(cell.person_queue.empty())
+
+        test_sweep(self.time)
+        self.assertEqual(cell.person_queue.qsize(), 1)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -48,6 +48,24 @@ class TestVaccinationSweep(TestPyEpiabm):
         self.assertEqual(priority_list[3], 4)
         self.assertIsNone(priority_list[4])
 
+        levels = test_sweep.assign_priority_groups(self.person_list,
+                                                   params['min_ages'])
+        self.assertEqual(list(levels), [1, 2, 3, 4, 0, 1])
+
+    def test__call__(self):
+        test_sweep = pe.sweep.InitialVaccineQueue()
+        test_sweep.bind_population(self.test_population)
+        age_list = [90, 70, 55, 30, 15, 80]
+        for i in range(len(self.person_list)):
+            self.person_list[i].age = age_list[i]
+        test_sweep(None)
+
+        queue = self.test_population.vaccine_queue.queue
+        self.assertEqual([entry[0] for entry in queue], [1, 1, 2, 3, 4])
+        self.assertEqual({entry[2] for entry in queue[:2]},
+                         {self.person_list[0], self.person_list[5]})
+        self.assertEqual(queue[-1][2], self.person_list[3])
+
     @mock.patch("pyEpiabm.core.Parameters.instance")
     @mock.patch("logging.error")
     def test_warning(self, mock_log, mock_params):
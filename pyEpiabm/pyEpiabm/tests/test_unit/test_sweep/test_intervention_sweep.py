@@ -113,6 +113,30 @@ class TestInterventionSweep(TestPyEpiabm):
                  if isinstance(key, CaseIsolation)][0]])
         self.assertIsNone(self.person_symp.isolation_start_time)
 
+    def test_has_pending_events(self):
+        # Vaccination policy runs from day 6 for 365 days
+        self.assertTrue(self.interventionsweep.has_pending_events(0))
+        self.assertTrue(self.interventionsweep.has_pending_events(371))
+        self.assertFalse(self.interventionsweep.has_pending_events(372))
+
+    def test_rebind_detaches(self):
+        callbacks = self._microcell._threshold_callbacks["infectious"]
+        n_callbacks = len(callbacks)
+        sweep = InterventionSweep()
+        sweep.bind_population(self._population)
+        old = [intervention for intervention
+               in sweep.intervention_active_status
+               if isinstance(intervention, (PlaceClosure, SocialDistancing))]
+        self.assertEqual(len(old), 2)
+        self.assertEqual(len(callbacks), n_callbacks + 2)
+        sweep.bind_population(self._population)
+        for intervention in old:
+            with self.subTest(intervention=intervention):
+                self.assertEqual(intervention._callbacks, [])
+        # Only the callbacks of the new interventions are registered
+        callbacks = self._microcell._threshold_callbacks["infectious"]
+        self.assertEqual(len(callbacks), n_callbacks + 2)
+
 
 if __name__ == '__main__':
     unittest.main()
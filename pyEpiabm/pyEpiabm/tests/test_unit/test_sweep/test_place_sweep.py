@@ -1,6 +1,5 @@
 import unittest
 from unittest import mock
-from queue import Queue
 
 import pyEpiabm as pe
 from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
@@ -51,7 +50,7 @@ class TestPlaceSweep(TestPyEpiabm):
 
         # Change person"s status to recovered
         self.person1.update_status(pe.property.InfectionStatus.Recovered)
-        self.cell.person_queue = Queue()
+        self.cell.person_queue = pe._PersonQueue()
         self.test_sweep.bind_population(self.pop)
         self.test_sweep(time)
         self.assertTrue(self.cell.person_queue.empty())
@@ -60,7 +59,7 @@ class TestPlaceSweep(TestPyEpiabm):
         # ensuring they are added to the infected queue.
         self.person1.update_status(pe.property.InfectionStatus.InfectMild)
         self.place.add_person(self.new_person)
-        self.cell.person_queue = Queue()
+        self.cell.person_queue = pe._PersonQueue()
         self.test_sweep.bind_population(self.pop)
         self.test_sweep(time)
         self.assertEqual(self.cell.person_queue.qsize(), 1)
@@ -68,7 +67,7 @@ class TestPlaceSweep(TestPyEpiabm):
         # Change the additional person to recovered, and assert the queue
         # is empty.
         self.new_person.update_status(pe.property.InfectionStatus.Recovered)
-        self.cell.person_queue = Queue()
+        self.cell.person_queue = pe._PersonQueue()
         self.test_sweep.bind_population(self.pop)
         self.test_sweep(time)
         self.assertTrue(self.cell.person_queue.empty())
@@ -77,19 +76,40 @@ class TestPlaceSweep(TestPyEpiabm):
         mock_inf.return_value = 1
 
         # First, infectee is recovered.
-        self.cell.person_queue = Queue()
+        self.cell.person_queue = pe._PersonQueue()
         self.test_sweep.bind_population(self.pop)
         self.test_sweep(time)
         self.assertTrue(self.cell.person_queue.empty())
 
         # Change the additional person to susceptible.
         self.new_person.update_status(pe.property.InfectionStatus.Susceptible)
-        self.cell.person_queue = Queue()
+        self.cell.person_queue = pe._PersonQueue()
         self.test_sweep.bind_population(self.pop)
         self.assertTrue(self.cell.person_queue.empty())
         self.test_sweep(time)
         self.assertEqual(self.cell.person_queue.qsize(), 1)
 
+    @mock.patch("pyEpiabm.property.PlaceInfection.place_foi")
+    @mock.patch("pyEpiabm.property.PlaceInfection.place_inf")
+    def test_aggregate_inactive_cells(self, mock_inf, mock_force):
+        mock_inf.return_value = 10.0
+        mock_force.return_value = 100.0
+        pop = self.pop_factory.make_pop(self.pop_params)
+        cell = pop.cells[0]
+        infector, infectee = cell.persons
+        cell.places[0].add_person(infector)
+        cell.places[0].add_person(infectee)
+        test_sweep = pe.sweep.PlaceSweep(aggregate_inactive_cells=True)
+        self.assertTrue(test_sweep.aggregate_inactive_cells)
+        test_sweep.bind_population(pop)
+        with mock.patch("pyEpiabm.core.Cell.is_active",
+                        return_value=False):
+            infector.update_status(pe.property.InfectionStatus.InfectMild)
+            test_sweep(1)
+        self.assertTrue(cell.person_queue.empty())
+        test_sweep(1)
+        self.assertEqual(cell.person_queue.qsize(), 1)
+
 
 if __name__ == '__main__':
     unittest.main()
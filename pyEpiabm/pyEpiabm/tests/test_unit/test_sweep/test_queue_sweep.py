@@ -58,6 +58,9 @@ class TestQueueSweep(TestPyEpiabm):
         # Check person 2 has updated time
         self.assertEqual(self.person2.time_of_status_change,
                          self.time)
+        # Check the exposure keeps the cell active until it is applied
+        self.assertEqual(self.cell.pending_exposures, 1)
+        self.assertTrue(self.cell.is_active())
 
     def test_vaccine_protection_full(self):
         """Tests that a vaccinated person will be moved to the vaccinated
@@ -152,6 +155,25 @@ class TestQueueSweep(TestPyEpiabm):
         # Check person 2 has updated time
         self.assertEqual(self.person2.time_of_status_change,
                          self.time)
+        # Efficacy date is drawn once and kept
+        self.assertIsNotNone(self.person2.date_vaccine_efficacy)
+
+    def test_vaccine_efficacy_date(self):
+        """Tests that a precomputed vaccine efficacy date is used.
+        """
+        self.person2.vaccinate(0, efficacy_delay=self.time)
+        self.cell.enqueue_person(self.person2)
+
+        test_sweep = pe.sweep.QueueSweep()
+        test_sweep.bind_population(self.test_population)
+        test_sweep(self.time)
+        self.assertEqual(self.person2.next_infection_status,
+                         pe.property.InfectionStatus.Exposed)
+
+        self.cell.enqueue_person(self.person2)
+        test_sweep(self.time + 1)
+        self.assertEqual(self.person2.next_infection_status,
+                         pe.property.InfectionStatus.Vaccinated)
 
 
 if __name__ == '__main__':
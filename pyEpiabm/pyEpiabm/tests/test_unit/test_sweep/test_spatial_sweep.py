@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from unittest import mock
 from queue import Queue
@@ -28,6 +30,7 @@ class TestSpatialSweep(TestMockedLogs):
         self.cell_inf.add_microcells(1)
         self.microcell_inf = self.cell_inf.microcells[0]
 
+        self.cell_susc.set_location((0.0, 2.0))
         self.cell_susc.add_microcells(1)
         self.microcell_susc = self.cell_susc.microcells[0]
 
@@ -86,75 +89,64 @@ class TestSpatialSweep(TestMockedLogs):
         self.no_infectees_rec = self.microcell_no_infectees_rec.persons[0]
         self.no_infectees_rec.update_status(InfectionStatus.Recovered)
 
-    @mock.patch("pyEpiabm.utility.DistanceFunctions.dist_euclid")
-    def test_nearby_cells(self, mock_dist):
+    def test_nearby_cells(self):
         Parameters.instance().infection_radius = 1000
         test_pop = self.pop
         test_sweep = SpatialSweep()
-        mock_dist.return_value = 2
         test_sweep.bind_population(test_pop)
         self.assertEqual(self.cell_inf.nearby_cell_distances, {1: 2})
-        mock_dist.assert_called_with(self.cell_inf.location,
-                                     self.cell_susc.location)
-        self.assertEqual(mock_dist.call_count,
-                         self.cell_inf.number_infectious() * 2)
+        self.assertEqual(self.cell_susc.nearby_cell_distances, {0: 2})
+        self.assertEqual(len(test_sweep.neighbour_cells), 2)
 
-    @mock.patch("pyEpiabm.utility.DistanceFunctions.dist_euclid")
-    def test_bind_population(self, mock_dist):
+    def test_bind_population(self):
         Parameters.instance().infection_radius = 0.0001
         # Assert a basic population
         test_pop = self.pop
         test_sweep = SpatialSweep()
-        mock_dist.return_value = 2.2
 
         test_sweep.bind_population(test_pop)
-        self.assertEqual(mock_dist.call_count,
-                         self.cell_inf.number_infectious() * 2)
-
         self.assertEqual(self.cell_inf.nearby_cell_distances, {})
 
         Parameters.instance().infection_radius = 1000
         test_pop = self.pop
         test_sweep = SpatialSweep()
-        mock_dist.return_value = 2.2
         self.assertEqual(test_sweep.bind_population(test_pop), None)
-        mock_dist.assert_called_with(self.cell_inf.location,
-                                     self.cell_susc.location)
+        self.assertEqual(self.cell_inf.nearby_cell_distances, {1: 2})
+
+    def test_bind_population_cache(self):
+        Parameters.instance().infection_radius = 1000
+        with tempfile.TemporaryDirectory() as cache_dir:
+            test_sweep = SpatialSweep(neighbour_cache_dir=cache_dir)
+            test_sweep.bind_population(self.pop)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            with mock.patch("pyEpiabm.utility.NeighbourCells"
+                            ".from_locations") as mock_build:
+                SpatialSweep(neighbour_cache_dir=cache_dir).bind_population(
+                    self.pop)
+                mock_build.assert_not_called()
+        self.assertEqual(self.cell_inf.nearby_cell_distances, {1: 2})
 
     @mock.patch("numpy.nan_to_num")
-    @mock.patch("pyEpiabm.utility.DistanceFunctions.dist_euclid")
-    def test_find_infectees_successful(self, mock_dist, mock_nan):
+    def test_find_infectees_successful(self, mock_nan):
         Parameters.instance().infection_radius = 1000
         test_pop = self.pop
         test_sweep = SpatialSweep()
-        mock_dist.return_value = 2.2
         test_sweep.bind_population(test_pop)
         test_list = test_sweep.\
             find_infectees(self.cell_inf, [self.cell_susc], 1)
         self.assertFalse(mock_nan.called)
         self.assertEqual(test_list, [self.infectee])
-        mock_dist.assert_called_with(self.cell_inf.location,
-                                     self.cell_susc.location)
-        self.assertEqual(mock_dist.call_count,
-                         self.cell_inf.number_infectious() * 2)
 
     @mock.patch('logging.exception')
-    @mock.patch("pyEpiabm.utility.DistanceFunctions.dist_euclid")
-    def test_find_infectees_fails(self, mock_dist, mock_log):
+    def test_find_infectees_fails(self, mock_log):
         Parameters.instance().infection_radius = 0.0001
         # Assert a basic population
         test_pop = self.pop
         test_sweep = SpatialSweep()
-        mock_dist.return_value = 2.2
         test_sweep.bind_population(test_pop)
-        mock_dist.assert_called_with(self.cell_inf.location,
-                                     self.cell_susc.location)
-        self.assertEqual(mock_dist.call_count,
-                         self.cell_inf.number_infectious() * 2)
 
         # Test Value Error is raised if all cells too far away
         Parameters.instance().infection_radius = 0.000001
-        mock_dist.return_value = 2
         test_list = test_sweep.\
             find_infectees(self.cell_inf, [self.cell_susc], 1)
         self.assertEqual(test_list, [])
@@ -162,22 +154,16 @@ class TestSpatialSweep(TestMockedLogs):
         self.assertTrue(mock_log.call_args[0][0].startswith("ValueError"))
 
     @mock.patch('logging.exception')
-    @mock.patch("pyEpiabm.utility.DistanceFunctions.dist_euclid")
-    def test_find_infectees_fails_empty_cells(self, mock_dist, mock_log):
+    def test_find_infectees_fails_empty_cells(self, mock_log):
         Parameters.instance().infection_radius = 1000
         test_pop = self.pop
         test_sweep = SpatialSweep()
-        mock_dist.return_value = 2.2
         test_sweep.bind_population(test_pop)
 
         self.cell_susc.persons = []  # Empty this target cell
         test_list = test_sweep.\
             find_infectees(self.cell_inf, [self.cell_susc], 1)
         self.assertEqual(test_list, [])
-        mock_dist.assert_called_with(self.cell_inf.location,
-                                     self.cell_susc.location)
-        self.assertEqual(mock_dist.call_count,
-                         self.cell_inf.number_infectious() * 2)
         mock_log.assert_called_once()
         self.assertTrue(mock_log.call_args[0][0].startswith("ValueError"))
 
@@ -191,14 +177,10 @@ class TestSpatialSweep(TestMockedLogs):
         test_pop = self.pop
         test_sweep = SpatialSweep()
 
-        mock_dist.return_value = 0
         mock_norm_distance.return_value = 0
         mock_random.return_value = 0.5  # Acts as a deterministic cutoff
         test_sweep.bind_population(test_pop)
-        mock_dist.assert_called_with(self.cell_inf.location,
-                                     self.cell_susc.location)
-        self.assertEqual(mock_dist.call_count,
-                         self.cell_inf.number_infectious() * 2)
+        self.assertEqual(self.cell_inf.nearby_cell_distances, {1: 2})
 
         # Test that the infectee is listed if distance is small
         mock_dist.return_value = 0
@@ -210,9 +192,15 @@ class TestSpatialSweep(TestMockedLogs):
         mock_dist.assert_called_with(self.cell_inf.location,
                                      self.cell_susc.location)
 
+        # The kernel ratio for this pair of cells is remembered
+        test_sweep.find_infectees_Covidsim(self.infector,
+                                           [self.cell_susc], 1)
+        mock_norm_distance.assert_called_once()
+
         # Test that the infectee is not listed if distance is large
         mock_dist.return_value = 100
         mock_norm_distance.return_value = 1  # Less than mock_dist
+        test_sweep.kernel_ratio.cache_clear()
         test_list = test_sweep.find_infectees_Covidsim(self.infector,
                                                        [self.cell_susc], 1)
         self.assertEqual(test_list, [])
@@ -75,6 +75,21 @@ class TestTravelSweep(TestPyEpiabm):
         self.travelsweep(time=16)
         self.assertEqual(len(self._population.cells[0].persons), 20)
 
+    def test_has_pending_events(self):
+        self.assertFalse(self.travelsweep.has_pending_events(1))
+        self.travelsweep.travel_params['constant_introduce_cases'] = [1]
+        self.assertTrue(self.travelsweep.has_pending_events(1))
+        self.travelsweep.travel_params['constant_introduce_cases'] = [0, 1, 0]
+        self.assertTrue(self.travelsweep.has_pending_events(1))
+        self.assertFalse(self.travelsweep.has_pending_events(2))
+
+        # Travellers still to leave the population
+        self.travelsweep.travel_params['constant_introduce_cases'] = [0]
+        person = self.microcell1.persons[1]
+        person.travel_end_time = 5
+        self.travelsweep.traveller_manager.add_departure(person)
+        self.assertTrue(self.travelsweep.has_pending_events(1))
+
     def test_create_introduced_individuals_with_age(self):
         """Create Person objects for the two infected individuals introduced
         with and without using age in the model. Their
@@ -132,6 +147,34 @@ class TestTravelSweep(TestPyEpiabm):
         self.assertEqual(len(self.microcell1.persons), 16)
         self.assertEqual(len(self.microcell1.households), 3)
 
+    def test_manager_tracks_travellers(self):
+        """The traveller manager follows the number of infectious people
+        and the size of microcells as travellers arrive and leave.
+
+        """
+        self.travelsweep.travel_params['ratio_introduce_cases'] = 0.5
+        self.travelsweep.travel_params['prob_existing_household'] = 0.0
+        self.travelsweep.travel_params['duration_travel_stay'] = [2, 2]
+        manager = self.travelsweep.traveller_manager
+        self.assertEqual(manager.number_infectious, 2)
+        self.travelsweep(time=1)
+        self.assertEqual(len(self.microcell1.persons), 16)
+        self.assertEqual(manager.number_infectious, 3)
+        self.assertEqual(manager._sizes, [16, 5])
+        self.travelsweep.travel_params['ratio_introduce_cases'] = 0.0
+        self.travelsweep(time=4)
+        self.assertEqual(len(self.microcell1.persons), 15)
+        self.assertEqual(manager.number_infectious, 2)
+        self.assertEqual(manager._sizes, [15, 5])
+
+        # Rebinding replaces the manager, which stops listening
+        self.travelsweep.bind_population(self._population)
+        self.initial_infected_person1.update_status(
+            InfectionStatus.Recovered)
+        self.assertEqual(manager.number_infectious, 2)
+        self.assertEqual(
+            self.travelsweep.traveller_manager.number_infectious, 1)
+
     def test_remove_leaving_individual(self):
         """Remove individuals introduced after their travel_end_time has
         passed and check if they are not in isolation and/or quarantine.
@@ -0,0 +1,87 @@
+import unittest
+from unittest import mock
+
+import pyEpiabm as pe
+from pyEpiabm.sweep import TravellerManager
+from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
+
+
+class TestTravellerManager(TestPyEpiabm):
+    """Test the 'TravellerManager' class.
+    """
+
+    def setUp(self) -> None:
+        super(TestTravellerManager, self).setUp()
+        self._population = pe.Population()
+        self._population.add_cells(2)
+        for cell, sizes in zip(self._population.cells, [[2, 5], [5, 1]]):
+            cell.add_microcells(2)
+            for microcell, size in zip(cell.microcells, sizes):
+                microcell.add_people(size)
+        self.manager = TravellerManager(self._population)
+
+    def test_density_ranking(self):
+        cells = self._population.cells
+        self.assertEqual(self.manager.density_ranking,
+                         [cells[0].microcells[1], cells[1].microcells[0],
+                          cells[0].microcells[0], cells[1].microcells[1]])
+
+    def test_update_size(self):
+        cells = self._population.cells
+        self.manager.update_size(cells[1].microcells[1], 4)
+        self.assertEqual(self.manager.density_ranking,
+                         [cells[0].microcells[1], cells[1].microcells[0],
+                          cells[1].microcells[1], cells[0].microcells[0]])
+        self.manager.update_size(cells[0].microcells[1], -1)
+        self.assertEqual(self.manager.density_ranking,
+                         [cells[1].microcells[0], cells[1].microcells[1],
+                          cells[0].microcells[1], cells[0].microcells[0]])
+
+    def test_number_infectious(self):
+        microcell = self._population.cells[1].microcells[0]
+        microcell.add_people(2, status=pe.property.InfectionStatus.InfectMild)
+        self.assertEqual(self.manager.number_infectious, 2)
+        microcell.persons[-1].update_status(
+            pe.property.InfectionStatus.Recovered)
+        self.assertEqual(self.manager.number_infectious, 1)
+        self.assertEqual(TravellerManager(
+            self._population).number_infectious, 1)
+        self.manager.detach()
+        microcell.persons[-2].update_status(
+            pe.property.InfectionStatus.Recovered)
+        self.assertEqual(self.manager.number_infectious, 1)
+
+    @mock.patch('numpy.random.randint')
+    def test_choose_microcells(self, mock_randint):
+        mock_randint.return_value = [1, 0, 1]
+        chosen = self.manager.choose_microcells(3)
+        mock_randint.assert_called_once_with(3, size=3)
+        self.assertEqual(chosen, [self.manager.density_ranking[1],
+                                  self.manager.density_ranking[0],
+                                  self.manager.density_ranking[1]])
+        self.assertEqual(self.manager.choose_microcells(0), [])
+
+        mock_randint.reset_mock()
+        self.manager.choose_microcells(10)
+        mock_randint.assert_called_once_with(4, size=10)
+
+    def test_leaving(self):
+        people = self._population.cells[0].persons[:3]
+        for person, end_time in zip(people, [5, 3, 4]):
+            person.travel_end_time = end_time
+            self.manager.add_departure(person)
+        self.assertEqual(len(self.manager), 3)
+
+        self.assertEqual(self.manager.leaving(3, lambda t, p: True), [])
+        self.assertEqual(self.manager.leaving(4.5, lambda t, p: True),
+                         [people[1], people[2]])
+        # People who cannot leave yet are checked again later
+        self.assertEqual(self.manager.leaving(6, lambda t, p: t > 7), [])
+        self.assertEqual(self.manager.leaving(8, lambda t, p: t > 7),
+                         [people[0]])
+        self.assertEqual(self.manager.leaving(9, lambda t, p: True), [])
+        self.assertEqual(len(self.manager), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
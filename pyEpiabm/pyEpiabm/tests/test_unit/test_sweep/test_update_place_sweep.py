@@ -1,7 +1,7 @@
 import unittest
 from unittest import mock
 
-from pyEpiabm.property import PlaceType
+from pyEpiabm.property import InfectionStatus, PlaceType
 from pyEpiabm.core import Parameters, Population
 from pyEpiabm.sweep import UpdatePlaceSweep
 from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
@@ -171,6 +171,22 @@ class TestUpdatePlaceSweep(TestPyEpiabm):
         test_sweep(1)
         mock_update.assert_called
 
+    @mock.patch("pyEpiabm.sweep.UpdatePlaceSweep.update_place_group")
+    def test_aggregate_inactive_cells(self, mock_update):
+        """Test that places of inactive cells are not updated in aggregate
+        mode.
+        """
+        self.place.place_type = PlaceType.OutdoorSpace
+        test_sweep = UpdatePlaceSweep(aggregate_inactive_cells=True)
+        self.assertTrue(test_sweep.aggregate_inactive_cells)
+        test_sweep.bind_population(self.pop)
+        test_sweep(self.time)
+        mock_update.assert_not_called()
+
+        self.person.update_status(InfectionStatus.InfectMild)
+        test_sweep(self.time)
+        mock_update.assert_called_with(self.place)
+
 
 if __name__ == "__main__":
     unittest.main()
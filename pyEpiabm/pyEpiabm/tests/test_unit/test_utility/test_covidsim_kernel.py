@@ -2,7 +2,7 @@ import unittest
 import numpy as np
 from parameterized import parameterized
 
-from pyEpiabm.utility import SpatialKernel
+from pyEpiabm.utility import SpatialKernel, TabulatedKernel
 
 numReps = 5
 
@@ -31,6 +31,31 @@ class TestSpatialKernel(unittest.TestCase):
         self.assertRaises(AssertionError, SpatialKernel.weighting, 10, -3, 2)
         self.assertRaises(AssertionError, SpatialKernel.weighting, 10, 2, -2)
 
+    def test_weighting_many(self):
+        distances = np.array([0, 1, 10, 25])
+        np.testing.assert_array_almost_equal(
+            SpatialKernel.weighting_many(distances, 10, 2),
+            [SpatialKernel.weighting(d, 10, 2) for d in distances])
+        self.assertRaises(AssertionError, SpatialKernel.weighting_many,
+                          distances, -3, 2)
+
+
+class TestTabulatedKernel(unittest.TestCase):
+    """Test the 'TabulatedKernel' class.
+    """
+    def test_call(self):
+        kernel = TabulatedKernel(10, 2, 1.5)
+        distances = np.array([0, 0.3, 2.7, 9.99, 10, 15])
+        np.testing.assert_allclose(
+            kernel(distances),
+            SpatialKernel.weighting_many(distances, 2, 1.5), rtol=1e-5)
+        # Distances beyond the table are exact
+        self.assertEqual(kernel(15), SpatialKernel.weighting(15, 2, 1.5))
+
+    def test_construct_errors(self):
+        self.assertRaises(ValueError, TabulatedKernel, 0)
+        self.assertRaises(ValueError, TabulatedKernel, 1, num_points=1)
+
 
 if __name__ == '__main__':
     unittest.main()
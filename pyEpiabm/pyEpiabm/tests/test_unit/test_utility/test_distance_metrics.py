@@ -44,6 +44,35 @@ class TestDistanceFunctions(TestMockedLogs):
         self.assertAlmostEqual(f((-3, 0), stride, scales, (3, 0)), 2)
         self.assertAlmostEqual(f((1, -3), stride, scales, (1, 4)), 4)
 
+    def test_dist_many(self):
+        f = DistanceFunctions.dist_many
+        np.testing.assert_array_almost_equal(
+            f((1, 4), [(-2, 0), (1, 4), (1, 0)]), [5, 0, 4])
+        self.assertEqual(len(f((0, 0), [])), 0)
+
+    def test_dist_pairwise(self):
+        f = DistanceFunctions.dist_pairwise
+        locations = [(0, 0), (3, 4), (0, 1)]
+        matrix = f(locations)
+        self.assertEqual(matrix.shape, (3, 3))
+        np.testing.assert_array_almost_equal(matrix, matrix.T)
+        self.assertAlmostEqual(matrix[0, 1], 5)
+        np.testing.assert_array_almost_equal(
+            f(locations, [(0, 0)]), [[0], [5], [1]])
+
+    def test_periodic_many(self):
+        f = DistanceFunctions.dist_periodic_many
+        stride = (5, 4)
+        scales = (10, 8)
+        locations = [(2, 0), (-3, 0), (1, -3), (4, 2)]
+        for origin in [(0, 0), (3, 0), (1, 4)]:
+            expected = [DistanceFunctions.dist_periodic(loc, stride, scales,
+                                                        origin)
+                        for loc in locations]
+            with self.subTest(origin=origin):
+                np.testing.assert_array_almost_equal(
+                    f(locations, stride, scales, origin), expected)
+
     def test_minimum_distance(self):
         f = DistanceFunctions.minimum_between_cells
         cell1 = pe.Cell()
@@ -54,6 +83,11 @@ class TestDistanceFunctions(TestMockedLogs):
         cell2.microcells[0].set_location((1.0, 0.5))
         cell1.microcells[0].set_location((0.0, 0.5))
         self.assertAlmostEqual(f(cell1, cell2), 1)
+        cell1.add_microcells(2)
+        cell1.microcells[1].set_location((0.8, 0.5))
+        cell1.microcells[2].set_location((5.0, 0.5))
+        self.assertAlmostEqual(f(cell1, cell2), 0.2)
+        self.assertEqual(f(cell1, pe.Cell()), np.inf)
 
 
 if __name__ == '__main__':
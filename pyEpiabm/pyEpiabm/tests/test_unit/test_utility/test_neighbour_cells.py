@@ -0,0 +1,72 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+
+from pyEpiabm.utility import DistanceFunctions, NeighbourCells
+
+
+class TestNeighbourCells(unittest.TestCase):
+    """Test the 'NeighbourCells' class.
+    """
+
+    def setUp(self) -> None:
+        self.locations = [(0, 0), (1, 0), (0, 3), (2.5, 2.5), (0.5, 0.5)]
+
+    def test_from_locations(self):
+        table = NeighbourCells.from_locations(self.locations, 2)
+        self.assertEqual(len(table), 5)
+        indices, distances = table.neighbours(0)
+        np.testing.assert_array_equal(indices, [1, 4])
+        np.testing.assert_array_almost_equal(distances, [1, np.sqrt(0.5)])
+        indices, _ = table.neighbours(2)
+        self.assertEqual(len(indices), 0)
+
+    def test_matches_pairwise(self):
+        np.random.seed(1)
+        locations = np.random.uniform(0, 10, size=(60, 2))
+        radius = 1.5
+        table = NeighbourCells.from_locations(locations, radius)
+        for i, loc in enumerate(locations):
+            expected = [j for j, loc2 in enumerate(locations) if j != i and
+                        DistanceFunctions.dist(loc, loc2) < radius]
+            with self.subTest(i=i):
+                indices, distances = table.neighbours(i)
+                np.testing.assert_array_equal(indices, expected)
+                np.testing.assert_array_almost_equal(
+                    distances, [DistanceFunctions.dist(loc, locations[j])
+                                for j in expected])
+
+    def test_radius_edge_cases(self):
+        table = NeighbourCells.from_locations(self.locations, 0)
+        self.assertEqual(len(table.indices), 0)
+        table = NeighbourCells.from_locations(self.locations, np.inf)
+        self.assertEqual(len(table.indices), 20)
+        table = NeighbourCells.from_locations([], 1)
+        self.assertEqual(len(table), 0)
+
+    def test_cache_key(self):
+        key = NeighbourCells.cache_key(self.locations, 2)
+        self.assertEqual(key, NeighbourCells.cache_key(self.locations, 2.0))
+        self.assertNotEqual(key, NeighbourCells.cache_key(self.locations, 3))
+        self.assertNotEqual(key, NeighbourCells.cache_key(
+            self.locations[:-1], 2))
+
+    def test_load_or_build(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            table = NeighbourCells.load_or_build(self.locations, 2,
+                                                 cache_dir)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            with mock.patch.object(NeighbourCells,
+                                   "from_locations") as mock_build:
+                cached = NeighbourCells.load_or_build(self.locations, 2,
+                                                      cache_dir)
+                mock_build.assert_not_called()
+        np.testing.assert_array_equal(cached.indptr, table.indptr)
+        np.testing.assert_array_equal(cached.indices, table.indices)
+        np.testing.assert_array_equal(cached.distances, table.distances)
+
+
+if __name__ == '__main__':
+    unittest.main()
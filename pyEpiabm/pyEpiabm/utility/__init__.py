@@ -8,7 +8,8 @@ algorithms that are called throughout pyEpiabm.
 """
 
 from .distance_metrics import DistanceFunctions
-from .covidsim_kernel import SpatialKernel
+from .covidsim_kernel import SpatialKernel, TabulatedKernel
 from .random_methods import RandomMethods
 from .inverse_cdf import InverseCdf
+from .neighbour_cells import NeighbourCells
 from .exception_logger import log_exceptions
@@ -2,6 +2,8 @@
 # Class of Covidsim-style gravity kernels
 #
 
+import numpy as np
+
 
 class SpatialKernel:
     """Class to create the gravity kernel used throughout
@@ -37,3 +39,85 @@ class SpatialKernel:
         assert (scale > 0), "Spatial kernel scale must be positive."
         assert (shape > 0), "Spatial kernel shape must be positive."
         return 1 / (1 + distance / scale) ** shape
+
+    @staticmethod
+    def weighting_many(distances, scale: float = 1,
+                       shape: float = 1.0) -> np.ndarray:
+        """Array version of :meth:`weighting`, returning the weighting for
+        each of an array of distances.
+
+        Parameters
+        ----------
+        distances : list or np.ndarray
+            Distances input as the main argument
+        scale : float
+            Parameter to scale the kernel function
+        shape : float
+            Parameter to change the shape of the kernel function
+
+        Returns
+        -------
+        np.ndarray
+            Weight of each distance
+
+        """
+        assert (scale > 0), "Spatial kernel scale must be positive."
+        assert (shape > 0), "Spatial kernel shape must be positive."
+        return 1 / (1 + np.asarray(distances, dtype=float) / scale) ** shape
+
+
+class TabulatedKernel:
+    """Class to evaluate the :class:`SpatialKernel` weighting by linear
+    interpolation from a table of values at evenly spaced distances, which
+    avoids a power evaluation for each distance. Distances beyond the
+    table are evaluated exactly.
+
+    """
+    def __init__(self, max_distance: float, scale: float = 1,
+                 shape: float = 1.0, num_points: int = 4097):
+        """Constructor Method.
+
+        Parameters
+        ----------
+        max_distance : float
+            Largest distance in the table
+        scale : float
+            Parameter to scale the kernel function
+        shape : float
+            Parameter to change the shape of the kernel function
+        num_points : int
+            Number of distances in the table
+
+        """
+        if max_distance <= 0:
+            raise ValueError("Maximum distance must be positive")
+        if num_points < 2:
+            raise ValueError("Table needs at least two points")
+        self.scale = scale
+        self.shape = shape
+        self.max_distance = max_distance
+        self.distances = np.linspace(0, max_distance, num_points)
+        self.weights = SpatialKernel.weighting_many(self.distances, scale,
+                                                    shape)
+
+    def __call__(self, distances) -> np.ndarray:
+        """Get the interpolated weighting of each distance.
+
+        Parameters
+        ----------
+        distances : float or np.ndarray
+            Distances to evaluate the kernel at
+
+        Returns
+        -------
+        np.ndarray
+            Weight of each distance
+
+        """
+        distances = np.asarray(distances, dtype=float)
+        weights = np.interp(distances, self.distances, self.weights)
+        beyond = distances > self.max_distance
+        if np.any(beyond):
+            weights = np.where(beyond, SpatialKernel.weighting_many(
+                distances, self.scale, self.shape), weights)
+        return weights
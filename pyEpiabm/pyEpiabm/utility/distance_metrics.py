@@ -105,6 +105,94 @@ class DistanceFunctions:
                 diff[index] = scales[index] - diff[index]
         return np.linalg.norm(diff)
 
+    @staticmethod
+    def dist_many(origin: typing.Tuple[float, float],
+                  locations) -> np.ndarray:
+        """Calculate the Euclidean distance from one location to each of an
+        array of locations.
+
+        Parameters
+        ----------
+        origin : Tuple[float, float]
+            (x,y) coordinates of the origin
+        locations : list or np.ndarray
+            (x,y) coordinates of each location, of shape (n, 2)
+
+        Returns
+        -------
+        np.ndarray
+            Distance from the origin to each location
+
+        """
+        locs = np.asarray(locations, dtype=float).reshape(-1, 2)
+        diff = locs - np.asarray(origin, dtype=float)
+        return np.sqrt(np.sum(diff ** 2, axis=1))
+
+    @staticmethod
+    def dist_pairwise(locations1, locations2=None) -> np.ndarray:
+        """Calculate the Euclidean distance between each pair of locations
+        from two arrays of locations.
+
+        Parameters
+        ----------
+        locations1 : list or np.ndarray
+            (x,y) coordinates of each location, of shape (n, 2)
+        locations2 : list or np.ndarray
+            (x,y) coordinates of each location, of shape (m, 2). Defaults
+            to locations1
+
+        Returns
+        -------
+        np.ndarray
+            Matrix of shape (n, m) of the distances between locations
+
+        """
+        locs1 = np.asarray(locations1, dtype=float).reshape(-1, 2)
+        locs2 = locs1 if locations2 is None else \
+            np.asarray(locations2, dtype=float).reshape(-1, 2)
+        diff = locs1[:, np.newaxis, :] - locs2[np.newaxis, :, :]
+        return np.sqrt(np.sum(diff ** 2, axis=2))
+
+    @staticmethod
+    def dist_periodic_many(locations, stride: int,
+                           scales: typing.Tuple[float, float],
+                           origin: typing.Tuple[int, int] = (0, 0)
+                           ) -> np.ndarray:
+        """Array version of :meth:`dist_periodic`, calculating the periodic
+        distance from one grid location to each of an array of grid
+        locations.
+
+        Parameters
+        ----------
+        locations : list or np.ndarray
+            Index locations, of shape (n, 2)
+        stride : int
+            Number of indices in a row
+        scales : Tuple[float, float]
+            Conversion to global coordinates
+        origin : Tuple[int, int]
+            Index location of the origin
+
+        Returns
+        -------
+        np.ndarray
+            Periodic distance from the origin to each location
+
+        """
+        scales = np.asarray(scales, dtype=float)
+        stride = np.asarray(stride)
+        step = scales / stride
+        locs = np.asarray(locations, dtype=float).reshape(-1, 2)
+        global1 = (scales * locs) / stride
+        global2 = (scales * np.asarray(origin, dtype=float).reshape(1, 2)
+                   ) / stride
+        for loc in [global1, global2]:
+            negative = loc[:, 1] < 0
+            loc[negative, 1] += scales[1] + step[1]
+        diff = np.abs(global1 - global2)
+        diff = np.where(diff > 0.5 * scales, scales - diff, diff)
+        return np.linalg.norm(diff, axis=1)
+
     def minimum_between_cells(cell1, cell2):
         """Function to find the minimum distance between microcells
         in two cells. Covidsim uses this to weight the spatial kernel.
@@ -121,12 +209,12 @@ class DistanceFunctions:
         -------
         float
             Minimum distance between the two cells
+
         """
-        dist = np.inf
-        for microcell1 in cell1.microcells:
-            for microcell2 in cell2.microcells:
-                microcell_dist = DistanceFunctions.dist(microcell1.location,
-                                                        microcell2.location)
-                if microcell_dist < dist:
-                    dist = microcell_dist
-        return dist
+        locs1 = np.array([microcell.location for microcell
+                          in cell1.microcells], dtype=float).reshape(-1, 2)
+        locs2 = np.array([microcell.location for microcell
+                          in cell2.microcells], dtype=float).reshape(-1, 2)
+        if len(locs1) == 0 or len(locs2) == 0:
+            return np.inf
+        return float(np.min(DistanceFunctions.dist_pairwise(locs1, locs2)))
@@ -0,0 +1,177 @@
+#
+# Sparse table of the cells within a radius of each cell
+#
+
+import hashlib
+import os
+import typing
+import numpy as np
+
+from .distance_metrics import DistanceFunctions
+
+
+class NeighbourCells:
+    """Class to store the cells within a given radius of each cell, in
+    compressed sparse row (CSR) form. The neighbours of cell i are
+    `indices[indptr[i]:indptr[i + 1]]`, at the distances stored in the same
+    slice of `distances`, sorted by cell index.
+
+    The table is built by binning cells into a grid of squares with side
+    equal to the radius, so only cells in adjacent squares are compared.
+    Tables can be saved to and loaded from a cache directory, keyed by a
+    hash of the cell locations and the radius.
+
+    """
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray,
+                 distances: np.ndarray):
+        """Constructor Method.
+
+        Parameters
+        ----------
+        indptr : np.ndarray
+            Start of the neighbours of each cell, with one more entry than
+            the number of cells
+        indices : np.ndarray
+            Indices of the neighbouring cells
+        distances : np.ndarray
+            Distance to each neighbouring cell
+
+        """
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.distances = np.asarray(distances, dtype=float)
+
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    def neighbours(self, i: int) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """Get the neighbours of a cell.
+
+        Parameters
+        ----------
+        i : int
+            Index of the cell
+
+        Returns
+        -------
+        np.ndarray
+            Indices of the neighbouring cells
+        np.ndarray
+            Distance to each neighbouring cell
+
+        """
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return self.indices[start:end], self.distances[start:end]
+
+    @classmethod
+    def from_locations(cls, locations, radius: float):
+        """Build the table of cells closer than the radius to each other,
+        using the Euclidean distance between their locations.
+
+        Parameters
+        ----------
+        locations : list or np.ndarray
+            (x,y) coordinates of each cell
+        radius : float
+            Cells are neighbours if their distance is less than this
+
+        Returns
+        -------
+        NeighbourCells
+            Table of neighbouring cells
+
+        """
+        locs = np.asarray(locations, dtype=float).reshape(-1, 2)
+        n = len(locs)
+        if n == 0 or radius <= 0:
+            return cls(np.zeros(n + 1), np.zeros(0), np.zeros(0))
+
+        if np.isfinite(radius):
+            bins = np.floor((locs - locs.min(axis=0)) / radius)
+            bins = bins.astype(np.int64)
+        else:
+            bins = np.zeros((n, 2), dtype=np.int64)
+        members = {}
+        for i, key in enumerate(map(tuple, bins.tolist())):
+            members.setdefault(key, []).append(i)
+        members = {key: np.array(value) for key, value in members.items()}
+
+        rows, cols, dists = [], [], []
+        for (bx, by), row in members.items():
+            candidates = [members[(bx + dx, by + dy)]
+                          for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+                          if (bx + dx, by + dy) in members]
+            col = np.concatenate(candidates)
+            dist = DistanceFunctions.dist_pairwise(locs[row], locs[col])
+            mask = (dist < radius) & (row[:, np.newaxis] != col)
+            r, c = np.nonzero(mask)
+            rows.append(row[r])
+            cols.append(col[c])
+            dists.append(dist[r, c])
+
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+        dists = np.concatenate(dists)
+        order = np.lexsort((cols, rows))
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum(np.bincount(rows, minlength=n))
+        return cls(indptr, cols[order], dists[order])
+
+    @staticmethod
+    def cache_key(locations, radius: float) -> str:
+        """Get the key identifying a table in the cache.
+
+        Parameters
+        ----------
+        locations : list or np.ndarray
+            (x,y) coordinates of each cell
+        radius : float
+            Neighbour radius
+
+        Returns
+        -------
+        str
+            Hash of the cell locations and radius
+
+        """
+        locs = np.ascontiguousarray(locations, dtype=float).reshape(-1, 2)
+        digest = hashlib.sha256(locs.tobytes())
+        digest.update(repr(float(radius)).encode())
+        return digest.hexdigest()
+
+    @classmethod
+    def load_or_build(cls, locations, radius: float,
+                      cache_dir: typing.Optional[str] = None):
+        """Load the table for these locations and radius from the cache
+        directory, or build it (and save it to the cache directory if one is
+        given).
+
+        Parameters
+        ----------
+        locations : list or np.ndarray
+            (x,y) coordinates of each cell
+        radius : float
+            Cells are neighbours if their distance is less than this
+        cache_dir : str
+            Directory of cached tables, or None to not use a cache
+
+        Returns
+        -------
+        NeighbourCells
+            Table of neighbouring cells
+
+        """
+        if cache_dir is None:
+            return cls.from_locations(locations, radius)
+        path = os.path.join(
+            cache_dir, f"neighbours_{cls.cache_key(locations, radius)}.npz")
+        if os.path.exists(path):
+            with np.load(path) as data:
+                return cls(data["indptr"], data["indices"],
+                           data["distances"])
+        table = cls.from_locations(locations, radius)
+        os.makedirs(cache_dir, exist_ok=True)
+        np.savez(path, indptr=table.indptr, indices=table.indices,
+                 distances=table.distances)
+        return table
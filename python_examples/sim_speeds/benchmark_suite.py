@@ -0,0 +1,428 @@
+#
+# Benchmark suite for pyEpiabm and cEpiabm
+#
+# Times population construction, each sweep, full basic, spatial and
+# intervention simulations and py2c conversion over a range of population
+# sizes and cell numbers. Each run is appended as one JSON line to a history
+# file, with the scaling exponent of each benchmark (the gradient of log time
+# against log population size). The run is compared with the latest run in
+# the history, and exits with status 1 if any benchmark got slower by more
+# than the given threshold.
+#
+# Run from this folder with e.g.
+#   python benchmark_suite.py --sizes 1000 2000 4000 8000 --cells 1 16
+# cEpiabm benchmarks are run if the compiled epiabm module can be imported,
+# for example after adding its build directory with --cpp-build-dir.
+#
+
+import argparse
+import datetime
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..",
+                             "pyEpiabm"))
+import pyEpiabm as pe  # noqa: E402
+
+FOLDER = os.path.dirname(os.path.abspath(__file__))
+BASIC_PARAMETERS = os.path.join(FOLDER, "simple_parameters.json")
+SPATIAL_PARAMETERS = os.path.join(FOLDER, "spatial_parameters.json")
+INTERVENTION_PARAMETERS = os.path.join(
+    FOLDER, "..", "intervention_example", "case_isolation_parameters.json")
+CPP_PARAMETERS = os.path.join(FOLDER, "..", "gibraltar_example_cpp",
+                              "gibraltar_parameters_cpp.json")
+
+SIMULATION_DAYS = 30
+SEED = 42
+
+
+def _timed(function, *args, **kwargs):
+    """Call a function and return its result and wall time in seconds."""
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def _make_py_population(size, cells, spatial=False):
+    """Build a pyEpiabm toy population with the given size and cells."""
+    pop_params = {"population_size": size, "cell_number": cells,
+                  "microcell_number": 2, "household_number": 5,
+                  "place_number": 2}
+    population = pe.routine.ToyPopulationFactory.make_pop(pop_params)
+    if population is None:
+        raise RuntimeError("Population construction failed, see the log")
+    if spatial:
+        pe.routine.ToyPopulationFactory.assign_cell_locations(
+            population, method='grid')
+    return population
+
+
+def _py_simulation(population, sweeps, output_dir, size, places=True):
+    """Configure a pyEpiabm simulation which records each sweep."""
+    sim_params = {"simulation_start_time": 0,
+                  "simulation_end_time": SIMULATION_DAYS,
+                  "initial_infected_number": max(1, size // 1000),
+                  "simulation_seed": SEED}
+    file_params = {"output_file": "output.csv", "output_dir": output_dir,
+                   "spatial_output": False, "age_stratified": False}
+    sim = pe.routine.Simulation()
+    initial_sweeps = [pe.sweep.InitialInfectedSweep()]
+    if places:
+        initial_sweeps.append(pe.sweep.InitialisePlaceSweep())
+    sim.configure(population, initial_sweeps, sweeps, sim_params,
+                  file_params)
+    sim.set_instrumentation(pe.routine.SimulationInstrumentation())
+    return sim
+
+
+def _run_py_simulation(sim):
+    """Time a pyEpiabm simulation, checking that it ran to the end."""
+    _, seconds = _timed(sim.run_sweeps)
+    del sim.writer
+    records = sim.instrumentation.records
+    # Errors in the simulation are logged rather than raised
+    if not records or records[-1]["time"] < SIMULATION_DAYS - 1:
+        raise RuntimeError("Simulation stopped early, see the log")
+    return seconds
+
+
+def _sweep_timings(prefix, sim):
+    """Total time spent in each sweep of an instrumented simulation."""
+    return {f"{prefix}/sweep/{name}": seconds for name, seconds
+            in sim.instrumentation.total_seconds().items()}
+
+
+def bench_py_population(size, cells, output_dir):
+    """Time the construction of a pyEpiabm population."""
+    pe.Parameters.set_file(SPATIAL_PARAMETERS)
+    pe.routine.Simulation.set_random_seed(SEED)
+    _, seconds = _timed(_make_py_population, size, cells, spatial=True)
+    return {"py/population": seconds}
+
+
+def bench_py_basic(size, cells, output_dir):
+    """Time a pyEpiabm simulation with household transmission only."""
+    pe.Parameters.set_file(BASIC_PARAMETERS)
+    pe.routine.Simulation.set_random_seed(SEED)
+    sim = _py_simulation(
+        _make_py_population(size, cells),
+        [pe.sweep.HouseholdSweep(), pe.sweep.QueueSweep(),
+         pe.sweep.HostProgressionSweep()], output_dir, size, places=False)
+    seconds = _run_py_simulation(sim)
+    return {"py/basic_run": seconds}
+
+
+def bench_py_spatial(size, cells, output_dir):
+    """Time a pyEpiabm simulation with spatial and place transmission,
+    and the time spent in each of its sweeps."""
+    pe.Parameters.set_file(SPATIAL_PARAMETERS)
+    pe.routine.Simulation.set_random_seed(SEED)
+    population = _make_py_population(size, cells, spatial=True)
+    pe.routine.ToyPopulationFactory.add_places(population, 1)
+    sim = _py_simulation(
+        population,
+        [pe.sweep.UpdatePlaceSweep(), pe.sweep.HouseholdSweep(),
+         pe.sweep.PlaceSweep(), pe.sweep.SpatialSweep(),
+         pe.sweep.QueueSweep(), pe.sweep.HostProgressionSweep()],
+        output_dir, size)
+    seconds = _run_py_simulation(sim)
+    return {"py/spatial_run": seconds, **_sweep_timings("py", sim)}
+
+
+def bench_py_intervention(size, cells, output_dir):
+    """Time a pyEpiabm spatial simulation with case isolation."""
+    pe.Parameters.set_file(INTERVENTION_PARAMETERS)
+    pe.routine.Simulation.set_random_seed(SEED)
+    population = _make_py_population(size, cells, spatial=True)
+    pe.routine.ToyPopulationFactory.add_places(population, 1)
+    sim = _py_simulation(
+        population,
+        [pe.sweep.InterventionSweep(), pe.sweep.UpdatePlaceSweep(),
+         pe.sweep.HouseholdSweep(), pe.sweep.PlaceSweep(),
+         pe.sweep.SpatialSweep(), pe.sweep.QueueSweep(),
+         pe.sweep.HostProgressionSweep()], output_dir, size)
+    seconds = _run_py_simulation(sim)
+    return {"py/intervention_run": seconds,
+            "py/sweep/InterventionSweep":
+                sim.instrumentation.total_seconds()["InterventionSweep"]}
+
+
+def _c_status_map(ce):
+    """Map pyEpiabm infection statuses to their cEpiabm equivalents."""
+    return {status: getattr(ce.InfectionStatus, status.name)
+            for status in pe.property.InfectionStatus
+            if hasattr(ce.InfectionStatus, status.name)}
+
+
+def bench_py2c(size, cells, output_dir):
+    """Time the conversion of a pyEpiabm population to cEpiabm, one object
+    at a time and in bulk."""
+    import epiabm as ce
+    from pyEpiabm.py2c import py2c_population
+    pe.Parameters.set_file(SPATIAL_PARAMETERS)
+    pe.routine.Simulation.set_random_seed(SEED)
+    population = _make_py_population(size, cells, spatial=True)
+    pe.routine.ToyPopulationFactory.add_places(population, 1)
+    status_map = _c_status_map(ce)
+    _, seconds = _timed(py2c_population, population,
+                        ce.PopulationFactory(), status_map)
+    _, bulk_seconds = _timed(py2c_population, population,
+                             ce.PopulationFactory(), status_map, bulk=True)
+    return {"py2c/objects": seconds, "py2c/bulk": bulk_seconds}
+
+
+def bench_c_population(size, cells, output_dir):
+    """Time the construction of a cEpiabm population."""
+    import epiabm as ce
+    _, seconds = _timed(ce.ToyPopulationFactory().make_population,
+                        size, cells, 2, 5, 2, SEED)
+    return {"c/population": seconds}
+
+
+def _c_run(ce, size, cells, output_dir, sweep_types, threaded=False):
+    """Run a cEpiabm simulation, returning its wall time and the time
+    spent in each sweep."""
+    with open(CPP_PARAMETERS, "r") as f:
+        config = json.load(f)
+    config["random_seed"] = SEED
+    config_file = os.path.join(output_dir, "parameters.json")
+    with open(config_file, "w") as f:
+        json.dump(config, f)
+    cfg = ce.JsonFactory().load_config(config_file)
+
+    population = ce.ToyPopulationFactory().make_population(
+        size, cells, 2, 5, 2, SEED)
+    population.initialize()
+    seed_sweep = ce.RandomSeedSweep(cfg, 1000)
+    seed_sweep.bind_population(population)
+    seed_sweep(0)
+
+    simulation = (ce.ThreadedSimulation(population, None) if threaded
+                  else ce.BasicSimulation(population))
+    for sweep_type in sweep_types:
+        if threaded:
+            # Transmission sweeps run in parallel, then the queue is
+            # processed, then people progress
+            group = {"NewInfectionSweep": 1,
+                     "HostProgressionSweep": 2}.get(sweep_type, 0)
+            simulation.add_sweep(getattr(ce, sweep_type)(cfg), group)
+        else:
+            simulation.add_sweep(getattr(ce, sweep_type)(cfg))
+    instrumentation = ce.SimulationInstrumentation()
+    simulation.set_instrumentation(instrumentation)
+    _, seconds = _timed(simulation.simulate, SIMULATION_DAYS)
+
+    timings = {}
+    if not threaded:
+        for record in instrumentation.records():
+            for sweep in record.sweeps:
+                name = f"c/sweep/{sweep_types[sweep.sweep]}"
+                timings[name] = timings.get(name, 0) + sweep.seconds
+    return seconds, timings
+
+
+def bench_c_basic(size, cells, output_dir):
+    """Time a cEpiabm simulation with household transmission only."""
+    import epiabm as ce
+    seconds, _ = _c_run(ce, size, cells, output_dir,
+                        ["HouseholdSweep", "NewInfectionSweep",
+                         "HostProgressionSweep"])
+    return {"c/basic_run": seconds}
+
+
+def bench_c_spatial(size, cells, output_dir):
+    """Time cEpiabm simulations with spatial and place transmission,
+    single and multi-threaded, and the time spent in each sweep."""
+    import epiabm as ce
+    sweep_types = ["HouseholdSweep", "PlaceSweep", "SpatialSweep",
+                   "NewInfectionSweep", "HostProgressionSweep"]
+    seconds, timings = _c_run(ce, size, cells, output_dir, sweep_types)
+    threaded_seconds, _ = _c_run(ce, size, cells, output_dir, sweep_types,
+                                 threaded=True)
+    return {"c/spatial_run": seconds, "c/threaded_spatial_run":
+            threaded_seconds, **timings}
+
+
+PY_BENCHMARKS = [bench_py_population, bench_py_basic, bench_py_spatial,
+                 bench_py_intervention]
+C_BENCHMARKS = [bench_py2c, bench_c_population, bench_c_basic,
+                bench_c_spatial]
+
+
+def run_benchmarks(benchmarks, sizes, cells_list, repeats):
+    """Run each benchmark at each population size and cell number, keeping
+    the fastest of the repeats.
+
+    Returns
+    -------
+    list
+        List of result dicts with the benchmark name, population size,
+        cell number and seconds
+
+    """
+    results = []
+    for benchmark in benchmarks:
+        for cells in cells_list:
+            for size in sizes:
+                best = {}
+                for _ in range(repeats):
+                    with tempfile.TemporaryDirectory() as output_dir:
+                        timings = benchmark(size, cells, output_dir)
+                    for name, seconds in timings.items():
+                        best[name] = min(seconds, best.get(name, np.inf))
+                for name, seconds in best.items():
+                    results.append({"name": name, "population_size": size,
+                                    "cell_number": cells,
+                                    "seconds": seconds})
+                    print(f"{name:40s} size={size:<8d} cells={cells:<5d} "
+                          f"{seconds:10.4f}s")
+    return results
+
+
+def scaling_exponents(results):
+    """Fit the exponent k of time ~ size^k for each benchmark and cell
+    number with at least two population sizes.
+
+    Returns
+    -------
+    dict
+        Exponents keyed by "<name>@<cell_number>"
+
+    """
+    grouped = {}
+    for result in results:
+        key = f"{result['name']}@{result['cell_number']}"
+        grouped.setdefault(key, []).append(
+            (result["population_size"], max(result["seconds"], 1e-9)))
+    exponents = {}
+    for key, points in grouped.items():
+        if len({size for size, _ in points}) < 2:
+            continue
+        sizes, seconds = np.array(points, dtype=float).T
+        exponents[key] = float(np.polyfit(np.log(sizes), np.log(seconds),
+                                          1)[0])
+    return exponents
+
+
+def regressions(results, previous, threshold):
+    """Find benchmarks which are slower than in a previous run.
+
+    Parameters
+    ----------
+    results : list
+        Results of this run
+    previous : list
+        Results of the run to compare with
+    threshold : float
+        Allowed fractional slowdown before a benchmark counts as slower
+
+    Returns
+    -------
+    list
+        List of (result, previous seconds) pairs for each slower benchmark
+
+    """
+    def key(result):
+        return (result["name"], result["population_size"],
+                result["cell_number"])
+    previous_seconds = {key(result): result["seconds"]
+                        for result in previous}
+    slower = []
+    for result in results:
+        old = previous_seconds.get(key(result))
+        if old is not None and result["seconds"] > old * (1 + threshold):
+            slower.append((result, old))
+    return slower
+
+
+def _git_commit():
+    """Current git commit of the repository, if available."""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], cwd=FOLDER,
+            stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(history_file):
+    """Read the runs stored in a history file, oldest first."""
+    if not os.path.exists(history_file):
+        return []
+    with open(history_file, "r") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=(
+        "Benchmark pyEpiabm and cEpiabm, store the results in a history "
+        "file and report benchmarks which got slower."))
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[1000, 2000, 4000, 8000])
+    parser.add_argument("--cells", type=int, nargs="+", default=[1, 16])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--only", nargs="+", default=None,
+                        help="Only run benchmark functions with these names")
+    parser.add_argument("--history", default=os.path.join(
+        FOLDER, "benchmark_history.jsonl"))
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Fractional slowdown reported as a regression")
+    parser.add_argument("--no-save", action="store_true",
+                        help="Do not append this run to the history")
+    parser.add_argument("--cpp-build-dir", default=None,
+                        help="Directory containing the epiabm module")
+    args = parser.parse_args()
+
+    # Sparse spatial populations log errors for cells without neighbours
+    logging.basicConfig(level=logging.CRITICAL)
+    if args.cpp_build_dir is not None:
+        sys.path.append(os.path.abspath(args.cpp_build_dir))
+
+    benchmarks = list(PY_BENCHMARKS)
+    try:
+        import epiabm  # noqa: F401
+        benchmarks += C_BENCHMARKS
+    except ImportError:
+        print("epiabm module not found: skipping cEpiabm benchmarks")
+    if args.only is not None:
+        benchmarks = [b for b in benchmarks if b.__name__ in args.only]
+
+    results = run_benchmarks(benchmarks, args.sizes, args.cells,
+                             args.repeats)
+    exponents = scaling_exponents(results)
+    print("\nScaling exponents (time ~ population_size^k):")
+    for key, exponent in sorted(exponents.items()):
+        print(f"  {key:44s} k = {exponent:.2f}")
+
+    history = load_history(args.history)
+    slower = regressions(results, history[-1]["results"], args.threshold) \
+        if history else []
+
+    if not args.no_save:
+        run = {"timestamp": datetime.datetime.now().isoformat(),
+               "commit": _git_commit(), "python": platform.python_version(),
+               "platform": platform.platform(), "repeats": args.repeats,
+               "results": results, "scaling_exponents": exponents}
+        with open(args.history, "a") as f:
+            f.write(json.dumps(run) + "\n")
+
+    if slower:
+        print(f"\n{len(slower)} benchmark(s) slower than the previous run by "
+              f"more than {args.threshold:.0%}:")
+        for result, old in slower:
+            print(f"  {result['name']} size={result['population_size']} "
+                  f"cells={result['cell_number']}: {old:.4f}s -> "
+                  f"{result['seconds']:.4f}s")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()